@@ -0,0 +1,2 @@
+# WARNING: template code, may need edits
+"""Performance benchmarks for Paragraph Checker."""
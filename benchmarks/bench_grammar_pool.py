@@ -0,0 +1,91 @@
+# WARNING: template code, may need edits
+"""Benchmark chunked grammar checking on a pool of LanguageTool clients.
+
+Checks one long document with a single LanguageTool call and with pools of
+several clients, and compares the issues. With --paragraph-cache, checks
+the document paragraph by paragraph instead, first with an empty cache and
+then again with the filled one. Requires Java for the local LanguageTool
+server.
+
+Usage:
+    python -m benchmarks.bench_grammar_pool [--paragraphs 200] [--workers 1 2 4]
+                                            [--mode shared] [--paragraph-cache]
+"""
+
+import argparse
+import time
+from src.analyzers.grammar_analyzer import GrammarAnalyzer
+from src.analyzers.language_tool_pool import POOL_MODES
+from src.cache import ParagraphCache
+
+PARAGRAPHS = [
+    "Their going to the libary tomorrow, and he dont know when they will "
+    "arrive. The results was checked twice by the team.",
+    "Each of the reviewers have read the draft. A apple a day keeps the "
+    "doctor away, or so they says.",
+    "She walked to the store, she bought some milk. Its a nice day today "
+    "and everyone are happy about it.",
+]
+
+
+def issue_keys(issues):
+    """Comparable form of a list of issues."""
+    return [(i.position, i.length, i.message, i.suggested_fix) for i in issues]
+
+
+def run_paragraph_cache(text, workers):
+    """Check text twice with a paragraph cache and report both runs."""
+    analyzer = GrammarAnalyzer(workers=workers, paragraph_cache=ParagraphCache())
+    analyzer.analyze(PARAGRAPHS[0])  # start the server
+
+    print(f"{'run':<9}{'check s':>9}{'issues':>8}{'hit rate':>10}{'saved s':>9}")
+    for run_name in ("cold", "warm"):
+        start = time.perf_counter()
+        issues = analyzer.analyze(text)
+        check_time = time.perf_counter() - start
+        stats = analyzer.paragraph_cache.stats()
+        print(f"{run_name:<9}{check_time:>9.2f}{len(issues):>8}{stats['hit_rate']:>10.1%}"
+              f"{stats['time_saved_seconds']:>9.2f}")
+    analyzer.pool.close()
+
+
+def run(paragraphs=200, workers=(1, 2, 4), mode="shared", paragraph_cache=False):
+    text = "\n\n".join(PARAGRAPHS[i % len(PARAGRAPHS)] for i in range(paragraphs))
+    print(f"{len(text):,} characters, {paragraphs} paragraphs, pool mode {mode}")
+    if paragraph_cache:
+        run_paragraph_cache(text, workers[0])
+        return
+
+    print(f"{'workers':<9}{'start s':>9}{'check s':>9}{'issues':>8}{'same':>6}")
+
+    reference = None
+    for size in workers:
+        analyzer = GrammarAnalyzer(workers=size, pool_mode=mode)
+
+        start = time.perf_counter()
+        analyzer.pool.tools
+        start_time = time.perf_counter() - start
+
+        analyzer.analyze(PARAGRAPHS[0])  # warm up
+        start = time.perf_counter()
+        issues = analyzer.analyze(text)
+        check_time = time.perf_counter() - start
+
+        keys = issue_keys(issues)
+        if reference is None:
+            reference = keys
+        print(f"{size:<9}{start_time:>9.2f}{check_time:>9.2f}{len(issues):>8}"
+              f"{'yes' if keys == reference else 'no':>6}")
+        analyzer.pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=200, help="Paragraphs in the document")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4],
+                        help="Pool sizes to compare (the first is the reference)")
+    parser.add_argument("--mode", choices=POOL_MODES, default="shared", help="Pool mode")
+    parser.add_argument("--paragraph-cache", action="store_true",
+                        help="Check paragraph by paragraph with a paragraph cache")
+    args = parser.parse_args()
+    run(args.paragraphs, args.workers, args.mode, args.paragraph_cache)
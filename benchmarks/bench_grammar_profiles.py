@@ -0,0 +1,70 @@
+# WARNING: template code, may need edits
+"""Benchmark the LanguageTool rule profiles on the sample essays.
+
+Checks the essays in examples/ with each grammar profile, with the spelling
+and style analyzers taken as running too (as in a default checker), and
+reports the LanguageTool time, the time saved against the "full" profile, and the
+number of issues, including those SpellingAnalyzer also reports.
+Requires Java for the local LanguageTool server.
+
+Usage:
+    python -m benchmarks.bench_grammar_profiles [--repeat 5]
+"""
+
+import argparse
+import glob
+import os
+import time
+from src.analyzers.grammar_analyzer import GrammarAnalyzer
+from src.analyzers.language_tool_pool import RULE_PROFILES
+from src.analyzers.spelling_analyzer import SpellingAnalyzer
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+
+
+def load_essays():
+    """Text of every sample essay."""
+    essays = []
+    for path in sorted(glob.glob(os.path.join(EXAMPLES, "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            essays.append(f.read())
+    return essays
+
+
+def run(repeat=5):
+    essays = load_essays()
+    spelling = SpellingAnalyzer()
+    misspelled = {
+        (i, issue.position) for i, essay in enumerate(essays)
+        for issue in spelling.analyze(essay)
+    }
+
+    print(f"{len(essays)} essays, {sum(map(len, essays)):,} characters, {repeat} runs")
+    print(f"{'profile':<9}{'check s':>9}{'saved':>8}{'issues':>8}{'dup spell':>11}")
+
+    full_time = None
+    for profile in RULE_PROFILES:
+        analyzer = GrammarAnalyzer(profile=profile, local_analyzers=("spelling", "style"))
+        analyzer.analyze("Warm up the server.")
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = [analyzer.analyze(essay) for essay in essays]
+            timings.append(time.perf_counter() - start)
+        check_time = min(timings)
+        if full_time is None:
+            full_time = check_time
+
+        issues = [(i, issue.position) for i, result in enumerate(results) for issue in result]
+        duplicates = sum(1 for key in issues if key in misspelled)
+        saved = 1 - check_time / full_time if full_time else 0.0
+        print(f"{profile:<9}{check_time:>9.3f}{saved:>8.0%}{len(issues):>8}{duplicates:>11}")
+        analyzer.pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per profile")
+    args = parser.parse_args()
+    run(args.repeat)
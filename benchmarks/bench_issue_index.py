@@ -0,0 +1,82 @@
+# WARNING: template code, may need edits
+"""Benchmark IssueIndex range queries against scanning the issue list.
+
+Builds issues of a long text the way the analyzers report them (word-sized
+spans, with sentence-sized spans around them, and some spans flagged twice),
+then times merging them, building the index, and finding the issues that
+overlap each issue, once with pairwise checks and once with the index.
+
+Usage:
+    python -m benchmarks.bench_issue_index [--issues 5000]
+"""
+
+import argparse
+import time
+from src.models.issue import Issue, IssueType, Severity
+from src.models.issue_index import IssueIndex, merge_issues
+
+
+def make_issues(count):
+    """Word issues every 20 characters, a sentence issue per 10 words, and
+    a grammar duplicate of every fifth spelling issue."""
+    issues = []
+    for i in range(count):
+        position = i * 20
+        if i % 10 == 0:
+            issues.append(Issue(IssueType.CLARITY, Severity.WARNING, position, 200,
+                                "Long sentence", "", ""))
+        issues.append(Issue(IssueType.SPELLING, Severity.ERROR, position + 3, 5,
+                            "Spelling", "", ""))
+        if i % 5 == 0:
+            issues.append(Issue(IssueType.GRAMMAR, Severity.ERROR, position + 3, 5,
+                                "Possible typo", "", ""))
+    return issues
+
+
+def overlaps_by_scan(issues):
+    """Overlapping pairs found by checking every pair."""
+    found = 0
+    for issue in issues:
+        end = issue.position + max(issue.length, 1)
+        for other in issues:
+            if (other is not issue and other.position < end
+                    and other.position + max(other.length, 1) > issue.position):
+                found += 1
+    return found
+
+
+def overlaps_by_index(index):
+    """Overlapping pairs found with range queries."""
+    return sum(len(index.overlapping(issue)) for issue in index)
+
+
+def timed(function):
+    """Return (result, seconds)."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run(count=5000):
+    issues = make_issues(count)
+
+    merged, merge_time = timed(lambda: merge_issues(issues))
+    index, build_time = timed(lambda: IssueIndex(merged))
+    _, tree_time = timed(lambda: index.in_range(0, 1))
+    scan_pairs, scan_time = timed(lambda: overlaps_by_scan(merged))
+    index_pairs, index_time = timed(lambda: overlaps_by_index(index))
+
+    print(f"{len(issues):,} issues, {len(merged):,} after merging duplicate spans")
+    print(f"merge             {merge_time:8.3f} s")
+    print(f"sort issues       {build_time:8.3f} s")
+    print(f"build tree        {tree_time:8.3f} s")
+    print(f"pairwise scan     {scan_time:8.3f} s")
+    print(f"index queries     {index_time:8.3f} s")
+    print(f"Same overlaps: {'yes' if scan_pairs == index_pairs else 'no'} ({index_pairs:,})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5000, help="Number of word issues")
+    args = parser.parse_args()
+    run(args.issues)
@@ -0,0 +1,176 @@
+# WARNING: template code, may need edits
+"""Benchmark the memory used by slotted, templated issues.
+
+Builds the same spelling and style issues with the previous dataclass
+Issue, which stores full text copies per issue, with the current Issue
+given a context string, and with the current Issue given the source text
+(context built on first read). Reports the memory each set holds
+(measured with tracemalloc) and the time to build and serialize it.
+
+Usage:
+    python -m benchmarks.bench_issue_memory [--issues 200000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+from src.models.issue import Issue, IssueType, Severity, get_context
+
+
+@dataclass
+class DataclassIssue:
+    """The previous Issue layout: a dataclass with a __dict__ per instance."""
+    issue_type: IssueType
+    severity: Severity
+    position: int
+    length: int
+    message: str
+    explanation: str
+    learning_tip: str
+    context: str
+    suggested_fix: Optional[str] = None
+
+
+WORDS = ["recieve", "definately", "seperate", "occured", "untill", "wich"]
+SUGGESTIONS = ["receive", "definitely", "separate", "occurred", "until", "which"]
+
+# Each issue's word starts a segment of this many characters of the source
+SEGMENT = 50
+
+
+def make_source(count):
+    """Source text with one flagged word per segment."""
+    return "".join(
+        f"{WORDS[i % len(WORDS)]} and some text after it, #{i}".ljust(SEGMENT - 1) + " "
+        for i in range(count)
+    )
+
+
+def legacy_issues(source, count):
+    """Issues built the way the analyzers used to build them."""
+    issues = []
+    for i in range(count):
+        word = WORDS[i % len(WORDS)]
+        fix = SUGGESTIONS[i % len(SUGGESTIONS)]
+        position = i * SEGMENT
+        context = get_context(source, position, len(word))
+        if i % 2:
+            tip = "When unsure about spelling, try these strategies:\n"
+            tip += "1. Break the word into syllables and sound it out\n"
+            tip += "2. Look for common prefixes and suffixes\n"
+            tip += "3. Remember similar words you know how to spell\n"
+            tip += f"\nFor '{word}', consider: {fix}"
+            issues.append(DataclassIssue(
+                IssueType.SPELLING, Severity.ERROR, position, len(word),
+                f"Possible spelling error: '{word}'",
+                f"The word '{word}' may be misspelled. Did you mean one of these?",
+                tip, context, fix
+            ))
+        else:
+            issues.append(DataclassIssue(
+                IssueType.STYLE, Severity.SUGGESTION, position, len(word),
+                f"Repeated word: '{word}'",
+                f"The word '{word}' appears multiple times in close proximity.",
+                "Repetition tip: Use synonyms or rephrase to avoid repetition. "
+                "This makes your writing more engaging and professional.",
+                context, "Consider using a synonym"
+            ))
+    return issues
+
+
+def templated_issues(source, count, lazy=False):
+    """Issues built from templates, with an eager or a lazy context."""
+    issues = []
+    for i in range(count):
+        word = WORDS[i % len(WORDS)]
+        fix = SUGGESTIONS[i % len(SUGGESTIONS)]
+        position = i * SEGMENT
+        if lazy:
+            context = {"source": source}
+        else:
+            context = {"context": get_context(source, position, len(word))}
+        if i % 2:
+            issues.append(Issue(
+                IssueType.SPELLING, Severity.ERROR, position, len(word),
+                suggested_fix=fix, rule_id="SPELLING", params=(word, fix),
+                **context
+            ))
+        else:
+            issues.append(Issue(
+                IssueType.STYLE, Severity.SUGGESTION, position, len(word),
+                suggested_fix="Consider using a synonym",
+                rule_id="REPEATED_WORD", params=(word,), **context
+            ))
+    return issues
+
+
+def lazy_issues(source, count):
+    """Issues built the way the analyzers build them now."""
+    return templated_issues(source, count, lazy=True)
+
+
+def to_dict(issue):
+    """Serialize either layout."""
+    if isinstance(issue, Issue):
+        return issue.to_dict()
+    return {
+        "type": issue.issue_type.value,
+        "severity": issue.severity.value,
+        "position": issue.position,
+        "length": issue.length,
+        "message": issue.message,
+        "explanation": issue.explanation,
+        "learning_tip": issue.learning_tip,
+        "context": issue.context,
+        "suggested_fix": issue.suggested_fix
+    }
+
+
+def measure(build, source, count):
+    """Return (issues, bytes held, build seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    issues = build(source, count)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return issues, size, elapsed
+
+
+def run(count=200000):
+    print(f"{count:,} issues (half spelling, half repeated word)")
+    print(f"{'layout':<12}{'MB':>10}{'bytes/issue':>14}{'build s':>10}{'to_dict s':>11}")
+
+    # The source text already exists when issues are built, so it is not counted
+    source = make_source(count)
+    layouts = (
+        ("dataclass", legacy_issues),
+        ("templated", templated_issues),
+        ("lazy", lazy_issues),
+    )
+    results = {}
+    for name, build in layouts:
+        issues, size, elapsed = measure(build, source, count)
+
+        start = time.perf_counter()
+        dicts = [to_dict(issue) for issue in issues]
+        to_dict_time = time.perf_counter() - start
+
+        results[name] = dicts
+        print(f"{name:<12}{size / 1e6:>10.1f}{size / count:>14.0f}{elapsed:>10.2f}"
+              f"{to_dict_time:>11.2f}")
+        del issues
+
+    same = results["dataclass"] == results["templated"] == results["lazy"]
+    print(f"Same to_dict output: {'yes' if same else 'no'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=200000, help="Number of issues")
+    args = parser.parse_args()
+    run(args.issues)
@@ -0,0 +1,67 @@
+# WARNING: template code, may need edits
+"""Benchmark IssueTable summaries against counting Issue lists.
+
+Builds a corpus of templated issues, then times the per-issue summary loop
+of ParagraphChecker, the table's vectorized summary and histogram, and the
+cost of building the table and converting it back to issues.
+
+Usage:
+    python -m benchmarks.bench_issue_table [--issues 1000000]
+"""
+
+import argparse
+import time
+from src.checker import ParagraphChecker
+from src.models.issue import Issue, IssueType, Severity
+from src.models.issue_table import IssueTable
+
+KINDS = [
+    (IssueType.SPELLING, Severity.ERROR, "SPELLING", ("wich", "which")),
+    (IssueType.WORD_CHOICE, Severity.SUGGESTION, "WEAK_WORD", ("very",)),
+    (IssueType.STYLE, Severity.SUGGESTION, "REPEATED_WORD", ("word",)),
+    (IssueType.CLARITY, Severity.WARNING, "LONG_SENTENCE", (42,)),
+]
+
+
+def make_issues(count, source):
+    """Issues spread evenly over ``source``."""
+    step = max(1, len(source) // count)
+    return [
+        Issue(kind[0], kind[1], i * step, 4, source=source, rule_id=kind[2], params=kind[3])
+        for i, kind in ((i, KINDS[i * 7 % len(KINDS)]) for i in range(count))
+    ]
+
+
+def timed(function):
+    """Return (result, seconds)."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run(count=1000000):
+    source = "x" * (count * 10)
+    issues = make_issues(count, source)
+    checker = ParagraphChecker(analyzers=["spelling"])
+
+    loop_summary, loop_time = timed(lambda: checker._create_summary(issues))
+    table, build_time = timed(lambda: IssueTable(issues, source=source))
+    table_summary, summary_time = timed(table.summary)
+    _, histogram_time = timed(lambda: table.histogram(10000, by="type"))
+    rebuilt, rebuild_time = timed(table.to_issues)
+
+    print(f"{count:,} issues")
+    print(f"summary loop      {loop_time:8.3f} s")
+    print(f"table summary     {summary_time:8.3f} s")
+    print(f"table histogram   {histogram_time:8.3f} s")
+    print(f"build table       {build_time:8.3f} s")
+    print(f"rebuild issues    {rebuild_time:8.3f} s")
+    print(f"Same summary: {'yes' if loop_summary == table_summary else 'no'}; "
+          f"same issues: {'yes' if rebuilt == issues else 'no'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=1000000, help="Number of issues")
+    args = parser.parse_args()
+    run(args.issues)
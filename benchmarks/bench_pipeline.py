@@ -0,0 +1,85 @@
+# WARNING: template code, may need edits
+"""Benchmark the spaCy pipeline profiles and nlp.pipe batching.
+
+For each profile this reports the load time, the mean parse latency of a
+single paragraph, and the throughput of parsing and style-checking many
+paragraphs one by one and with ``analyze_many``. Style issues are compared
+against the "full" profile. Requires en_core_web_sm.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--docs 500] [--batch-size 64] [--n-process 1]
+"""
+
+import argparse
+import time
+from src.checker import PIPELINE_PROFILES, ParagraphChecker, load_pipeline
+
+PARAGRAPHS = [
+    "The report was written by the committee and it was very thorough. "
+    "Most of the findings matched what the team had expected.",
+    "Each reviewer read the draft twice. Their comments were short, "
+    "specific and useful, and most were adopted in the final version.",
+    "In order to finish on time, the team basically worked through the "
+    "weekend, which was really quite exhausting for everyone involved.",
+    "Results were checked by independent reviewers who had not been "
+    "involved in the original study before anything was published.",
+]
+
+
+def make_docs(count):
+    """Return ``count`` distinct paragraphs."""
+    return [f"Section {i}. {PARAGRAPHS[i % len(PARAGRAPHS)]}" for i in range(count)]
+
+
+def issue_keys(results):
+    """Comparable form of the issues of many results."""
+    return [[(i.position, i.length, i.message) for i in r["issues"]] for r in results]
+
+
+def run(docs=500, batch_size=64, n_process=1):
+    texts = make_docs(docs)
+    reference = None
+
+    print(f"{len(texts)} paragraphs, batch size {batch_size}, {n_process} process(es)")
+    print(f"{'profile':<9}{'load s':>9}{'parse ms':>10}{'loop doc/s':>12}"
+          f"{'pipe doc/s':>12}{'same issues':>13}")
+
+    for profile in PIPELINE_PROFILES:
+        start = time.perf_counter()
+        nlp = load_pipeline(profile)
+        load_time = time.perf_counter() - start
+
+        checker = ParagraphChecker(analyzers=["style"], pipeline=profile,
+                                   batch_size=batch_size, n_process=n_process)
+        checker._nlp = nlp
+        checker.analyze(texts[0])  # warm up
+
+        start = time.perf_counter()
+        for text in texts[:100]:
+            nlp(text)
+        parse_ms = (time.perf_counter() - start) / min(100, len(texts)) * 1000
+
+        start = time.perf_counter()
+        loop_results = [checker.analyze(text) for text in texts]
+        loop_rate = len(texts) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pipe_results = checker.analyze_many(texts)
+        pipe_rate = len(texts) / (time.perf_counter() - start)
+
+        issues = issue_keys(pipe_results)
+        if reference is None:
+            reference = issues
+        same = issues == reference and issue_keys(loop_results) == issues
+
+        print(f"{profile:<9}{load_time:>9.2f}{parse_ms:>10.2f}{loop_rate:>12.1f}"
+              f"{pipe_rate:>12.1f}{'yes' if same else 'no':>13}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=500, help="Number of paragraphs")
+    parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size")
+    parser.add_argument("--n-process", type=int, default=1, help="nlp.pipe processes")
+    args = parser.parse_args()
+    run(args.docs, args.batch_size, args.n_process)
@@ -0,0 +1,69 @@
+# WARNING: template code, may need edits
+"""Benchmark SymSpell suggestions against SpellChecker.candidates().
+
+Usage:
+    python -m benchmarks.bench_spelling_suggestions [--index sym.npz]
+"""
+
+import argparse
+import os
+import time
+from spellchecker import SpellChecker
+from src.analyzers.symspell import SymSpellIndex
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "misspellings.txt")
+
+
+def load_misspellings(path: str = DATA_FILE):
+    """Read (misspelling, correct) pairs."""
+    pairs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                wrong, right = line.split()
+                pairs.append((wrong, right))
+    return pairs
+
+
+def run(index_path=None):
+    spell = SpellChecker()
+    pairs = load_misspellings()
+
+    start = time.perf_counter()
+    if index_path and os.path.exists(index_path):
+        index = SymSpellIndex.load(index_path)
+        print(f"Loaded index in {time.perf_counter() - start:.2f}s")
+    else:
+        index = SymSpellIndex.build(spell.word_frequency.dictionary)
+        print(f"Built index in {time.perf_counter() - start:.2f}s")
+        if index_path:
+            index.save(index_path)
+
+    engines = {
+        "candidates": lambda w: sorted(
+            spell.candidates(w) or [], key=lambda c: -spell.word_frequency[c]
+        )[:3],
+        "symspell": lambda w: index.lookup(w, max_suggestions=3),
+    }
+
+    print(f"\n{len(pairs)} misspellings")
+    print(f"{'engine':<12}{'total s':>10}{'mean ms':>10}{'max ms':>10}{'top-1':>8}{'top-3':>8}")
+    for name, suggest in engines.items():
+        timings = []
+        top1 = top3 = 0
+        for wrong, right in pairs:
+            t = time.perf_counter()
+            suggestions = suggest(wrong)
+            timings.append(time.perf_counter() - t)
+            top1 += bool(suggestions) and suggestions[0] == right
+            top3 += right in suggestions
+        print(f"{name:<12}{sum(timings):>10.3f}{sum(timings) / len(timings) * 1000:>10.2f}"
+              f"{max(timings) * 1000:>10.2f}{top1:>8}{top3:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index", help="Index file to load or create")
+    args = parser.parse_args()
+    run(args.index)
@@ -0,0 +1,219 @@
+# WARNING: template code, may need edits
+"""Benchmark the array-based style checks against per-token loops.
+
+Uses en_core_web_sm when it is installed, otherwise a blank English
+pipeline with a sentencizer (no tags or lemmas, so passive voice is never
+reported).
+
+Usage:
+    python -m benchmarks.bench_style_checks [--paragraphs 2000] [--repeat 5]
+"""
+
+import argparse
+import time
+import spacy
+from src.analyzers.style_analyzer import StyleAnalyzer
+from src.analyzers.token_arrays import TokenArrays
+from src.models.issue import Issue, IssueType, Severity, get_context
+
+SAMPLE = (
+    "The report was written by the committee and it was very thorough. "
+    "Most of the findings matched what the team had expected, although "
+    "a few surprised the reviewers. The committee wanted every result to "
+    "be checked by independent reviewers who had not been involved in the "
+    "original study, and it asked them to record any disagreement in a "
+    "separate appendix before anything was published. Each reviewer read "
+    "the draft twice. Their comments were short, specific and useful, "
+    "and most were adopted in the final version.\n\n"
+)
+
+
+def load_pipeline():
+    """Return the full model if available, otherwise a blank pipeline."""
+    try:
+        return spacy.load("en_core_web_sm"), "en_core_web_sm"
+    except OSError:
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp, "blank + sentencizer"
+
+
+class LoopStyleAnalyzer(StyleAnalyzer):
+    """StyleAnalyzer with the previous per-token loop checks, for reference."""
+
+    def _check_weak_words(self, text, doc, tokens=None):
+        """Check for weak intensifiers and filler words."""
+        issues = []
+
+        for token in doc:
+            if token.text.lower() in self.weak_words:
+                issue = Issue(
+                    issue_type=IssueType.WORD_CHOICE,
+                    severity=Severity.SUGGESTION,
+                    position=token.idx,
+                    length=len(token.text),
+                    message=f"Weak word: '{token.text}'",
+                    explanation=f"The word '{token.text}' is a weak intensifier that often adds little meaning.",
+                    learning_tip="Try removing this word or replacing it with a more specific, stronger word. Ask yourself: Does this word add meaningful information?",
+                    context=get_context(text, token.idx, len(token.text), 40),
+                    suggested_fix="Consider removing or replacing"
+                )
+                issues.append(issue)
+
+        return issues
+
+    def _check_passive_voice(self, text, doc, tokens=None):
+        """Check for passive voice constructions."""
+        issues = []
+
+        for sent in doc.sents:
+            # Look for passive voice pattern: auxiliary verb + past participle
+            for i, token in enumerate(sent):
+                if token.lemma_ in self.passive_indicators and i + 1 < len(sent):
+                    next_token = sent[i + 1]
+                    if next_token.tag_ == 'VBN':  # Past participle
+                        issue = Issue(
+                            issue_type=IssueType.STYLE,
+                            severity=Severity.SUGGESTION,
+                            position=token.idx,
+                            length=next_token.idx + len(next_token.text) - token.idx,
+                            message="Possible passive voice",
+                            explanation="This sentence may be in passive voice, which can make writing less direct and engaging.",
+                            learning_tip="Active voice tip: Identify who/what is performing the action and make them the subject. Example: 'The ball was thrown by John' 17 'John threw the ball'",
+                            context=sent.text,
+                            suggested_fix="Consider rewriting in active voice"
+                        )
+                        issues.append(issue)
+                        break
+
+        return issues
+
+    def _check_sentence_length(self, doc, tokens=None):
+        """Check for overly long sentences."""
+        issues = []
+
+        for sent in doc.sents:
+            word_count = len([token for token in sent if not token.is_punct])
+
+            if word_count > 30:
+                issue = Issue(
+                    issue_type=IssueType.CLARITY,
+                    severity=Severity.WARNING,
+                    position=sent.start_char,
+                    length=len(sent.text),
+                    message=f"Long sentence ({word_count} words)",
+                    explanation="This sentence is quite long and may be hard to follow.",
+                    learning_tip="Long sentence tip: Try breaking this into 2-3 shorter sentences. Look for natural break points like 'and', 'but', or semicolons. Each sentence should express one main idea.",
+                    context=sent.text[:100] + "..." if len(sent.text) > 100 else sent.text,
+                    suggested_fix="Consider breaking into shorter sentences"
+                )
+                issues.append(issue)
+
+        return issues
+
+    def _check_repeated_words(self, text, doc, tokens=None):
+        """Check for repeated words in close proximity.
+
+        A single pass remembers where each word was last seen, so the cost
+        is linear in the document length for any window size.
+        """
+        issues = []
+        last_seen = {}
+        content_index = 0
+
+        for token in doc:
+            if self._starts_repeat_scope(token):
+                last_seen.clear()
+
+            if not token.is_alpha or token.is_stop:
+                continue
+
+            if self.repeat_key == "lemma":
+                key = token.lemma_.lower()
+            else:
+                key = token.text.lower()
+
+            previous = last_seen.get(key)
+            if previous is not None and content_index - previous[0] < self.repeat_window:
+                first = previous[1]
+                issue = Issue(
+                    issue_type=IssueType.STYLE,
+                    severity=Severity.SUGGESTION,
+                    position=token.idx,
+                    length=len(token.text),
+                    message=f"Repeated word: '{first.text}'",
+                    explanation=f"The word '{first.text}' appears multiple times in close proximity.",
+                    learning_tip="Repetition tip: Use synonyms or rephrase to avoid repetition. This makes your writing more engaging and professional.",
+                    context=get_context(text, token.idx, len(token.text), 40),
+                    suggested_fix="Consider using a synonym"
+                )
+                issues.append(issue)
+
+            last_seen[key] = (content_index, token)
+            content_index += 1
+
+        return issues
+
+    def _starts_repeat_scope(self, token) -> bool:
+        """Whether a token begins a new sentence or paragraph scope."""
+        if self.repeat_scope == "sentence":
+            return token.i > 0 and token.is_sent_start
+        if self.repeat_scope == "paragraph":
+            return token.is_space and token.text.count("\n") >= 2
+        return False
+
+    def _starts_repeat_scope(self, token) -> bool:
+        """Whether a token begins a new sentence or paragraph scope."""
+        if self.repeat_scope == "sentence":
+            return token.i > 0 and token.is_sent_start
+        if self.repeat_scope == "paragraph":
+            return token.is_space and token.text.count("\n") >= 2
+        return False
+
+
+def run_checks(analyzer, text, doc, tokens=None):
+    """Run the token-level checks (wordy phrases are shared and skipped)."""
+    return (analyzer._check_weak_words(text, doc, tokens)
+            + analyzer._check_passive_voice(text, doc, tokens)
+            + analyzer._check_sentence_length(doc, tokens)
+            + analyzer._check_repeated_words(text, doc, tokens))
+
+
+def run(paragraphs=2000, repeat=5):
+    nlp, name = load_pipeline()
+    loops = LoopStyleAnalyzer(nlp)
+    arrays = StyleAnalyzer(nlp)
+
+    text = SAMPLE * paragraphs
+    nlp.max_length = max(nlp.max_length, len(text) + 1)
+    doc = nlp(text)
+    print(f"Pipeline: {name}; {len(text):,} characters, {len(doc):,} tokens")
+
+    engines = {
+        "loops": lambda: run_checks(loops, text, doc),
+        "arrays": lambda: run_checks(arrays, text, doc, TokenArrays(doc)),
+    }
+    results = {}
+
+    print(f"{'engine':<10}{'best s':>10}{'mean s':>10}{'issues':>10}")
+    for engine, check in engines.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[engine] = check()
+            timings.append(time.perf_counter() - start)
+        print(f"{engine:<10}{min(timings):>10.3f}{sum(timings) / len(timings):>10.3f}"
+              f"{len(results[engine]):>10}")
+
+    if sorted(results["loops"], key=lambda x: x.position) != \
+            sorted(results["arrays"], key=lambda x: x.position):
+        print("WARNING: the engines reported different issues")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=2000,
+                        help="Number of sample paragraphs in the document")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per engine")
+    args = parser.parse_args()
+    run(args.paragraphs, args.repeat)
@@ -0,0 +1,166 @@
+# WARNING: template code, may need edits
+"""Deterministic synthetic essays for benchmarks.
+
+Essays are built from sentence templates filled with a small vocabulary,
+so the same seed and settings always give the same text. Misspellings
+come from ``data/misspellings.txt``; long sentences chain several clauses
+so that the style analyzer flags them. Weak words and wordy phrases appear
+at a fixed rate to keep the style checks busy.
+
+Usage:
+    python -m benchmarks.corpus [--words 600] [--misspelling-rate 0.02]
+        [--long-sentence-rate 0.1] [--seed 0]
+"""
+
+import argparse
+import random
+from typing import List, NamedTuple
+
+from benchmarks.bench_spelling_suggestions import load_misspellings
+
+DETERMINERS = ["the", "a", "this", "every", "our", "their", "one"]
+ADJECTIVES = [
+    "important", "recent", "small", "careful", "new", "local", "public", "simple",
+    "difficult", "useful", "early", "final", "large", "common", "strong", "quiet",
+]
+NOUNS = [
+    "study", "report", "teacher", "student", "city", "committee", "result", "method",
+    "river", "market", "school", "idea", "problem", "village", "team", "system",
+    "argument", "experiment", "library", "museum", "project", "question", "garden",
+]
+VERBS = [
+    "describes", "changes", "supports", "explains", "improves", "follows", "shows",
+    "reaches", "builds", "finds", "tests", "questions", "reviews", "protects",
+]
+PASSIVE_VERBS = ["written", "reviewed", "built", "tested", "approved", "checked"]
+PREPOSITIONS = ["in", "near", "after", "before", "during", "with", "without", "for"]
+CONNECTIVES = ["and", "but", "because", "while", "although", "so"]
+WEAK_WORDS = ["very", "really", "quite", "basically"]
+WORDY_PHRASES = ["in order to", "due to the fact that", "at this point in time"]
+
+# Clauses in regular and in long sentences
+SHORT_CLAUSES = (1, 2)
+LONG_CLAUSES = (4, 6)
+
+
+class CorpusSettings(NamedTuple):
+    """Parameters of a generated corpus."""
+    essays: int = 20
+    words: int = 600
+    misspelling_rate: float = 0.02
+    long_sentence_rate: float = 0.1
+    seed: int = 0
+
+
+class _EssayWriter:
+    """Writes sentences from one random generator."""
+
+    def __init__(self, rng: random.Random, misspelling_rate: float):
+        self.rng = rng
+        self.misspelling_rate = misspelling_rate
+        self.misspellings = [wrong for wrong, _ in load_misspellings()]
+
+    def noun_phrase(self) -> List[str]:
+        words = [self.rng.choice(DETERMINERS)]
+        if self.rng.random() < 0.5:
+            if self.rng.random() < 0.15:
+                words.append(self.rng.choice(WEAK_WORDS))
+            words.append(self.rng.choice(ADJECTIVES))
+        words.append(self.rng.choice(NOUNS))
+        return words
+
+    def clause(self) -> List[str]:
+        words = self.noun_phrase()
+        if self.rng.random() < 0.2:
+            words += ["was", self.rng.choice(PASSIVE_VERBS), "by"] + self.noun_phrase()
+        else:
+            words.append(self.rng.choice(VERBS))
+            words += self.noun_phrase()
+        if self.rng.random() < 0.5:
+            words.append(self.rng.choice(PREPOSITIONS))
+            words += self.noun_phrase()
+        if self.rng.random() < 0.05:
+            words = self.rng.choice(WORDY_PHRASES).split() + ["help"] + words
+        return words
+
+    def sentence(self, long: bool) -> List[str]:
+        low, high = LONG_CLAUSES if long else SHORT_CLAUSES
+        words = self.clause()
+        for _ in range(self.rng.randint(low, high) - 1):
+            words += [",", self.rng.choice(CONNECTIVES)] + self.clause()
+        words = [self.misspell(word) for word in words]
+        words[0] = words[0].capitalize()
+        return words
+
+    def misspell(self, word: str) -> str:
+        if word.isalpha() and self.rng.random() < self.misspelling_rate:
+            return self.rng.choice(self.misspellings)
+        return word
+
+
+def _join(words: List[str]) -> str:
+    """Join words, attaching commas to the previous word."""
+    return " ".join(words).replace(" ,", ",") + "."
+
+
+def generate_essay(
+    words: int = 600,
+    misspelling_rate: float = 0.02,
+    long_sentence_rate: float = 0.1,
+    seed: int = 0
+) -> str:
+    """Generate one essay.
+
+    Args:
+        words: Approximate number of words; the last sentence is finished
+        misspelling_rate: Share of words replaced by a common misspelling
+        long_sentence_rate: Share of sentences with four to six clauses
+        seed: Seed of the random generator
+
+    Returns:
+        Paragraphs of four to seven sentences separated by blank lines
+    """
+    rng = random.Random(seed)
+    writer = _EssayWriter(rng, misspelling_rate)
+    paragraphs = []
+    count = 0
+    while count < words:
+        sentences = []
+        for _ in range(rng.randint(4, 7)):
+            sentence = writer.sentence(rng.random() < long_sentence_rate)
+            count += sum(1 for word in sentence if word != ",")
+            sentences.append(_join(sentence))
+            if count >= words:
+                break
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def generate_corpus(settings: CorpusSettings = CorpusSettings()) -> List[str]:
+    """Generate ``settings.essays`` different essays.
+
+    Args:
+        settings: Corpus parameters; essay ``i`` uses seed ``settings.seed + i``
+
+    Returns:
+        The essays, in order
+    """
+    return [
+        generate_essay(
+            settings.words, settings.misspelling_rate, settings.long_sentence_rate,
+            settings.seed + i
+        )
+        for i in range(settings.essays)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=600, help="Approximate words")
+    parser.add_argument("--misspelling-rate", type=float, default=0.02,
+                        help="Share of misspelled words")
+    parser.add_argument("--long-sentence-rate", type=float, default=0.1,
+                        help="Share of long sentences")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    print(generate_essay(args.words, args.misspelling_rate, args.long_sentence_rate, args.seed))
@@ -0,0 +1,343 @@
+# WARNING: template code, may need edits
+"""Benchmark suite for the analyzers, with stored baselines.
+
+Runs each analyzer, and the whole checker, on a generated corpus (see
+``benchmarks.corpus``) and records the median seconds of a pass over the
+corpus after one warm-up pass. ``run`` writes the numbers as JSON;
+``compare`` checks them against a baseline and exits with status 1 when a
+benchmark got slower by more than the threshold, or when a benchmark that
+ran or was skipped has no numbers on one side. Results of differently
+shaped corpora are not compared.
+
+LanguageTool is replaced by a local stub that flags the corpus's
+misspellings and "a" before a vowel, so the suite runs offline and the
+grammar numbers measure this package's own work around LanguageTool
+(chunking, match conversion, building issues). Benchmarks that need
+en_core_web_sm are skipped when it is not installed.
+
+Usage:
+    python -m benchmarks.suite run [--output results.json] [--only spelling style]
+        [--repeat 5] [--essays 20] [--words 600] [--misspelling-rate 0.02]
+        [--long-sentence-rate 0.1] [--seed 0] [--compare benchmarks/baseline.json]
+    python -m benchmarks.suite compare benchmarks/baseline.json results.json
+        [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.bench_spelling_suggestions import load_misspellings
+from benchmarks.corpus import CorpusSettings, generate_corpus
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Allowed slowdown before compare reports a regression: 0.25 is 25% slower
+DEFAULT_THRESHOLD = 0.25
+
+MODEL = "en_core_web_sm"
+
+
+class StubLanguageTool:
+    """Offline stand-in for a LanguageTool client.
+
+    Flags the misspellings of ``data/misspellings.txt`` and "a" before a
+    vowel, returning matches shaped like language_tool_python's.
+    """
+
+    def __init__(self):
+        words = "|".join(re.escape(wrong) for wrong, _ in load_misspellings())
+        self._typo = re.compile(rf"\b(?:{words})\b", re.IGNORECASE)
+        self._article = re.compile(r"\b[Aa] (?=[aeiou])")
+
+    def check(self, text: str) -> list:
+        matches = [
+            self._match(m, "MORFOLOGIK_RULE_EN_US", "TYPOS", "misspelling",
+                        "Possible spelling mistake found.")
+            for m in self._typo.finditer(text)
+        ]
+        matches += [
+            self._match(m, "EN_A_VS_AN", "MISC", "grammar",
+                        "Use “an” instead of “a” before a vowel sound.")
+            for m in self._article.finditer(text)
+        ]
+        matches.sort(key=lambda match: match.offset)
+        return matches
+
+    @staticmethod
+    def _match(m, rule_id, category, issue_type, message):
+        return SimpleNamespace(
+            offset=m.start(), errorLength=m.end() - m.start(), message=message,
+            ruleId=rule_id, category=category, ruleIssueType=issue_type,
+            replacements=[], rule=SimpleNamespace(description=message)
+        )
+
+    def close(self):
+        pass
+
+
+def stub_language_tool(grammar_analyzer):
+    """Make a grammar analyzer's pool start stub clients."""
+    pool = grammar_analyzer.pool
+    pool._start_tools = lambda: [StubLanguageTool() for _ in range(pool.size)]
+    return grammar_analyzer
+
+
+def model_installed() -> bool:
+    """Whether the spaCy model needed by the style benchmarks is installed."""
+    import spacy
+
+    return spacy.util.is_package(MODEL)
+
+
+# Each benchmark prepares its analyzer outside the timing and returns the
+# pass over the corpus that is timed.
+
+def bench_spelling(texts: List[str]) -> Callable[[], Any]:
+    from src.analyzers.spelling_analyzer import SpellingAnalyzer
+
+    analyzer = SpellingAnalyzer()
+    return lambda: [analyzer.analyze(text) for text in texts]
+
+
+def bench_readability(texts: List[str]) -> Callable[[], Any]:
+    from src.analyzers.readability_analyzer import ReadabilityAnalyzer
+
+    analyzer = ReadabilityAnalyzer()
+    return lambda: [analyzer.analyze(text) for text in texts]
+
+
+def bench_grammar(texts: List[str]) -> Callable[[], Any]:
+    from src.analyzers.grammar_analyzer import GrammarAnalyzer
+
+    analyzer = stub_language_tool(GrammarAnalyzer())
+    return lambda: [analyzer.analyze(text) for text in texts]
+
+
+def bench_style(texts: List[str]) -> Callable[[], Any]:
+    from src.analyzers.style_analyzer import StyleAnalyzer
+    from src.checker import load_pipeline
+
+    nlp = load_pipeline()
+    docs = list(nlp.pipe(texts))
+    analyzer = StyleAnalyzer(nlp)
+    return lambda: [analyzer.analyze(text, doc) for text, doc in zip(texts, docs)]
+
+
+def bench_end_to_end(texts: List[str]) -> Callable[[], Any]:
+    from src.checker import ParagraphChecker
+
+    checker = ParagraphChecker()
+    stub_language_tool(checker.grammar_analyzer)
+    return lambda: checker.analyze_many(texts)
+
+
+# name -> (setup, needs the spaCy model)
+BENCHMARKS: Dict[str, tuple] = {
+    "spelling": (bench_spelling, False),
+    "readability": (bench_readability, False),
+    "grammar": (bench_grammar, False),
+    "style": (bench_style, True),
+    "end_to_end": (bench_end_to_end, True),
+}
+
+
+def run(
+    settings: CorpusSettings = CorpusSettings(),
+    repeat: int = 5,
+    only: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run the benchmarks.
+
+    Args:
+        settings: Corpus to generate
+        repeat: Timed passes per benchmark; the median is reported
+        only: Names of the benchmarks to run (default: all)
+
+    Returns:
+        Results with the settings, environment, per-benchmark ``seconds``
+        and ``words_per_second``, and the names of skipped benchmarks
+    """
+    texts = generate_corpus(settings)
+    words = sum(len(text.split()) for text in texts)
+    has_model = model_installed()
+
+    results = {
+        "settings": dict(settings._asdict(), repeat=repeat),
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "system": platform.system()
+        },
+        "benchmarks": {},
+        "skipped": []
+    }
+
+    print(f"{len(texts)} essays, {words:,} words, median of {repeat} passes")
+    for name, (setup, needs_model) in BENCHMARKS.items():
+        if only and name not in only:
+            continue
+        if needs_model and not has_model:
+            print(f"{name:<14}skipped ({MODEL} is not installed)")
+            results["skipped"].append(name)
+            continue
+
+        timed_pass = setup(texts)
+        timed_pass()  # warm up
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            timed_pass()
+            times.append(time.perf_counter() - start)
+
+        seconds = statistics.median(times)
+        results["benchmarks"][name] = {
+            "seconds": round(seconds, 6),
+            "words_per_second": round(words / seconds, 1)
+        }
+        print(f"{name:<14}{seconds:10.4f} s{words / seconds:14,.0f} words/s")
+
+    return results
+
+
+def _corpus_settings(results: Dict[str, Any]) -> Dict[str, Any]:
+    """The settings of a result that shape the corpus (all but ``repeat``)."""
+    return {key: value for key, value in results.get("settings", {}).items() if key != "repeat"}
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """Compare results with a baseline.
+
+    Every benchmark the current results ran or skipped is tracked. One
+    that the baseline measured but was skipped now fails the comparison,
+    since its regressions would go unnoticed. One that has no numbers in
+    the baseline (e.g. skipped there too) is reported but cannot fail.
+    Benchmarks left out with ``--only`` are not compared.
+
+    Args:
+        baseline: Results of ``run`` to compare against
+        current: Newer results of ``run``
+        threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        Names of the benchmarks that regressed by more than ``threshold``
+        or were measured in the baseline only
+
+    Raises:
+        ValueError: If the results were produced on differently shaped
+            corpora, so their seconds are not comparable
+    """
+    if _corpus_settings(baseline) != _corpus_settings(current):
+        raise ValueError(
+            f"The results were produced on different corpora: baseline "
+            f"{_corpus_settings(baseline)}, current {_corpus_settings(current)}"
+        )
+
+    tracked = set(current["benchmarks"]).union(current.get("skipped", ()))
+    failures = []
+    print(f"{'benchmark':<14}{'baseline s':>12}{'current s':>12}{'change':>9}")
+    for name in BENCHMARKS:
+        if name not in tracked:
+            continue
+        base = baseline["benchmarks"].get(name)
+        now = current["benchmarks"].get(name)
+        if base is None or now is None:
+            base_text = f"{base['seconds']:>12.4f}" if base else f"{'-':>12}"
+            now_text = f"{now['seconds']:>12.4f}" if now else f"{'-':>12}"
+            if base is None and now is None:
+                reason = "NOT COMPARABLE"
+            elif base is None:
+                reason = "NO BASELINE"
+            else:
+                # Measured before, so skipping it now would hide regressions
+                failures.append(name)
+                reason = "SKIPPED"
+            print(f"{name:<14}{base_text}{now_text}{'':>9}  {reason}")
+            continue
+
+        change = now["seconds"] / base["seconds"] - 1
+        regressed = change > threshold
+        if regressed:
+            failures.append(name)
+        print(f"{name:<14}{base['seconds']:>12.4f}{now['seconds']:>12.4f}{change:>+9.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+
+    if failures:
+        print(f"{len(failures)} benchmark(s) slower by more than {threshold:.0%} "
+              f"or no longer measured: {', '.join(failures)}")
+    return failures
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--output", help="Write the results to this JSON file")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS),
+                            help="Benchmarks to run")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed passes")
+    run_parser.add_argument("--essays", type=int, default=20, help="Essays in the corpus")
+    run_parser.add_argument("--words", type=int, default=600, help="Words per essay")
+    run_parser.add_argument("--misspelling-rate", type=float, default=0.02,
+                            help="Share of misspelled words")
+    run_parser.add_argument("--long-sentence-rate", type=float, default=0.1,
+                            help="Share of long sentences")
+    run_parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    run_parser.add_argument("--compare", metavar="BASELINE",
+                            help="Compare the results with a baseline file")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="Allowed relative slowdown (default: 0.25)")
+
+    compare_parser = commands.add_parser("compare", help="Compare results with a baseline")
+    compare_parser.add_argument("baseline", help="Baseline results JSON")
+    compare_parser.add_argument("current", help="Current results JSON")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Allowed relative slowdown (default: 0.25)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _compare_status(_load(args.baseline), _load(args.current), args.threshold)
+
+    settings = CorpusSettings(
+        args.essays, args.words, args.misspelling_rate, args.long_sentence_rate, args.seed
+    )
+    results = run(settings, args.repeat, args.only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    if args.compare:
+        return _compare_status(_load(args.compare), results, args.threshold)
+    return 0
+
+
+def _compare_status(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Exit status of a comparison: 0 passed, 1 failed, 2 not comparable."""
+    try:
+        failures = compare(baseline, current, threshold)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
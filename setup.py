@@ -12,6 +12,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    package_data={"src": ["data/*.json"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -23,12 +24,18 @@ setup(
         "language-tool-python>=2.7.1",
         "pyspellchecker>=0.7.2",
         "textstat>=0.7.3",
+        "pyphen>=0.10.0",
         "colorama>=0.4.6",
         "click>=8.1.7",
+        "numpy>=1.19.0",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=7.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "paragraph-checker=src.main:main",
+            "paragraph-checker-server=src.server:main",
         ],
     },
 )
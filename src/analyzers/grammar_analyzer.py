@@ -1,55 +1,170 @@
 # WARNING: template code, may need edits
 """Grammar and punctuation analysis using LanguageTool."""
 
-import language_tool_python
-from typing import List
+import sys
+import time
+from bisect import bisect_right
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+from src.analyzers.language_tool_pool import RULE_PROFILES, LanguageToolPool, RuleProfile
+from src.cache import ParagraphCache
 from src.models.issue import Issue, IssueType, Severity
+from src.profiling import stage
+from src.segmentation import split_chunks, split_paragraphs
+
+# Rule ID fragments with a specific learning tip, in order of preference
+_TIP_RULES = ("COMMA", "AGREEMENT", "TENSE", "ARTICLE")
+
+# Joins uncached paragraphs into one text, so LanguageTool still sees each
+# as its own paragraph
+_PARAGRAPH_SEPARATOR = "\n\n"
+
+
+class MatchRecord(NamedTuple):
+    """The parts of a LanguageTool match that an issue is built from."""
+    offset: int
+    length: int
+    rule_id: str
+    category: str
+    issue_type: str
+    message: str
+    description: str
+    replacement: Optional[str]
+    
+    @classmethod
+    def from_match(cls, match, offset: int = 0) -> "MatchRecord":
+        """Read a match, moving it ``offset`` characters.
+        
+        language_tool_python 3 renamed the camelCase match attributes, so
+        both spellings are accepted.
+        """
+        rule = getattr(match, "rule", None)
+        return cls(
+            offset=offset + match.offset,
+            length=_match_field(match, "error_length", "errorLength"),
+            rule_id=_match_field(match, "rule_id", "ruleId"),
+            category=match.category,
+            issue_type=_match_field(match, "rule_issue_type", "ruleIssueType"),
+            message=match.message,
+            description=getattr(rule, "description", None) or "",
+            replacement=match.replacements[0] if match.replacements else None
+        )
+
+
+def _match_field(match, name: str, old_name: str):
+    """A match attribute under its current or its old name."""
+    value = getattr(match, name, None)
+    return value if value is not None else getattr(match, old_name)
 
 
 class GrammarAnalyzer:
     """Analyzes text for grammar and punctuation errors."""
     
-    def __init__(self):
-        """Initialize the grammar analyzer with LanguageTool."""
-        self.tool = language_tool_python.LanguageTool('en-US')
+    def __init__(
+        self,
+        workers: int = 1,
+        chunk_chars: int = 5000,
+        pool_mode: str = "shared",
+        remote_server: Optional[str] = None,
+        paragraph_cache: Optional[ParagraphCache] = None,
+        profile: str = "default",
+        disabled_rules: Sequence[str] = (),
+        disabled_categories: Sequence[str] = (),
+        local_analyzers: Iterable[str] = ()
+    ):
+        """Initialize the grammar analyzer.
+        
+        The LanguageTool server is started the first time text is checked.
+        
+        Args:
+            workers: LanguageTool clients checking chunks of a text in
+                parallel; with 1 the whole text is checked in one call
+            chunk_chars: Target chunk size in characters with several
+                workers. Chunks hold whole paragraphs and a longer
+                paragraph is a chunk of its own, so only rules that look
+                across paragraphs can give other results than one call.
+            pool_mode: "shared" (one local server for all workers) or
+                "servers" (one local server per worker)
+            remote_server: URL of a running LanguageTool server to use
+                instead of a local one
+            paragraph_cache: Optional cache of paragraph results. With a
+                cache, text is checked paragraph by paragraph and only
+                uncached paragraphs are sent to LanguageTool, so rules that
+                look across paragraphs do not apply.
+            profile: LanguageTool rule profile, one of ``RULE_PROFILES``.
+                "default" skips LanguageTool's spell checker when the
+                spelling analyzer runs, and the style rules the style
+                analyzer covers when it runs.
+            disabled_rules: Further LanguageTool rule IDs to skip
+            disabled_categories: Further LanguageTool category IDs to skip
+            local_analyzers: Names of the other analyzers that run on the
+                same text (see ``COVERED_RULES``)
+        """
+        if profile not in RULE_PROFILES:
+            raise ValueError(
+                f"Unknown grammar profile: {profile}. "
+                f"Choose from: {', '.join(RULE_PROFILES)}"
+            )
+        
+        self.chunk_chars = chunk_chars
+        self.paragraph_cache = paragraph_cache
+        self.profile = profile
+        self.local_analyzers = frozenset(local_analyzers)
+        # Rules before the local analyzers' coverage is taken out
+        self.base_rules = RULE_PROFILES[profile].extended(disabled_rules, disabled_categories)
+        self.pool = LanguageToolPool(
+            size=workers, language='en-US', mode=pool_mode, remote_server=remote_server,
+            rules=self.base_rules.covering(self.local_analyzers)
+        )
+    
+    @property
+    def tool(self):
+        """First LanguageTool client of the pool, started on first access."""
+        return self.pool.tools[0]
     
-    def analyze(self, text: str) -> List[Issue]:
+    def analyze(self, text: str, local_analyzers: Optional[Iterable[str]] = None) -> List[Issue]:
         """Analyze text for grammar issues.
         
         Args:
             text: The text to analyze
+            local_analyzers: Other analyzers running on this text, if not
+                the ones given to the constructor
             
         Returns:
             List of grammar-related issues
         """
         issues = []
         
+        rules = None
+        covered = self.base_rules.covered(self.local_analyzers)
+        if local_analyzers is not None:
+            call_covered = self.base_rules.covered(local_analyzers)
+            if call_covered != covered:
+                covered = call_covered
+                rules = self.base_rules.covering(local_analyzers)
+        
         try:
-            matches = self.tool.check(text)
+            if self.paragraph_cache is not None:
+                records = self._check_paragraphs(text, rules, ",".join(covered))
+            else:
+                records = self._check_text(text, rules)
             
-            for match in matches:
+            for record in records:
                 # Determine issue type
-                issue_type = self._categorize_rule(match.ruleId, match.category)
+                issue_type = self._categorize_rule(record.rule_id, record.category)
                 
                 # Determine severity
-                severity = self._determine_severity(match)
-                
-                # Extract context
-                context = self._get_context(text, match.offset, match.errorLength)
-                
-                # Create learning tip
-                learning_tip = self._create_learning_tip(match)
+                severity = self._determine_severity(record)
                 
+                # The learning tip and explanation come from a shared template
                 issue = Issue(
                     issue_type=issue_type,
                     severity=severity,
-                    position=match.offset,
-                    length=match.errorLength,
-                    message=match.message,
-                    explanation=self._create_explanation(match),
-                    learning_tip=learning_tip,
-                    context=context,
-                    suggested_fix=match.replacements[0] if match.replacements else None
+                    position=record.offset,
+                    length=record.length,
+                    source=text,
+                    suggested_fix=record.replacement,
+                    rule_id=self._template_id(record),
+                    params=(record.message, self._rule_description(record))
                 )
                 
                 issues.append(issue)
@@ -59,64 +174,131 @@ class GrammarAnalyzer:
         
         return issues
     
+    def _check_text(self, text: str, rules: Optional[RuleProfile] = None) -> List[MatchRecord]:
+        """Check text in one call, or in chunks on several workers.
+        
+        ``rules`` replaces the pool's rules for this check.
+        """
+        if self.pool.size > 1:
+            chunks = split_chunks(text, self.chunk_chars)
+        else:
+            chunks = [(0, text)]
+        
+        with stage("grammar.language_tool"):
+            matches = self.pool.check_chunks(chunks, rules)
+        
+        # Each match comes with the offset of the chunk it was found in
+        return [MatchRecord.from_match(match, offset) for offset, match in matches]
+    
+    def _check_paragraphs(
+        self,
+        text: str,
+        rules: Optional[RuleProfile] = None,
+        covered: str = ""
+    ) -> List[MatchRecord]:
+        """Check the paragraphs of text, reusing cached paragraph results.
+        
+        Paragraphs rather than sentences are cached, since sentence
+        boundaries found with a regular expression are not reliable
+        ("Dr. Smith", "e.g.") and LanguageTool's rules look across
+        sentences. ``rules`` replaces the pool's rules for this check;
+        ``covered`` names the local analyzers whose rules are off, since the
+        cached results depend on them.
+        """
+        cache = self.paragraph_cache
+        records = []
+        # Uncached paragraph -> its offsets, so repeats are checked once
+        uncached = {}
+        
+        for offset, paragraph in split_paragraphs(text):
+            if paragraph in uncached:
+                uncached[paragraph].append(offset)
+                continue
+            cached = cache.get(paragraph, covered)
+            if cached is None:
+                uncached[paragraph] = [offset]
+            else:
+                records.extend(
+                    MatchRecord(*record)._replace(offset=offset + record[0])
+                    for record in cached
+                )
+        
+        if uncached:
+            paragraphs = list(uncached)
+            start = time.perf_counter()
+            checked = self._check_separately(paragraphs, rules)
+            cache.record_check(sum(map(len, paragraphs)), time.perf_counter() - start)
+            
+            for paragraph, paragraph_records in zip(paragraphs, checked):
+                cache.put(paragraph, paragraph_records, covered)
+                records.extend(
+                    record._replace(offset=offset + record.offset)
+                    for offset in uncached[paragraph]
+                    for record in paragraph_records
+                )
+        
+        records.sort(key=lambda record: record.offset)
+        return records
+    
+    def _check_separately(
+        self,
+        paragraphs: Sequence[str],
+        rules: Optional[RuleProfile] = None
+    ) -> List[List[MatchRecord]]:
+        """Check paragraphs in one call, as separate paragraphs of one text.
+        
+        Returns:
+            For each paragraph, its records with offsets into the paragraph
+        """
+        starts = []
+        position = 0
+        for paragraph in paragraphs:
+            starts.append(position)
+            position += len(paragraph) + len(_PARAGRAPH_SEPARATOR)
+        joined = _PARAGRAPH_SEPARATOR.join(paragraphs)
+        
+        per_paragraph = [[] for _ in paragraphs]
+        for record in self._check_text(joined, rules):
+            i = bisect_right(starts, record.offset) - 1
+            offset = record.offset - starts[i]
+            # Matches that reach into the separator belong to no paragraph
+            if offset + record.length <= len(paragraphs[i]):
+                per_paragraph[i].append(record._replace(offset=offset))
+        return per_paragraph
+    
     def _categorize_rule(self, rule_id: str, category: str) -> IssueType:
         """Categorize the rule into an issue type."""
         if 'PUNCTUATION' in category or 'COMMA' in rule_id:
             return IssueType.PUNCTUATION
         return IssueType.GRAMMAR
     
-    def _determine_severity(self, match) -> Severity:
+    def _determine_severity(self, record: MatchRecord) -> Severity:
         """Determine severity based on the match."""
-        if match.ruleIssueType == 'misspelling':
+        if record.issue_type == 'misspelling':
             return Severity.ERROR
-        elif match.ruleIssueType == 'grammar':
+        elif record.issue_type == 'grammar':
             return Severity.ERROR
-        elif match.ruleIssueType == 'typographical':
+        elif record.issue_type == 'typographical':
             return Severity.WARNING
         else:
             return Severity.SUGGESTION
     
-    def _get_context(self, text: str, offset: int, length: int, window: int = 30) -> str:
-        """Extract context around the error."""
-        start = max(0, offset - window)
-        end = min(len(text), offset + length + window)
-        
-        context = text[start:end]
-        error_start = offset - start
-        error_end = error_start + length
-        
-        # Highlight the error
-        highlighted = (
-            context[:error_start] + 
-            ">>>" + context[error_start:error_end] + "<<<" + 
-            context[error_end:]
-        )
-        
-        return highlighted.strip()
+    def _rule_description(self, record: MatchRecord) -> str:
+        """Rule description appended to the explanation, if any."""
+        if record.description:
+            # Shared by every match of the rule
+            return sys.intern(f" ({record.description})")
+        return ""
     
-    def _create_explanation(self, match) -> str:
-        """Create a detailed explanation of the issue."""
-        explanation = match.message
-        if match.rule.description:
-            explanation += f" ({match.rule.description})"
-        return explanation
-    
-    def _create_learning_tip(self, match) -> str:
-        """Create an educational tip for the user."""
-        tips = {
-            'COMMA': "Remember: Use commas to separate clauses and items in a list. Consider the sentence structure and natural pauses.",
-            'AGREEMENT': "Subject-verb agreement: Make sure your subject and verb match in number (singular/plural).",
-            'TENSE': "Verb tense consistency: Keep your tenses consistent unless you're deliberately shifting time frames.",
-            'ARTICLE': "Articles (a, an, the): Use 'a' before consonant sounds, 'an' before vowel sounds, 'the' for specific items.",
-        }
-        
-        for key, tip in tips.items():
-            if key in match.ruleId:
-                return tip
-        
-        return "Review the grammar rule mentioned and practice identifying similar patterns in your writing."
+    def _template_id(self, record: MatchRecord) -> str:
+        """Pick the template whose learning tip fits the rule."""
+        for key in _TIP_RULES:
+            if key in record.rule_id:
+                return f"GRAMMAR_{key}"
+        
+        return "GRAMMAR"
     
     def __del__(self):
         """Clean up resources."""
-        if hasattr(self, 'tool'):
-            self.tool.close()
+        if getattr(self, 'pool', None) is not None:
+            self.pool.close()
@@ -0,0 +1,275 @@
+# WARNING: template code, may need edits
+"""A pool of LanguageTool clients for checking text in parallel."""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.profiling import stage
+
+# How the clients of a pool reach a LanguageTool server
+POOL_MODES = ("shared", "servers")
+
+
+class RuleProfile(NamedTuple):
+    """LanguageTool rules and categories to switch on or off.
+    
+    With ``skip_covered``, ``covering`` also switches off the rules of the
+    local analyzers that run alongside LanguageTool (``COVERED_RULES``).
+    """
+    disabled_rules: Tuple[str, ...] = ()
+    disabled_categories: Tuple[str, ...] = ()
+    enabled_rules: Tuple[str, ...] = ()
+    enabled_categories: Tuple[str, ...] = ()
+    picky: bool = False
+    skip_covered: bool = False
+    
+    def apply(self, tool):
+        """Configure a LanguageTool client with the profile."""
+        tool.disabled_rules = set(self.disabled_rules)
+        tool.disabled_categories = set(self.disabled_categories)
+        tool.enabled_rules = set(self.enabled_rules)
+        tool.enabled_categories = set(self.enabled_categories)
+        tool.picky = self.picky
+    
+    def extended(
+        self,
+        disabled_rules: Sequence[str] = (),
+        disabled_categories: Sequence[str] = ()
+    ) -> "RuleProfile":
+        """Copy of the profile with more rules and categories disabled."""
+        return self._replace(
+            disabled_rules=tuple(dict.fromkeys(self.disabled_rules + tuple(disabled_rules))),
+            disabled_categories=tuple(
+                dict.fromkeys(self.disabled_categories + tuple(disabled_categories))
+            )
+        )
+    
+    def covered(self, local_analyzers: Iterable[str]) -> Tuple[str, ...]:
+        """Names of the running local analyzers whose rules are switched off."""
+        if not self.skip_covered:
+            return ()
+        local_analyzers = set(local_analyzers)
+        return tuple(name for name in COVERED_RULES if name in local_analyzers)
+    
+    def covering(self, local_analyzers: Iterable[str]) -> "RuleProfile":
+        """Copy of the profile for when the given local analyzers run too.
+        
+        Args:
+            local_analyzers: Names of the analyzers enabled besides grammar
+            
+        Returns:
+            The profile with the rules those analyzers cover disabled, if
+            it has ``skip_covered``; otherwise the profile itself
+        """
+        profile = self
+        for name in self.covered(local_analyzers):
+            profile = profile.extended(*COVERED_RULES[name])
+        return profile
+
+
+# LanguageTool's spell checker; SpellingAnalyzer already checks every word
+_SPELLER_RULES = ("MORFOLOGIK_RULE_EN_US",)
+
+# Style rules and categories that StyleAnalyzer covers: wordy phrases
+# (PLAIN_ENGLISH), repeated words, passive voice, long sentences and weak
+# intensifiers
+_STYLE_OVERLAP_RULES = ("PASSIVE_VOICE", "TOO_LONG_SENTENCE", "EN_WEAK_ADJECTIVE")
+_STYLE_OVERLAP_CATEGORIES = ("PLAIN_ENGLISH", "REPETITIONS_STYLE")
+
+# (rules, categories) each local analyzer already checks, by analyzer name
+COVERED_RULES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "spelling": (_SPELLER_RULES, ()),
+    "style": (_STYLE_OVERLAP_RULES, _STYLE_OVERLAP_CATEGORIES),
+}
+
+# Profiles selectable with --grammar-profile. "full" is LanguageTool's own
+# default rule set; "default" leaves out what the running local analyzers
+# check; "fast" also drops the remaining style and typography categories to
+# focus on grammar and punctuation; "picky" adds LanguageTool's picky rules.
+RULE_PROFILES: Dict[str, RuleProfile] = {
+    "full": RuleProfile(),
+    "default": RuleProfile(skip_covered=True),
+    "fast": RuleProfile(
+        disabled_categories=(
+            "STYLE", "REDUNDANCY", "TYPOGRAPHY", "CREATIVE_WRITING", "TEXT_ANALYSIS"
+        ),
+        skip_covered=True
+    ),
+    "picky": RuleProfile(picky=True, skip_covered=True),
+}
+
+
+def start_server(language: str = "en-US"):
+    """Start a local LanguageTool server.
+    
+    Args:
+        language: LanguageTool language code
+        
+    Returns:
+        The client that owns the server; ``server_url`` gives the address
+        other clients can send requests to, and closing it stops the server
+    """
+    import language_tool_python
+    
+    return language_tool_python.LanguageTool(language)
+
+
+def server_url(tool) -> str:
+    """Address of the local server a LanguageTool client started."""
+    return f"http://{tool.host}:{tool.port}"
+
+
+class LanguageToolPool:
+    """A fixed number of LanguageTool clients used from worker threads.
+    
+    Every client is configured with the pool's ``RuleProfile``. In
+    "shared" mode one local LanguageTool server is started and every
+    client sends requests to it over its own HTTP session; the server
+    checks them concurrently. In "servers" mode each client starts its own
+    local server (more memory, no contention). With ``remote_server`` all
+    clients use that server instead.
+    
+    Clients are created the first time text is checked. Each client is
+    used by one thread at a time.
+    """
+    
+    def __init__(
+        self,
+        size: int = 1,
+        language: str = "en-US",
+        mode: str = "shared",
+        remote_server: Optional[str] = None,
+        rules: RuleProfile = RuleProfile()
+    ):
+        """Initialize the pool.
+        
+        Args:
+            size: Number of clients, and of chunks checked at once
+            language: LanguageTool language code
+            mode: "shared" (one local server) or "servers" (one local
+                server per client); ignored with ``remote_server``
+            remote_server: URL of a running LanguageTool server to use
+            rules: Rules and categories the clients enable or disable
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        if mode not in POOL_MODES:
+            raise ValueError(f"Unknown pool mode: {mode}. Choose from: {', '.join(POOL_MODES)}")
+        
+        self.size = size
+        self.language = language
+        self.mode = mode
+        self.remote_server = remote_server
+        self.rules = rules
+        self._tools = None
+        self._idle = None
+        self._executor = None
+    
+    @property
+    def tools(self) -> list:
+        """The pool's LanguageTool clients, started on first access."""
+        if self._tools is None:
+            with stage("grammar.start_language_tool"):
+                tools = self._start_tools()
+            self._idle = queue.Queue()
+            for tool in tools:
+                self.rules.apply(tool)
+                self._idle.put(tool)
+            self._tools = tools
+        return self._tools
+    
+    def _start_tools(self) -> list:
+        """Create the clients for the pool's mode."""
+        import language_tool_python
+        
+        if self.remote_server is not None:
+            return [
+                language_tool_python.LanguageTool(self.language, remote_server=self.remote_server)
+                for _ in range(self.size)
+            ]
+        
+        first = start_server(self.language)
+        if self.mode == "servers":
+            others = [start_server(self.language) for _ in range(self.size - 1)]
+        else:
+            url = server_url(first)
+            others = [
+                language_tool_python.LanguageTool(self.language, remote_server=url)
+                for _ in range(self.size - 1)
+            ]
+        return [first] + others
+    
+    def check(self, text: str, rules: Optional[RuleProfile] = None) -> list:
+        """Check text with one client of the pool.
+        
+        Args:
+            text: The text to check
+            rules: Rules for this check only (default: the pool's)
+            
+        Returns:
+            LanguageTool matches, with offsets into ``text``
+        """
+        if self._tools is None:
+            self.tools  # start the clients
+        tool = self._idle.get()
+        try:
+            if rules is None:
+                return tool.check(text)
+            # The rules are sent with each request, so switching is cheap
+            rules.apply(tool)
+            try:
+                return tool.check(text)
+            finally:
+                self.rules.apply(tool)
+        finally:
+            self._idle.put(tool)
+    
+    def check_chunks(
+        self,
+        chunks: Sequence[Tuple[int, str]],
+        rules: Optional[RuleProfile] = None
+    ) -> List[Tuple[int, object]]:
+        """Check chunks of a text in parallel.
+        
+        Args:
+            chunks: (offset, chunk) pairs, such as from ``split_chunks``
+            rules: Rules for this check only (default: the pool's)
+            
+        Returns:
+            (offset, match) pairs in chunk order, where ``offset`` is the
+            start of the match's chunk; the match's position in the whole
+            text is ``offset + match.offset``
+        """
+        chunks = [(offset, chunk) for offset, chunk in chunks if chunk.strip()]
+        if len(chunks) == 1 or self.size == 1:
+            return [
+                (offset, match) for offset, chunk in chunks for match in self.check(chunk, rules)
+            ]
+        
+        if self._tools is None:
+            self.tools  # start the clients here, not in each worker thread
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.size, thread_name_prefix="language-tool"
+            )
+        
+        matches = self._executor.map(
+            lambda chunk: self.check(chunk, rules), [chunk for _, chunk in chunks]
+        )
+        return [
+            (offset, match)
+            for (offset, _), chunk_matches in zip(chunks, matches)
+            for match in chunk_matches
+        ]
+    
+    def close(self):
+        """Stop the worker threads and the clients' local servers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._tools is not None:
+            for tool in self._tools:
+                tool.close()
+            self._tools = None
+            self._idle = None
@@ -0,0 +1,74 @@
+# WARNING: template code, may need edits
+"""Single-pass matching of many phrases at once."""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, Iterator, Optional
+
+DEFAULT_WORDY_PHRASES = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "wordy_phrases.json"
+)
+
+
+def load_phrase_dictionary(path: Optional[str] = None) -> Dict[str, str]:
+    """Load a phrase -> replacement mapping from a JSON file.
+    
+    Args:
+        path: JSON file with an object of phrases and their replacements
+            (default: the bundled wordy phrase list)
+        
+    Returns:
+        Dictionary keyed by lowercased phrase
+    """
+    with open(path or DEFAULT_WORDY_PHRASES, "r", encoding="utf-8") as f:
+        phrases = json.load(f)
+    return {phrase.lower(): replacement for phrase, replacement in phrases.items()}
+
+
+class PhraseMatcher:
+    """Finds any of a set of phrases in one scan of the text.
+    
+    The phrases are compiled into a single regular expression shaped like
+    a character trie, so the work done at each text position depends on
+    the length of the matching phrase rather than the number of phrases.
+    Matching is case-insensitive, respects word boundaries and prefers the
+    longest phrase starting at a position.
+    """
+    
+    def __init__(self, phrases: Iterable[str]):
+        """Compile the phrases.
+        
+        Args:
+            phrases: Phrases to match
+        """
+        trie = {}
+        for phrase in phrases:
+            node = trie
+            for char in phrase.lower():
+                node = node.setdefault(char, {})
+            node[""] = {}
+        
+        body = self._trie_pattern(trie) if trie else "(?!)"
+        self.pattern = re.compile(r"\b(?:" + body + r")\b", re.IGNORECASE)
+    
+    def finditer(self, text: str) -> Iterator["re.Match"]:
+        """Iterate over non-overlapping phrase matches in text order."""
+        return self.pattern.finditer(text)
+    
+    def _trie_pattern(self, node: dict) -> str:
+        """Build the regex for a trie node; longer continuations come first."""
+        branches = [
+            re.escape(char) + self._trie_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        
+        is_end = "" in node
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_end else group
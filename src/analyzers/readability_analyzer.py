@@ -1,16 +1,66 @@
 # WARNING: template code, may need edits
 """Readability and text statistics analysis."""
 
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional, Set, Tuple
+
+import pyphen
 import textstat
-from typing import Dict, Any
+
+
+# Statistics that are plain counts and can be summed across parts of a text
+COUNT_KEYS = (
+    'word_count', 'sentence_count', 'character_count',
+    'syllable_count', 'difficult_words', 'polysyllable_count', 'letter_count'
+)
+
+_WORD = re.compile(r"\w+")
+# Sentence-ending punctuation (with closing quotes or brackets) before a
+# space, or a blank line, which also ends headings and list items
+_SENTENCE_END = re.compile(r"[.!?]+[\"'’”)\]]*(?=\s|$)|\n[ \t]*\n")
+
+
+def _load_easy_words() -> Set[str]:
+    """Dale-Chall list of easy words shipped with textstat."""
+    path = os.path.join(os.path.dirname(textstat.__file__), "resources", "en", "easy_words.txt")
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
 
 
 class ReadabilityAnalyzer:
-    """Analyzes text readability and provides statistics."""
+    """Analyzes text readability and provides statistics.
+    
+    All statistics are derived from a handful of counts (words, sentences,
+    syllables, difficult words, ...) gathered in a single pass over the
+    text's words. Syllables and word difficulty are looked up per distinct
+    word in a table that is kept between calls.
+    """
+    
+    def __init__(self, extra_indices: bool = False):
+        """Initialize the readability analyzer.
+        
+        Args:
+            extra_indices: Also report the SMOG, Coleman-Liau and automated
+                readability indices
+        """
+        self.extra_indices = extra_indices
+        self._pyphen = pyphen.Pyphen(lang="en_US")
+        self._easy_words = _load_easy_words()
+        # Word -> (syllables, letters, difficult)
+        self._word_table: Dict[str, Tuple[int, int, bool]] = {}
     
     def analyze(self, text: str) -> Dict[str, Any]:
         """Calculate readability metrics.
         
+        Words are runs of letters and digits, so contractions and
+        hyphenated compounds count as their parts, the way spaCy tokenizes
+        them. Sentences end at end punctuation and blank lines. Both are
+        found with regular expressions rather than taken from a spaCy doc,
+        so the statistics do not depend on which other analyzers run.
+        
         Args:
             text: The text to analyze
             
@@ -20,20 +70,123 @@ class ReadabilityAnalyzer:
         if not text or not text.strip():
             return {}
         
+        counts = self._count_text(text)
+        counts['character_count'] = len(text)
+        
+        if not counts['word_count']:
+            return {}
+        
+        return self._statistics(counts)
+    
+    def difficult_words(self, text: str) -> Set[str]:
+        """Find the distinct difficult words of a text.
+        
+        Args:
+            text: The text to check
+            
+        Returns:
+            The lowercased words counted in its ``difficult_words`` statistic
+        """
+        return {word for word in set(_WORD.findall(text.lower())) if self._word_info(word)[2]}
+    
+    def combine(
+        self,
+        parts: Iterable[Dict[str, Any]],
+        difficult_words: Optional[Set[str]] = None
+    ) -> Dict[str, Any]:
+        """Combine statistics of separately analyzed parts of one text.
+        
+        Counts are summed and the derived metrics are recomputed from the
+        totals. Each part counts a difficult word once, so a word that is
+        difficult in several parts is counted more than once unless the
+        distinct difficult words of the whole text are given.
+        
+        Args:
+            parts: Statistics dictionaries returned by ``analyze``
+            difficult_words: Optional union of ``difficult_words`` of the
+                parts, which makes the combined count exact
+            
+        Returns:
+            Dictionary of readability statistics for the whole text
+        """
+        parts = [part for part in parts if part]
+        if not parts:
+            return {}
+        
+        counts = {key: sum(part.get(key, 0) for part in parts) for key in COUNT_KEYS}
+        if difficult_words is not None:
+            counts['difficult_words'] = len(difficult_words)
+        return self._statistics(counts)
+    
+    def _count_text(self, text: str) -> Dict[str, int]:
+        """Count words and sentences with regular expressions."""
+        words = Counter(_WORD.findall(text.lower()))
+        sentences = sum(
+            1 for sentence in _SENTENCE_END.split(text) if _WORD.search(sentence)
+        )
+        return self._count_words(words, sentences)
+    
+    def _count_words(self, words: Counter, sentences: int) -> Dict[str, int]:
+        """Turn word frequencies into the summable counts."""
+        counts = {
+            'word_count': 0,
+            'sentence_count': sentences,
+            'syllable_count': 0,
+            'difficult_words': 0,
+            'polysyllable_count': 0,
+            'letter_count': 0,
+        }
+        
+        for word, frequency in words.items():
+            syllables, letters, difficult = self._word_info(word)
+            counts['word_count'] += frequency
+            counts['syllable_count'] += syllables * frequency
+            counts['letter_count'] += letters * frequency
+            if syllables >= 3:
+                counts['polysyllable_count'] += frequency
+            # Like textstat, each difficult word is counted once
+            counts['difficult_words'] += difficult
+        
+        return counts
+    
+    def _word_info(self, word: str) -> Tuple[int, int, bool]:
+        """Syllables, letters and difficulty of a lowercased word."""
+        info = self._word_table.get(word)
+        if info is None:
+            syllables = len(self._pyphen.positions(word)) + 1
+            difficult = syllables >= 2 and word not in self._easy_words
+            info = (syllables, len(word), difficult)
+            self._word_table[word] = info
+        return info
+    
+    def _statistics(self, counts: Dict[str, int]) -> Dict[str, Any]:
+        """Derive the readability metrics from summed counts."""
+        words = counts['word_count']
+        sentences = counts['sentence_count']
+        
+        words_per_sentence = words / sentences if sentences else 0.0
+        syllables_per_word = counts['syllable_count'] / words if words else 0.0
+        
         stats = {
-            'word_count': textstat.lexicon_count(text, removepunct=True),
-            'sentence_count': textstat.sentence_count(text),
-            'character_count': len(text),
-            'syllable_count': textstat.syllable_count(text),
-            'avg_sentence_length': self._safe_divide(
-                textstat.lexicon_count(text, removepunct=True),
-                textstat.sentence_count(text)
+            'word_count': words,
+            'sentence_count': sentences,
+            'character_count': counts['character_count'],
+            'syllable_count': counts['syllable_count'],
+            'avg_sentence_length': self._safe_divide(words, sentences),
+            'flesch_reading_ease': round(
+                206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 2
             ),
-            'flesch_reading_ease': textstat.flesch_reading_ease(text),
-            'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
-            'difficult_words': textstat.difficult_words(text),
+            'flesch_kincaid_grade': round(
+                0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 1
+            ),
+            'difficult_words': counts['difficult_words'],
+            'polysyllable_count': counts['polysyllable_count'],
+            'letter_count': counts['letter_count'],
         }
         
+        if self.extra_indices:
+            stats.update(self._extra_indices(counts))
+        
         # Add interpretation
         stats['reading_level'] = self._interpret_reading_level(
             stats['flesch_kincaid_grade']
@@ -44,6 +197,33 @@ class ReadabilityAnalyzer:
         
         return stats
     
+    def _extra_indices(self, counts: Dict[str, int]) -> Dict[str, float]:
+        """SMOG, Coleman-Liau and automated readability indices."""
+        words = counts['word_count']
+        sentences = counts['sentence_count']
+        letters = counts['letter_count']
+        
+        # SMOG is only defined for three or more sentences
+        smog = 0.0
+        if sentences >= 3:
+            smog = round(
+                1.043 * math.sqrt(30 * counts['polysyllable_count'] / sentences) + 3.1291, 1
+            )
+        
+        letters_per_word = letters / words if words else 0.0
+        sentences_per_word = sentences / words if words else 0.0
+        words_per_sentence = words / sentences if sentences else 0.0
+        
+        return {
+            'smog_index': smog,
+            'coleman_liau_index': round(
+                5.88 * letters_per_word - 29.6 * sentences_per_word - 15.8, 2
+            ),
+            'automated_readability_index': round(
+                4.71 * letters_per_word + 0.5 * words_per_sentence - 21.43, 1
+            ),
+        }
+    
     def _safe_divide(self, numerator: float, denominator: float) -> float:
         """Safely divide two numbers."""
         if denominator == 0:
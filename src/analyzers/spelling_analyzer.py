@@ -2,92 +2,207 @@
 """Spelling analysis using pyspellchecker."""
 
 from spellchecker import SpellChecker
-from typing import List
+from typing import List, Optional
+import os
 import re
+from src.cache import LRUCache
+from src.deadline import Deadline
 from src.models.issue import Issue, IssueType, Severity
+from src.profiling import stage
+
+# Words of letters only, like spaCy's alphabetic tokens
+_WORD = re.compile(r"\b[^\W\d_]+\b")
+
+# Returned by candidate searches that ran out of time
+_OUT_OF_TIME = object()
 
 
 class SpellingAnalyzer:
     """Analyzes text for spelling errors."""
     
-    def __init__(self):
-        """Initialize the spelling analyzer."""
-        self.spell = SpellChecker()
+    def __init__(
+        self,
+        suggestion_cache_size: int = 10000,
+        suggestion_cache_path: Optional[str] = None,
+        suggestion_cache: Optional[LRUCache] = None,
+        use_symspell: bool = False,
+        symspell_index_path: Optional[str] = None
+    ):
+        """Initialize the spelling analyzer.
+        
+        The dictionary is loaded the first time text is checked.
+        
+        Args:
+            suggestion_cache_size: Number of misspelled words whose
+                suggestions are remembered across ``analyze`` calls
+            suggestion_cache_path: Optional JSON file to load remembered
+                suggestions from and save them to
+            suggestion_cache: Existing cache to share between analyzers.
+                Suggestions are stored under the engine that found them,
+                so analyzers using different engines can share a cache.
+            use_symspell: Look suggestions up in a precomputed
+                symmetric-delete index instead of generating edits
+            symspell_index_path: File the index is loaded from, or built
+                and saved to on first use (implies ``use_symspell``)
+        """
+        self._spell = None
+        self._symspell = None
+        self.use_symspell = use_symspell or symspell_index_path is not None
+        self.symspell_index_path = symspell_index_path
+        if suggestion_cache is None:
+            suggestion_cache = LRUCache(suggestion_cache_size, suggestion_cache_path)
+        self.suggestion_cache = suggestion_cache
+    
+    @property
+    def engine(self) -> str:
+        """Name of the suggestion engine, "symspell" or "candidates"."""
+        return "symspell" if self.use_symspell else "candidates"
+    
+    @property
+    def spell(self) -> SpellChecker:
+        """Spell checker dictionary, loaded on first access."""
+        if self._spell is None:
+            with stage("spelling.load_dictionary"):
+                self._spell = SpellChecker()
+        return self._spell
+    
+    @property
+    def symspell(self):
+        """Symmetric-delete index, loaded or built on first access."""
+        if self._symspell is None:
+            from src.analyzers.symspell import SymSpellIndex
+            
+            path = self.symspell_index_path
+            if path and os.path.exists(path):
+                self._symspell = SymSpellIndex.load(path)
+            else:
+                self._symspell = SymSpellIndex.build(
+                    self.spell.word_frequency.dictionary
+                )
+                if path:
+                    self._symspell.save(path)
+        return self._symspell
     
-    def analyze(self, text: str, doc=None) -> List[Issue]:
+    def analyze(self, text: str, deadline: Optional[Deadline] = None) -> List[Issue]:
         """Analyze text for spelling issues.
         
+        Words are runs of letters, found with a regular expression rather
+        than taken from a spaCy doc, so the issues do not depend on which
+        other analyzers run.
+        
         Args:
             text: The text to analyze
-            doc: Optional spaCy doc object for better tokenization
+            deadline: Optional time budget; once it is used up only
+                remembered suggestions are used, words without one are not
+                reported, and the analysis is marked truncated
             
         Returns:
             List of spelling-related issues
         """
         issues = []
         
-        # Use spaCy tokens if available, otherwise split by words
-        if doc:
-            words = [(token.text, token.idx) for token in doc if token.is_alpha]
-        else:
-            words = [(m.group(), m.start()) for m in re.finditer(r'\b[a-zA-Z]+\b', text)]
+        words = [(m.group(), m.start()) for m in _WORD.finditer(text)]
+        
+        # Skip very short words; remember each occurrence's lowercased type
+        occurrences = [
+            (word, position, word.lower())
+            for word, position in words
+            if len(word) > 2
+        ]
         
-        for word, position in words:
-            # Skip very short words and proper nouns (capitalized)
-            if len(word) <= 2:
+        # Check every distinct word type against the dictionary at once
+        word_types = {word_lower for _, _, word_lower in occurrences}
+        misspelled = word_types.difference(self.spell.word_frequency.dictionary)
+        if not misspelled:
+            return issues
+        
+        # Get suggestions once per misspelled type; every occurrence shares
+        # the joined string. Short words have fewer edits to try, so under a
+        # deadline as many words as possible get their suggestions.
+        suggestions = {}
+        for word_lower in sorted(misspelled, key=lambda word: (len(word), word)):
+            suggestion_list = self.suggest(word_lower, deadline)
+            if suggestion_list is None:
+                # Out of time before the suggestions were found
+                deadline.truncate("spelling")
                 continue
+            if suggestion_list:
+                suggestions[word_lower] = ", ".join(suggestion_list)
+        
+        for word, position, word_lower in occurrences:
+            suggestion_text = suggestions.get(word_lower)
             
-            word_lower = word.lower()
-            
-            # Check if misspelled
-            if word_lower not in self.spell:
-                # Get suggestions
-                suggestions = self.spell.candidates(word_lower)
+            if suggestion_text:
+                issue = Issue(
+                    issue_type=IssueType.SPELLING,
+                    severity=Severity.ERROR,
+                    position=position,
+                    length=len(word),
+                    source=text,
+                    suggested_fix=suggestion_text,
+                    rule_id="SPELLING",
+                    params=(word, suggestion_text)
+                )
                 
-                if suggestions:
-                    suggestion_list = list(suggestions)[:3]  # Top 3 suggestions
-                    
-                    issue = Issue(
-                        issue_type=IssueType.SPELLING,
-                        severity=Severity.ERROR,
-                        position=position,
-                        length=len(word),
-                        message=f"Possible spelling error: '{word}'",
-                        explanation=f"The word '{word}' may be misspelled. Did you mean one of these?",
-                        learning_tip=self._create_spelling_tip(word, suggestion_list),
-                        context=self._get_context(text, position, len(word)),
-                        suggested_fix=", ".join(suggestion_list)
-                    )
-                    
-                    issues.append(issue)
+                issues.append(issue)
         
         return issues
     
-    def _get_context(self, text: str, offset: int, length: int, window: int = 30) -> str:
-        """Extract context around the error."""
-        start = max(0, offset - window)
-        end = min(len(text), offset + length + window)
-        
-        context = text[start:end]
-        error_start = offset - start
-        error_end = error_start + length
-        
-        highlighted = (
-            context[:error_start] + 
-            ">>>" + context[error_start:error_end] + "<<<" + 
-            context[error_end:]
-        )
-        
-        return highlighted.strip()
+    def suggest(self, word: str, deadline: Optional[Deadline] = None) -> Optional[List[str]]:
+        """Return up to three suggestions for a lowercased misspelled word.
+        
+        Candidate generation is expensive, so results are memoized and a
+        repeated misspelling costs a single cache lookup. With a deadline,
+        returns None if it passes before the suggestions are found.
+        """
+        key = f"{self.engine}:{word}"
+        suggestions = self.suggestion_cache.get(key)
+        if suggestions is None:
+            if deadline is not None and deadline.expired():
+                return None
+            with stage("spelling.candidates"):
+                if self.use_symspell:
+                    suggestions = self.symspell.lookup(word, max_suggestions=3)
+                else:
+                    candidates = self._candidates(word, deadline)
+                    if candidates is _OUT_OF_TIME:
+                        return None
+                    suggestions = list(candidates)[:3] if candidates else []  # Top 3 suggestions
+            self.suggestion_cache.put(key, suggestions)
+        return suggestions
     
-    def _create_spelling_tip(self, word: str, suggestions: List[str]) -> str:
-        """Create an educational tip for spelling."""
-        base_tip = "When unsure about spelling, try these strategies:\n"
-        base_tip += "1. Break the word into syllables and sound it out\n"
-        base_tip += "2. Look for common prefixes and suffixes\n"
-        base_tip += "3. Remember similar words you know how to spell\n"
+    def _candidates(self, word: str, deadline: Optional[Deadline] = None):
+        """``SpellChecker.candidates``, giving up when the deadline passes.
         
-        if suggestions:
-            base_tip += f"\nFor '{word}', consider: {', '.join(suggestions)}"
+        The distance-2 search can take a second for a long word. With a
+        deadline it is done one distance-1 edit at a time, checking the
+        deadline in between; the candidates are collected in the same
+        order as ``SpellChecker.candidates`` does, so the same suggestions
+        come first.
         
-        return base_tip
+        Returns:
+            The candidate set, None if there are none, or ``_OUT_OF_TIME``
+        """
+        spell = self.spell
+        if deadline is None or spell.known([word]):
+            return spell.candidates(word)
+        
+        edits = list(spell.edit_distance_1(word))
+        if edits == [word]:
+            # A word the spell checker does not check (such as a very long one)
+            return spell.candidates(word)
+        
+        found = spell.known(edits)
+        if found or spell.distance != 2:
+            return found or None
+        
+        second = []
+        for edit in edits:
+            if deadline.expired():
+                return _OUT_OF_TIME
+            second.extend(spell.known(spell.edit_distance_1(edit)))
+        return spell.known(second) or None
+    
+    def save_suggestions(self):
+        """Persist remembered suggestions if a cache path was given."""
+        self.suggestion_cache.save()
@@ -1,21 +1,55 @@
 # WARNING: template code, may need edits
 """Style and clarity analysis."""
 
-from typing import List
-import re
+from typing import List, Optional
+
+import numpy as np
+
+from src.analyzers.phrase_matcher import PhraseMatcher, load_phrase_dictionary
+from src.analyzers.token_arrays import TokenArrays
+from src.deadline import Deadline
 from src.models.issue import Issue, IssueType, Severity
+from src.profiling import stage
+
+# Characters of context shown on each side of a flagged word or phrase
+_CONTEXT_WINDOW = 40
 
 
 class StyleAnalyzer:
     """Analyzes text for style and clarity issues."""
     
-    def __init__(self, nlp):
+    def __init__(
+        self,
+        nlp,
+        wordy_phrases_path: Optional[str] = None,
+        repeat_window: int = 10,
+        repeat_key: str = "word",
+        repeat_scope: str = "document"
+    ):
         """Initialize the style analyzer.
         
         Args:
             nlp: spaCy language model
+            wordy_phrases_path: JSON file mapping wordy phrases to simpler
+                replacements (default: the bundled list)
+            repeat_window: Content words closer than this many content
+                words apart are reported as repeated
+            repeat_key: Compare repeated words by "word" or by "lemma"
+            repeat_scope: Look for repeats across the whole "document", or
+                only within a "paragraph" or "sentence"
         """
+        if repeat_key not in ("word", "lemma"):
+            raise ValueError(f"repeat_key must be 'word' or 'lemma', not {repeat_key!r}")
+        if repeat_scope not in ("document", "paragraph", "sentence"):
+            raise ValueError(
+                f"repeat_scope must be 'document', 'paragraph' or 'sentence', "
+                f"not {repeat_scope!r}"
+            )
+        
         self.nlp = nlp
+        self.repeat_window = repeat_window
+        self.repeat_key = repeat_key
+        self.repeat_scope = repeat_scope
         
         # Common weak words and phrases
         self.weak_words = [
@@ -26,80 +60,114 @@ class StyleAnalyzer:
         # Passive voice indicators
         self.passive_indicators = ['was', 'were', 'been', 'being', 'is', 'are', 'am']
         
-        # Wordy phrases
-        self.wordy_phrases = {
-            'in order to': 'to',
-            'due to the fact that': 'because',
-            'at this point in time': 'now',
-            'for the purpose of': 'for',
-            'in the event that': 'if',
-            'with regard to': 'about',
-        }
+        # Wordy phrases, compiled into a single matcher
+        self.wordy_phrases = load_phrase_dictionary(wordy_phrases_path)
+        self.wordy_phrase_matcher = PhraseMatcher(self.wordy_phrases)
     
-    def analyze(self, text: str, doc) -> List[Issue]:
+    def analyze(
+        self,
+        text: str,
+        doc,
+        tokens: Optional[TokenArrays] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[Issue]:
         """Analyze text for style issues.
         
         Args:
             text: The text to analyze
             doc: spaCy doc object
+            tokens: Optional token arrays of ``doc``, if already built
+            deadline: Optional time budget; once it is used up the
+                remaining checks are skipped and the analysis is marked
+                truncated
             
         Returns:
             List of style-related issues
         """
         issues = []
+        if tokens is None:
+            tokens = TokenArrays(doc)
         
-        issues.extend(self._check_weak_words(text, doc))
-        issues.extend(self._check_passive_voice(text, doc))
-        issues.extend(self._check_wordy_phrases(text))
-        issues.extend(self._check_sentence_length(doc))
-        issues.extend(self._check_repeated_words(text, doc))
+        checks = (
+            ("style.weak_words", lambda: self._check_weak_words(text, doc, tokens)),
+            ("style.passive_voice", lambda: self._check_passive_voice(text, doc, tokens)),
+            ("style.wordy_phrases", lambda: self._check_wordy_phrases(text)),
+            ("style.sentence_length", lambda: self._check_sentence_length(doc, tokens)),
+            ("style.repeated_words", lambda: self._check_repeated_words(text, doc, tokens)),
+        )
+        for name, check in checks:
+            if deadline is not None and deadline.expired():
+                deadline.truncate("style")
+                break
+            with stage(name):
+                issues.extend(check())
         
         return issues
     
-    def _check_weak_words(self, text: str, doc) -> List[Issue]:
+    def _check_weak_words(self, text: str, doc, tokens: Optional[TokenArrays] = None) -> List[Issue]:
         """Check for weak intensifiers and filler words."""
         issues = []
+        if tokens is None:
+            tokens = TokenArrays(doc)
+        
+        weak_ids = self._string_ids(doc, self.weak_words)
+        hits = np.flatnonzero(np.isin(tokens.lower, weak_ids))
         
-        for token in doc:
-            if token.text.lower() in self.weak_words:
-                issue = Issue(
-                    issue_type=IssueType.WORD_CHOICE,
-                    severity=Severity.SUGGESTION,
-                    position=token.idx,
-                    length=len(token.text),
-                    message=f"Weak word: '{token.text}'",
-                    explanation=f"The word '{token.text}' is a weak intensifier that often adds little meaning.",
-                    learning_tip="Try removing this word or replacing it with a more specific, stronger word. Ask yourself: Does this word add meaningful information?",
-                    context=self._get_context(text, token.idx, len(token.text)),
-                    suggested_fix="Consider removing or replacing"
-                )
-                issues.append(issue)
+        for i in hits.tolist():
+            token = doc[i]
+            issue = Issue(
+                issue_type=IssueType.WORD_CHOICE,
+                severity=Severity.SUGGESTION,
+                position=token.idx,
+                length=len(token.text),
+                source=text,
+                window=_CONTEXT_WINDOW,
+                suggested_fix="Consider removing or replacing",
+                rule_id="WEAK_WORD",
+                params=(token.text,)
+            )
+            issues.append(issue)
         
         return issues
     
-    def _check_passive_voice(self, text: str, doc) -> List[Issue]:
-        """Check for passive voice constructions."""
+    def _check_passive_voice(self, text: str, doc, tokens: Optional[TokenArrays] = None) -> List[Issue]:
+        """Check for passive voice constructions.
+        
+        Reports the first auxiliary verb followed by a past participle in
+        each sentence.
+        """
         issues = []
+        if tokens is None:
+            tokens = TokenArrays(doc)
+        if len(tokens) < 2:
+            return issues
+        
+        indicator_ids = self._string_ids(doc, self.passive_indicators)
+        vbn_id = doc.vocab.strings['VBN']  # Past participle
         
-        for sent in doc.sents:
-            # Look for passive voice pattern: auxiliary verb + past participle
-            for i, token in enumerate(sent):
-                if token.lemma_ in self.passive_indicators and i + 1 < len(sent):
-                    next_token = sent[i + 1]
-                    if next_token.tag_ == 'VBN':  # Past participle
-                        issue = Issue(
-                            issue_type=IssueType.STYLE,
-                            severity=Severity.SUGGESTION,
-                            position=token.idx,
-                            length=next_token.idx + len(next_token.text) - token.idx,
-                            message="Possible passive voice",
-                            explanation="This sentence may be in passive voice, which can make writing less direct and engaging.",
-                            learning_tip="Active voice tip: Identify who/what is performing the action and make them the subject. Example: 'The ball was thrown by John' 17 'John threw the ball'",
-                            context=sent.text,
-                            suggested_fix="Consider rewriting in active voice"
-                        )
-                        issues.append(issue)
-                        break
+        # Auxiliary at i, past participle at i + 1 in the same sentence
+        candidates = (
+            np.isin(tokens.lemma[:-1], indicator_ids)
+            & (tokens.tag[1:] == vbn_id)
+            & ~tokens.sent_start[1:]
+        )
+        hits = np.flatnonzero(candidates)
+        _, first = np.unique(tokens.sent_id[hits], return_index=True)
+        doc_text = doc.text
+        
+        for i in hits[first].tolist():
+            token, next_token = doc[i], doc[i + 1]
+            start_char, end_char = tokens.sentence_chars(tokens.sent_id[i])
+            issue = Issue(
+                issue_type=IssueType.STYLE,
+                severity=Severity.SUGGESTION,
+                position=token.idx,
+                length=next_token.idx + len(next_token.text) - token.idx,
+                context=doc_text[start_char:end_char],
+                suggested_fix="Consider rewriting in active voice",
+                rule_id="PASSIVE_VOICE"
+            )
+            issues.append(issue)
         
         return issues
     
@@ -107,90 +175,124 @@ class StyleAnalyzer:
         """Check for wordy phrases that can be simplified."""
         issues = []
         
-        for phrase, replacement in self.wordy_phrases.items():
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
+        for match in self.wordy_phrase_matcher.finditer(text):
+            phrase = match.group().lower()
+            replacement = self.wordy_phrases[phrase]
             
-            for match in pattern.finditer(text):
-                issue = Issue(
-                    issue_type=IssueType.CLARITY,
-                    severity=Severity.SUGGESTION,
-                    position=match.start(),
-                    length=len(match.group()),
-                    message=f"Wordy phrase: '{match.group()}'",
-                    explanation=f"The phrase '{match.group()}' can be simplified to make your writing more concise.",
-                    learning_tip=f"Conciseness tip: Replace '{phrase}' with '{replacement}'. Simpler phrases make your writing clearer and more direct.",
-                    context=self._get_context(text, match.start(), len(match.group())),
-                    suggested_fix=replacement
-                )
-                issues.append(issue)
+            issue = Issue(
+                issue_type=IssueType.CLARITY,
+                severity=Severity.SUGGESTION,
+                position=match.start(),
+                length=len(match.group()),
+                source=text,
+                window=_CONTEXT_WINDOW,
+                suggested_fix=replacement,
+                rule_id="WORDY_PHRASE",
+                params=(match.group(), phrase, replacement)
+            )
+            issues.append(issue)
         
         return issues
     
-    def _check_sentence_length(self, doc) -> List[Issue]:
+    def _check_sentence_length(self, doc, tokens: Optional[TokenArrays] = None) -> List[Issue]:
         """Check for overly long sentences."""
         issues = []
+        if tokens is None:
+            tokens = TokenArrays(doc)
         
-        for sent in doc.sents:
-            word_count = len([token for token in sent if not token.is_punct])
-            
-            if word_count > 30:
-                issue = Issue(
-                    issue_type=IssueType.CLARITY,
-                    severity=Severity.WARNING,
-                    position=sent.start_char,
-                    length=len(sent.text),
-                    message=f"Long sentence ({word_count} words)",
-                    explanation="This sentence is quite long and may be hard to follow.",
-                    learning_tip="Long sentence tip: Try breaking this into 2-3 shorter sentences. Look for natural break points like 'and', 'but', or semicolons. Each sentence should express one main idea.",
-                    context=sent.text[:100] + "..." if len(sent.text) > 100 else sent.text,
-                    suggested_fix="Consider breaking into shorter sentences"
-                )
-                issues.append(issue)
+        word_counts = np.bincount(
+            tokens.sent_id, weights=~tokens.is_punct, minlength=len(tokens.sent_starts)
+        ).astype(np.int64)
+        doc_text = doc.text
+        
+        for sent_id in np.flatnonzero(word_counts > 30).tolist():
+            word_count = int(word_counts[sent_id])
+            start_char, end_char = tokens.sentence_chars(sent_id)
+            sent_text = doc_text[start_char:end_char]
+            issue = Issue(
+                issue_type=IssueType.CLARITY,
+                severity=Severity.WARNING,
+                position=start_char,
+                length=len(sent_text),
+                context=sent_text[:100] + "..." if len(sent_text) > 100 else sent_text,
+                suggested_fix="Consider breaking into shorter sentences",
+                rule_id="LONG_SENTENCE",
+                params=(word_count,)
+            )
+            issues.append(issue)
         
         return issues
     
-    def _check_repeated_words(self, text: str, doc) -> List[Issue]:
-        """Check for repeated words in close proximity."""
+    def _check_repeated_words(self, text: str, doc, tokens: Optional[TokenArrays] = None) -> List[Issue]:
+        """Check for repeated words in close proximity.
+        
+        Content words are stably sorted by (scope, key), which puts every
+        occurrence right after the previous occurrence of the same word in
+        the same scope; comparing neighbours then finds all repeats at once.
+        """
         issues = []
-        window_size = 10
+        if tokens is None:
+            tokens = TokenArrays(doc)
         
-        tokens = [token for token in doc if token.is_alpha and not token.is_stop]
+        content = np.flatnonzero(tokens.is_alpha & ~tokens.is_stop)
+        if len(content) < 2:
+            return issues
         
-        for i, token in enumerate(tokens):
-            word_lower = token.text.lower()
-            
-            # Check next few tokens
-            for j in range(i + 1, min(i + window_size, len(tokens))):
-                if tokens[j].text.lower() == word_lower:
-                    issue = Issue(
-                        issue_type=IssueType.STYLE,
-                        severity=Severity.SUGGESTION,
-                        position=tokens[j].idx,
-                        length=len(tokens[j].text),
-                        message=f"Repeated word: '{token.text}'",
-                        explanation=f"The word '{token.text}' appears multiple times in close proximity.",
-                        learning_tip="Repetition tip: Use synonyms or rephrase to avoid repetition. This makes your writing more engaging and professional.",
-                        context=self._get_context(text, tokens[j].idx, len(tokens[j].text)),
-                        suggested_fix="Consider using a synonym"
-                    )
-                    issues.append(issue)
-                    break
+        if self.repeat_key == "lemma":
+            keys = self._lowercase_keys(doc, tokens.lemma[content])
+        else:
+            keys = tokens.lower[content]
+        scopes = self._repeat_scopes(doc, tokens)[content]
+        
+        order = np.lexsort((keys, scopes))
+        same = (keys[order[1:]] == keys[order[:-1]]) & (scopes[order[1:]] == scopes[order[:-1]])
+        current = order[1:][same]
+        previous = order[:-1][same]
+        
+        # Distances are in content words, like the window
+        close = current - previous < self.repeat_window
+        current, previous = current[close], previous[close]
+        by_position = np.argsort(current)
+        
+        for j, k in zip(current[by_position].tolist(), previous[by_position].tolist()):
+            token, first = doc[int(content[j])], doc[int(content[k])]
+            issue = Issue(
+                issue_type=IssueType.STYLE,
+                severity=Severity.SUGGESTION,
+                position=token.idx,
+                length=len(token.text),
+                source=text,
+                window=_CONTEXT_WINDOW,
+                suggested_fix="Consider using a synonym",
+                rule_id="REPEATED_WORD",
+                params=(first.text,)
+            )
+            issues.append(issue)
         
         return issues
     
-    def _get_context(self, text: str, offset: int, length: int, window: int = 40) -> str:
-        """Extract context around the issue."""
-        start = max(0, offset - window)
-        end = min(len(text), offset + length + window)
-        
-        context = text[start:end]
-        error_start = offset - start
-        error_end = error_start + length
-        
-        highlighted = (
-            context[:error_start] + 
-            ">>>" + context[error_start:error_end] + "<<<" + 
-            context[error_end:]
-        )
-        
-        return highlighted.strip()
+    def _repeat_scopes(self, doc, tokens: TokenArrays) -> np.ndarray:
+        """Number each token by the sentence or paragraph it belongs to."""
+        if self.repeat_scope == "sentence":
+            return tokens.sent_id
+        if self.repeat_scope == "paragraph":
+            breaks = np.zeros(len(tokens), dtype=bool)
+            for i in np.flatnonzero(tokens.is_space).tolist():
+                breaks[i] = doc[i].text.count("\n") >= 2
+            return np.cumsum(breaks)
+        return np.zeros(len(tokens), dtype=np.int64)
+    
+    @staticmethod
+    def _string_ids(doc, words: List[str]) -> np.ndarray:
+        """Hash words the way spaCy stores them in the token arrays."""
+        strings = doc.vocab.strings
+        return np.array([strings[word] for word in words], dtype=np.uint64)
+    
+    @staticmethod
+    def _lowercase_keys(doc, hashes: np.ndarray) -> np.ndarray:
+        """Map string hashes to ids of their lowercased strings."""
+        strings = doc.vocab.strings
+        unique, inverse = np.unique(hashes, return_inverse=True)
+        ids = {}
+        lowered = [ids.setdefault(strings[int(h)].lower(), len(ids)) for h in unique.tolist()]
+        return np.array(lowered, dtype=np.int64)[inverse]
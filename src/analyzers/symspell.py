@@ -0,0 +1,239 @@
+# WARNING: template code, may need edits
+"""Symmetric-delete spelling suggestion index (SymSpell)."""
+
+import os
+import zlib
+from typing import Dict, List, Set
+
+import numpy as np
+
+# Bump when the on-disk layout changes
+INDEX_FORMAT = 1
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Return the word and every string reachable by deleting characters."""
+    result = {word}
+    frontier = {word}
+
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                next_frontier.add(item[:i] + item[i + 1:])
+        result |= next_frontier
+        frontier = next_frontier
+
+    return result
+
+
+def _hash(text: str) -> int:
+    """Stable 32-bit hash of a delete string."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Check for a single insertion, deletion, substitution or transposition."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > 1:
+        return False
+
+    i = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        i += 1
+
+    if len(a) != len(b):
+        return a[i + 1:] == b[i:]
+    if i == len(a):
+        return False
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return (i + 1 < len(a) and a[i] == b[i + 1] and a[i + 1] == b[i]
+            and a[i + 2:] == b[i + 2:])
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or ``max_distance + 1`` if larger.
+
+    Counts insertions, deletions, substitutions and adjacent
+    transpositions, the same edits pyspellchecker considers.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class SymSpellIndex:
+    """Precomputed deletion index for fast, frequency-ranked suggestions.
+
+    Every dictionary word is indexed under the deletes of its first
+    ``prefix_length`` characters. A lookup generates the deletes of the
+    misspelled word's prefix, collects the words sharing any of them and
+    verifies the true edit distance, so its cost does not depend on the
+    word length or the dictionary size. Deletes are stored as sorted
+    32-bit hashes; a hash collision only adds a candidate that fails the
+    distance check.
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        frequencies: np.ndarray,
+        keys: np.ndarray,
+        word_ids: np.ndarray,
+        max_distance: int = 2,
+        prefix_length: int = 7
+    ):
+        """Initialize the index from prebuilt arrays (see ``build``)."""
+        self.words = words
+        self.frequencies = frequencies
+        self.keys = keys
+        self.word_ids = word_ids
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.lengths = np.array([len(w) for w in words], dtype=np.int32)
+
+    @classmethod
+    def build(
+        cls,
+        word_frequencies: Dict[str, int],
+        max_distance: int = 2,
+        prefix_length: int = 7
+    ) -> "SymSpellIndex":
+        """Build an index from a word frequency dictionary.
+
+        Args:
+            word_frequencies: Mapping of dictionary words to frequencies
+            max_distance: Largest edit distance suggestions may have
+            prefix_length: Number of leading characters that are indexed
+
+        Returns:
+            The built index
+        """
+        words = sorted(word_frequencies)
+        frequencies = np.array([word_frequencies[w] for w in words], dtype=np.int64)
+
+        keys = []
+        word_ids = []
+        for word_id, word in enumerate(words):
+            for delete in _deletes(word[:prefix_length], max_distance):
+                keys.append(_hash(delete))
+                word_ids.append(word_id)
+
+        keys = np.array(keys, dtype=np.uint32)
+        word_ids = np.array(word_ids, dtype=np.int32)
+        order = np.argsort(keys, kind="stable")
+
+        return cls(words, frequencies, keys[order], word_ids[order],
+                   max_distance, prefix_length)
+
+    @classmethod
+    def load(cls, path: str) -> "SymSpellIndex":
+        """Load an index written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["format"]) != INDEX_FORMAT:
+                raise ValueError(f"Unsupported SymSpell index format in {path}")
+            return cls(
+                words=data["words"].tolist(),
+                frequencies=data["frequencies"],
+                keys=data["keys"],
+                word_ids=data["word_ids"],
+                max_distance=int(data["max_distance"]),
+                prefix_length=int(data["prefix_length"])
+            )
+
+    def save(self, path: str):
+        """Write the index to a compressed ``.npz`` file."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                format=INDEX_FORMAT,
+                words=np.array(self.words),
+                frequencies=self.frequencies,
+                keys=self.keys,
+                word_ids=self.word_ids,
+                max_distance=self.max_distance,
+                prefix_length=self.prefix_length
+            )
+
+    def lookup(self, word: str, max_suggestions: int = 3) -> List[str]:
+        """Return the closest dictionary words, most frequent first.
+
+        Like pyspellchecker's ``candidates``, only words at the smallest
+        edit distance found are returned.
+
+        Args:
+            word: Lowercased misspelled word
+            max_suggestions: Maximum number of suggestions
+
+        Returns:
+            Suggestions ranked by frequency (empty if none are close enough)
+        """
+        hashes = np.array(
+            [_hash(d) for d in _deletes(word[:self.prefix_length], self.max_distance)],
+            dtype=np.uint32
+        )
+        starts = np.searchsorted(self.keys, hashes, side="left")
+        ends = np.searchsorted(self.keys, hashes, side="right")
+
+        slices = [self.word_ids[start:end]
+                  for start, end in zip(starts.tolist(), ends.tolist()) if start != end]
+        if not slices:
+            return []
+
+        candidate_ids = np.unique(np.concatenate(slices))
+        close_length = np.abs(self.lengths[candidate_ids] - len(word)) <= self.max_distance
+        candidate_ids = candidate_ids[close_length]
+
+        candidate_ids = candidate_ids.tolist()
+
+        # Most misspellings are one edit away; find those with a cheap
+        # comparison and only fall back to the full distance if there are none
+        best = [i for i in candidate_ids
+                if self.words[i] != word and _within_one_edit(word, self.words[i])]
+        if best or self.max_distance < 2:
+            return self._rank(best, max_suggestions)
+
+        best_distance = self.max_distance + 1
+        for word_id in candidate_ids:
+            candidate = self.words[word_id]
+            if candidate == word:
+                continue
+            distance = edit_distance(word, candidate, best_distance)
+            if distance < best_distance:
+                best_distance = distance
+                best = [word_id]
+            elif distance == best_distance and distance <= self.max_distance:
+                best.append(word_id)
+
+        return self._rank(best, max_suggestions)
+
+    def _rank(self, word_ids: List[int], max_suggestions: int) -> List[str]:
+        """Order words by descending frequency and keep the best."""
+        word_ids = sorted(word_ids, key=lambda i: (-self.frequencies[i], self.words[i]))
+        return [self.words[i] for i in word_ids[:max_suggestions]]
@@ -0,0 +1,55 @@
+# WARNING: template code, may need edits
+"""Columnar view of a spaCy doc's token attributes."""
+
+from typing import Tuple
+
+import numpy as np
+
+# Exported with a single Doc.to_array call
+_ATTRS = ("LOWER", "LEMMA", "TAG", "IS_PUNCT", "IS_STOP", "IS_ALPHA",
+          "IS_SPACE", "SENT_START", "IDX", "LENGTH")
+
+
+class TokenArrays:
+    """Token attributes of a doc as NumPy arrays, one entry per token.
+
+    String attributes (``lower``, ``lemma``, ``tag``) hold spaCy string
+    hashes, so they can be compared against ``doc.vocab.strings[...]``
+    without creating Python strings for each token.
+    """
+
+    def __init__(self, doc):
+        """Export the attributes of ``doc``.
+
+        Args:
+            doc: spaCy doc with sentence boundaries
+        """
+        columns = doc.to_array(list(_ATTRS))
+        column = dict(zip(_ATTRS, columns.T))
+
+        self.lower = column["LOWER"]
+        self.lemma = column["LEMMA"]
+        self.tag = column["TAG"]
+        self.is_punct = column["IS_PUNCT"] == 1
+        self.is_stop = column["IS_STOP"] == 1
+        self.is_alpha = column["IS_ALPHA"] == 1
+        self.is_space = column["IS_SPACE"] == 1
+        self.idx = column["IDX"].astype(np.int64)
+        self.length = column["LENGTH"].astype(np.int64)
+
+        # SENT_START is 1 for a start, -1 (as uint64) otherwise
+        sent_start = column["SENT_START"] == 1
+        sent_start[:1] = True
+        self.sent_start = sent_start
+        self.sent_id = np.cumsum(sent_start) - 1
+        self.sent_starts = np.flatnonzero(sent_start)
+        self.sent_ends = np.append(self.sent_starts[1:], len(sent_start))
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def sentence_chars(self, sent_id: int) -> Tuple[int, int]:
+        """Character offsets of a sentence, like ``Span.start_char/end_char``."""
+        first = self.sent_starts[sent_id]
+        last = self.sent_ends[sent_id] - 1
+        return int(self.idx[first]), int(self.idx[last] + self.length[last])
@@ -0,0 +1,338 @@
+# WARNING: template code, may need edits
+"""Parallel batch analysis of many files with a pool of warm checkers."""
+
+import glob
+import multiprocessing
+import os
+import time
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.analyzers.language_tool_pool import server_url, start_server
+from src.checker import ParagraphChecker, select_analyzers
+from src.display import ResultDisplay
+
+
+# Checker used by the current worker process. When the "fork" start method
+# is available it is built once in the parent and inherited copy-on-write.
+_WORKER_CHECKER = None
+
+
+def collect_files(
+    paths: Iterable[str],
+    manifest: Optional[str] = None,
+    pattern: str = "*.txt"
+) -> List[Path]:
+    """Expand directories, globs and manifest entries into a list of files.
+
+    Args:
+        paths: Files, directories or glob patterns
+        manifest: Optional file listing one path per line
+        pattern: Filename pattern used when walking directories
+
+    Returns:
+        Sorted list of unique file paths
+    """
+    entries = list(paths)
+
+    if manifest:
+        base = Path(manifest).parent
+        with open(manifest, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                entry = Path(line)
+                if not entry.is_absolute():
+                    entry = base / entry
+                entries.append(str(entry))
+
+    files = set()
+    for entry in entries:
+        path = Path(entry)
+        if path.is_dir():
+            files.update(p for p in path.rglob(pattern) if p.is_file())
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(entry, recursive=True)
+                         if os.path.isfile(p))
+
+    return sorted(files)
+
+
+def assign_output_paths(
+    files: List[Path],
+    output_dir: str,
+    extension: str = ".json"
+) -> List[Path]:
+    """Give every input file a unique result path inside ``output_dir``."""
+    used = set()
+    outputs = []
+
+    for path in files:
+        candidate = Path(output_dir) / (path.stem + extension)
+        counter = 1
+        while candidate in used:
+            candidate = Path(output_dir) / f"{path.stem}_{counter}{extension}"
+            counter += 1
+        used.add(candidate)
+        outputs.append(candidate)
+
+    return outputs
+
+
+def _init_worker(checker_kwargs: Dict[str, Any], save_lock):
+    """Set up a pool worker's checker and close it when the worker exits.
+
+    The checker is built here unless the worker inherited one from the
+    parent. Closing it saves the caches it keeps in files.
+    """
+    global _WORKER_CHECKER
+    if _WORKER_CHECKER is None:
+        _WORKER_CHECKER = ParagraphChecker(**checker_kwargs)
+    Finalize(None, _close_worker, args=(save_lock,), exitpriority=10)
+
+
+def _close_worker(save_lock):
+    """Close the worker's checker; one worker at a time, since they may save
+    to the same cache files."""
+    with save_lock:
+        _WORKER_CHECKER.close()
+
+
+def _load_models(checker: ParagraphChecker):
+    """Load the spaCy pipeline and spelling dictionary the checker will use.
+
+    The checker loads them lazily, so without this every forked worker
+    would load its own copy on its first file.
+    """
+    if "style" in checker.analyzers:
+        checker.style_analyzer  # loads the spaCy pipeline
+    if "spelling" in checker.analyzers:
+        spelling_analyzer = checker.spelling_analyzer
+        spelling_analyzer.spell
+        if spelling_analyzer.use_symspell:
+            spelling_analyzer.symspell
+    if "readability" in checker.analyzers:
+        checker.readability_analyzer
+
+
+def _analyze_file(job: Tuple[str, str]) -> Dict[str, Any]:
+    """Analyze one file with the worker's checker and write its result."""
+    start = time.perf_counter()
+
+    try:
+        with open(job[0], "r", encoding="utf-8") as f:
+            text = f.read()
+
+        results = _WORKER_CHECKER.analyze(text)
+        return _save_result(job, text, results, time.perf_counter() - start)
+    except Exception as e:
+        return _failed_result(job, e, time.perf_counter() - start)
+
+
+def _analyze_files(jobs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Analyze a group of files, parsing their texts together.
+
+    If reading or analyzing the group fails, the files are retried one at
+    a time so that only the broken file is reported as failed.
+    """
+    start = time.perf_counter()
+
+    try:
+        texts = []
+        for input_path, _ in jobs:
+            with open(input_path, "r", encoding="utf-8") as f:
+                texts.append(f.read())
+        analyses = _WORKER_CHECKER.analyze_many(texts)
+    except Exception:
+        return [_analyze_file(job) for job in jobs]
+
+    # Parsing is shared, so each file is charged an equal part of the time
+    seconds = (time.perf_counter() - start) / len(jobs)
+
+    file_results = []
+    for job, text, results in zip(jobs, texts, analyses):
+        try:
+            file_results.append(_save_result(job, text, results, seconds))
+        except Exception as e:
+            file_results.append(_failed_result(job, e, seconds))
+    return file_results
+
+
+def _save_result(
+    job: Tuple[str, str],
+    text: str,
+    results: Dict[str, Any],
+    seconds: float
+) -> Dict[str, Any]:
+    """Write an analysis result file and describe it for the summary."""
+    input_path, output_path = job
+    ResultDisplay().save_to_file(results, text, output_path)
+
+    word_count = results.get("statistics", {}).get("word_count")
+    if word_count is None:
+        word_count = len(text.split())
+
+    return {
+        "file": input_path,
+        "output": output_path,
+        "words": word_count,
+        "issues": results["summary"]["total_issues"],
+        "seconds": seconds,
+        "error": None
+    }
+
+
+def _failed_result(job: Tuple[str, str], error: Exception, seconds: float) -> Dict[str, Any]:
+    """Describe a file that could not be analyzed."""
+    return {
+        "file": job[0],
+        "output": None,
+        "words": 0,
+        "issues": 0,
+        "seconds": seconds,
+        "error": str(error)
+    }
+
+
+class BatchRunner:
+    """Fans files out to a process pool of reusable ParagraphCheckers."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunksize: int = 4,
+        checker_kwargs: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize the batch runner.
+
+        Args:
+            workers: Number of worker processes (defaults to CPU count)
+            chunksize: Files handed to a worker at a time; their texts
+                are parsed together with ``nlp.pipe``
+            checker_kwargs: Keyword arguments for each ParagraphChecker
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunksize = max(1, chunksize)
+        self.checker_kwargs = checker_kwargs or {}
+
+    def run(
+        self,
+        files: List[Path],
+        output_dir: str,
+        extension: str = ".json",
+        progress=None
+    ) -> Dict[str, Any]:
+        """Analyze all files and write one result file per input.
+
+        Args:
+            files: Input files to analyze
+            output_dir: Directory that receives the result files
+            extension: Result format, ".json" or ".txt"
+            progress: Optional callback invoked with each file result
+
+        Returns:
+            Dictionary with per-file results and a throughput summary
+        """
+        global _WORKER_CHECKER
+
+        os.makedirs(output_dir, exist_ok=True)
+        outputs = assign_output_paths(files, output_dir, extension)
+        jobs = [(str(f), str(o)) for f, o in zip(files, outputs)]
+
+        start = time.perf_counter()
+        file_results = []
+
+        groups = [jobs[i:i + self.chunksize] for i in range(0, len(jobs), self.chunksize)]
+
+        if self.workers == 1 or len(jobs) <= 1:
+            _WORKER_CHECKER = ParagraphChecker(**self.checker_kwargs)
+            try:
+                for group in groups:
+                    for result in _analyze_files(group):
+                        file_results.append(result)
+                        if progress:
+                            progress(result)
+            finally:
+                _WORKER_CHECKER.close()
+                _WORKER_CHECKER = None
+        else:
+            checker_kwargs, grammar_server = self._share_grammar_server()
+            try:
+                if "fork" in multiprocessing.get_all_start_methods():
+                    # Load the models once here; forked workers share them.
+                    _WORKER_CHECKER = ParagraphChecker(**checker_kwargs)
+                    _load_models(_WORKER_CHECKER)
+                    context = multiprocessing.get_context("fork")
+                else:
+                    context = multiprocessing.get_context()
+
+                with context.Pool(
+                    processes=min(self.workers, len(jobs)),
+                    initializer=_init_worker,
+                    initargs=(checker_kwargs, context.Lock())
+                ) as pool:
+                    for group_results in pool.imap_unordered(_analyze_files, groups):
+                        for result in group_results:
+                            file_results.append(result)
+                            if progress:
+                                progress(result)
+                    # Let the workers exit on their own so they close their
+                    # checkers; leaving the block would terminate them
+                    pool.close()
+                    pool.join()
+            finally:
+                # The parent's copy never analyzed anything, so it has
+                # nothing to save
+                _WORKER_CHECKER = None
+                if grammar_server is not None:
+                    grammar_server.close()
+
+        elapsed = time.perf_counter() - start
+
+        return {
+            "files": sorted(file_results, key=lambda r: r["file"]),
+            "summary": self._create_summary(file_results, elapsed)
+        }
+
+    def _share_grammar_server(self) -> Tuple[Dict[str, Any], Optional[Any]]:
+        """Start one LanguageTool server for all workers.
+
+        Each worker would otherwise start its own JVM. The workers get the
+        server's URL as ``grammar_server`` and connect their own clients
+        to it; a client is never shared across processes.
+
+        Returns:
+            The workers' checker arguments, and the client owning the
+            server (None if grammar is off or a server was given)
+        """
+        kwargs = self.checker_kwargs
+        if (kwargs.get("grammar_server") is not None
+                or "grammar" not in select_analyzers(kwargs.get("analyzers"))):
+            return kwargs, None
+
+        server = start_server()
+        return dict(kwargs, grammar_server=server_url(server)), server
+
+    def _create_summary(
+        self,
+        file_results: List[Dict[str, Any]],
+        elapsed: float
+    ) -> Dict[str, Any]:
+        """Create a throughput summary for the batch."""
+        succeeded = [r for r in file_results if r["error"] is None]
+        words = sum(r["words"] for r in succeeded)
+
+        return {
+            "documents": len(succeeded),
+            "failed": len(file_results) - len(succeeded),
+            "words": words,
+            "issues": sum(r["issues"] for r in succeeded),
+            "elapsed_seconds": round(elapsed, 3),
+            "docs_per_second": round(len(succeeded) / elapsed, 2) if elapsed else 0.0,
+            "words_per_second": round(words / elapsed, 2) if elapsed else 0.0,
+            "workers": self.workers
+        }
@@ -0,0 +1,349 @@
+# WARNING: template code, may need edits
+"""Persistent caching of analysis results."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+
+def make_cache_key(text: str, analyzers: Iterable[str], fingerprint: str) -> str:
+    """Build a content-addressed key for a text and analysis configuration.
+
+    Args:
+        text: The analyzed text
+        analyzers: Names of the enabled analyzers
+        fingerprint: Analyzer and model versions
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(fingerprint.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(",".join(sorted(analyzers)).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Bounded in-memory mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 10000, path: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            path: Optional JSON file the entries are loaded from (if it
+                exists) and written to by ``save``
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for ``key``, or ``default`` on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._data),
+            "max_entries": self.maxsize
+        }
+
+    def load(self, path: Optional[str] = None):
+        """Load entries from a JSON file written by ``save``."""
+        with open(path or self.path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        for key, value in entries.items():
+            self.put(key, value)
+
+    def save(self, path: Optional[str] = None):
+        """Write the entries to a JSON file, least recently used first.
+
+        Entries another process saved to the file since it was loaded are
+        kept (oldest first, up to ``maxsize`` entries in all), so several
+        processes can share one file as long as they save one at a time.
+        """
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            entries = dict(self._data)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            merged = {key: value for key, value in saved.items() if key not in entries}
+            merged.update(entries)
+            entries = dict(list(merged.items())[-self.maxsize:])
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Replace the file in one step so readers never see half of it
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class ParagraphCache:
+    """Grammar check results of single paragraphs, keyed by content hash.
+
+    Values are lists of match records with offsets relative to the
+    paragraph. Entries live in an ``LRUCache``, so they can be kept on disk
+    between runs. Besides hits and misses, the cache tracks how long the
+    checks of uncached paragraphs took, which gives an estimate of the time
+    saved by the hits.
+    """
+
+    def __init__(self, maxsize: int = 10000, path: Optional[str] = None, fingerprint: str = ""):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of paragraphs
+            path: Optional JSON file the entries are loaded from and saved to
+            fingerprint: Checker configuration; entries stored under another
+                fingerprint are not reused
+        """
+        self.fingerprint = fingerprint
+        self.entries = LRUCache(maxsize, path)
+        self.hit_chars = 0
+        self.checked_chars = 0
+        self.check_seconds = 0.0
+
+    def key(self, paragraph: str, variant: str = "") -> str:
+        """Hash of a paragraph, ignoring surrounding whitespace.
+
+        ``variant`` tells apart results of the same paragraph under settings
+        that change from call to call, such as the rules switched off.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.fingerprint.encode("utf-8"))
+        digest.update(b"\0")
+        if variant:
+            digest.update(variant.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(paragraph.strip().encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, paragraph: str, variant: str = "") -> Optional[list]:
+        """Return the stored records of a paragraph, or None on a miss."""
+        records = self.entries.get(self.key(paragraph, variant))
+        if records is not None:
+            self.hit_chars += len(paragraph)
+        return records
+
+    def put(self, paragraph: str, records: list, variant: str = ""):
+        """Store the records of a paragraph."""
+        self.entries.put(self.key(paragraph, variant), records)
+
+    def record_check(self, chars: int, seconds: float):
+        """Count a check of ``chars`` characters of uncached paragraphs."""
+        self.checked_chars += chars
+        self.check_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the estimated time saved."""
+        stats = self.entries.stats()
+        per_char = self.check_seconds / self.checked_chars if self.checked_chars else 0.0
+        stats["check_seconds"] = round(self.check_seconds, 3)
+        stats["time_saved_seconds"] = round(self.hit_chars * per_char, 3)
+        return stats
+
+    def save(self):
+        """Write the entries to the cache file, if one was given."""
+        self.entries.save()
+
+
+class ResultCache:
+    """SQLite-backed result cache with a size cap and LRU eviction."""
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        """Initialize the cache.
+
+        The database is opened on first use, so a cache created before a
+        worker pool forks gets a fresh connection in every process.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Total payload size kept before evicting old entries
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn = None
+        self._pid = None
+        self._last_tick = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for ``key`` or None on a miss."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE results SET last_access = ? WHERE key = ?",
+                (self._tick(), key)
+            )
+            conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def put(self, key: str, payload: Dict[str, Any]):
+        """Store a payload and evict least recently used entries if needed."""
+        data = json.dumps(payload, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, size, self._tick())
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current cache size."""
+        with self._lock:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes
+        }
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM results")
+            conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database for the current process."""
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False
+            )
+            self._pid = os.getpid()
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_access "
+                "ON results (last_access)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _tick(self) -> int:
+        """Return a strictly increasing access timestamp in nanoseconds."""
+        self._last_tick = max(time.time_ns(), self._last_tick + 1)
+        return self._last_tick
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Delete least recently used entries until under the size cap."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+        while total > self.max_bytes:
+            row = conn.execute(
+                "SELECT key, size FROM results ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            total -= row[1]
+            self.evictions += 1
@@ -1,77 +1,701 @@
 # WARNING: template code, may need edits
 """Core paragraph checking and analysis functionality."""
 
-import spacy
-from typing import List, Dict, Any
+import concurrent.futures
+import contextvars
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple, Union
 from src.analyzers.grammar_analyzer import GrammarAnalyzer
+from src.analyzers.language_tool_pool import RULE_PROFILES
+from src.analyzers.phrase_matcher import load_phrase_dictionary
 from src.analyzers.spelling_analyzer import SpellingAnalyzer
 from src.analyzers.style_analyzer import StyleAnalyzer
 from src.analyzers.readability_analyzer import ReadabilityAnalyzer
+from src.analyzers.token_arrays import TokenArrays
+from src.cache import ResultCache, ParagraphCache, make_cache_key
+from src.deadline import COST_ORDER, Deadline
 from src.models.issue import Issue
+from src.models.issue_index import IssueIndex, merge_issues
+from src.models.issue_table import IssueTable
+from src.profiling import ProfileHook, Profiler, stage
+
+
+# Bump when analyzer logic changes so cached results are not reused
+RESULTS_VERSION = 4
+
+# Packages whose versions affect analysis results
+_VERSIONED_PACKAGES = (
+    "spacy", "en_core_web_sm", "language_tool_python", "pyspellchecker", "textstat",
+    "pyphen"
+)
+
+# Names accepted by the ``analyzers`` argument and the --only/--skip options
+ANALYZER_NAMES = ("grammar", "spelling", "style", "readability")
+
+# spaCy components left out of each pipeline profile. The analyzers only
+# use tokens, tags, lemmas, stop words and sentence boundaries, so the
+# entity recognizer is never needed; "senter" also swaps the dependency
+# parser for the much cheaper sentence recognizer.
+PIPELINE_PROFILES = {
+    "full": [],
+    "lean": ["ner"],
+    "senter": ["ner", "parser"],
+}
+
+
+def load_pipeline(profile: str = "lean", model: str = "en_core_web_sm"):
+    """Load a spaCy model with the components of a pipeline profile.
+    
+    Args:
+        profile: One of ``PIPELINE_PROFILES``
+        model: Name of the installed spaCy model
+        
+    Returns:
+        The loaded spaCy pipeline
+    """
+    import spacy
+    
+    nlp = spacy.load(model, exclude=PIPELINE_PROFILES[profile])
+    if profile == "senter":
+        # Shipped disabled in the English models
+        nlp.enable_pipe("senter")
+    return nlp
+
+
+def _package_versions(packages: Iterable[str]) -> List[str]:
+    """"name=version" for each package, "name=missing" if not installed."""
+    from importlib import metadata
+    
+    versions = []
+    for package in packages:
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=missing")
+    return versions
+
+
+def _dictionary_digest(mapping: Dict[str, str]) -> str:
+    """Short hash of a dictionary's contents, independent of key order."""
+    data = json.dumps(mapping, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def select_analyzers(
+    only: Optional[Iterable[str]] = None,
+    skip: Optional[Iterable[str]] = None
+) -> Set[str]:
+    """Resolve --only/--skip style selections into a set of analyzer names.
+    
+    Args:
+        only: Analyzers to run (all when empty)
+        skip: Analyzers to leave out
+        
+    Returns:
+        Set of enabled analyzer names
+    """
+    selected = set(only) if only else set(ANALYZER_NAMES)
+    selected -= set(skip or ())
+    
+    unknown = selected.union(skip or ()) - set(ANALYZER_NAMES)
+    if unknown:
+        raise ValueError(
+            f"Unknown analyzer(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(ANALYZER_NAMES)}"
+        )
+    
+    return selected
 
 
 class ParagraphChecker:
     """Main class for analyzing text and detecting issues."""
     
-    def __init__(self):
-        """Initialize the paragraph checker with all analyzers."""
-        print("Loading language models...")
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Downloading required language model...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        self.grammar_analyzer = GrammarAnalyzer()
-        self.spelling_analyzer = SpellingAnalyzer()
-        self.style_analyzer = StyleAnalyzer(self.nlp)
-        self.readability_analyzer = ReadabilityAnalyzer()
-    
-    def analyze(self, text: str) -> Dict[str, Any]:
+    def __init__(
+        self,
+        concurrent: bool = False,
+        analyzers: Optional[Iterable[str]] = None,
+        cache: Optional[Union[ResultCache, str]] = None,
+        suggestion_cache_path: Optional[str] = None,
+        symspell_index_path: Optional[str] = None,
+        wordy_phrases_path: Optional[str] = None,
+        pipeline: str = "lean",
+        batch_size: int = 64,
+        n_process: int = 1,
+        extra_indices: bool = False,
+        grammar_workers: int = 1,
+        grammar_pool_mode: str = "shared",
+        grammar_server: Optional[str] = None,
+        grammar_cache_size: int = 0,
+        grammar_cache_path: Optional[str] = None,
+        grammar_profile: str = "default",
+        profile: bool = False,
+        profile_hooks: Sequence[ProfileHook] = ()
+    ):
+        """Initialize the paragraph checker.
+        
+        Models are loaded lazily: the spaCy pipeline, the LanguageTool JVM
+        and the spelling dictionary are only built the first time an
+        enabled analyzer needs them.
+        
+        Args:
+            concurrent: Run the grammar check on a thread pool while spaCy
+                parses the text and the doc-based analyzers run. Results are
+                identical to the sequential path.
+            analyzers: Names of the analyzers to run (default: all of
+                ``ANALYZER_NAMES``)
+            cache: Optional ResultCache, or a path to its SQLite file, used
+                to return stored results for text seen before
+            suggestion_cache_path: Optional JSON file used to keep spelling
+                suggestions between runs
+            symspell_index_path: Optional file for a precomputed
+                symmetric-delete spelling index, built on first use
+            wordy_phrases_path: Optional JSON file of wordy phrases and
+                their replacements for the style analyzer
+            pipeline: spaCy pipeline profile, one of ``PIPELINE_PROFILES``.
+                "lean" gives the same results as "full"; "senter" may
+                split a few sentences differently.
+            batch_size: Texts parsed together by ``analyze_many``
+            n_process: Processes ``analyze_many`` uses for parsing
+            extra_indices: Add the SMOG, Coleman-Liau and automated
+                readability indices to the statistics
+            grammar_workers: LanguageTool clients checking chunks of a
+                text in parallel
+            grammar_pool_mode: "shared" (one local LanguageTool server for
+                all workers) or "servers" (one per worker)
+            grammar_server: URL of a running LanguageTool server to use
+                instead of starting a local one
+            grammar_cache_size: Number of paragraphs whose LanguageTool
+                results are cached (0 disables the cache). With the cache,
+                grammar is checked paragraph by paragraph.
+            grammar_cache_path: Optional JSON file used to keep the
+                paragraph cache between runs
+            grammar_profile: LanguageTool rule profile, one of
+                ``RULE_PROFILES``. "default" skips the rules the enabled
+                spelling and style analyzers already cover; "full" runs
+                them all.
+            profile: Time each stage of an analysis (model loading,
+                parsing, each analyzer and style check, spelling
+                candidate lookups, summary) and add the seconds and
+                calls per stage to the result as ``timings``
+            profile_hooks: Functions called with (stage, seconds) as each
+                stage ends, e.g. to forward timings to a metrics system;
+                they turn on ``profile``
+        """
+        if pipeline not in PIPELINE_PROFILES:
+            raise ValueError(
+                f"Unknown pipeline profile: {pipeline}. "
+                f"Choose from: {', '.join(PIPELINE_PROFILES)}"
+            )
+        if grammar_profile not in RULE_PROFILES:
+            raise ValueError(
+                f"Unknown grammar profile: {grammar_profile}. "
+                f"Choose from: {', '.join(RULE_PROFILES)}"
+            )
+        
+        self.concurrent = concurrent
+        self.analyzers = select_analyzers(analyzers)
+        self.cache = ResultCache(cache) if isinstance(cache, str) else cache
+        self.suggestion_cache_path = suggestion_cache_path
+        self.symspell_index_path = symspell_index_path
+        self.wordy_phrases_path = wordy_phrases_path
+        self.pipeline = pipeline
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.extra_indices = extra_indices
+        self.grammar_workers = grammar_workers
+        self.grammar_pool_mode = grammar_pool_mode
+        self.grammar_server = grammar_server
+        self.grammar_cache_size = grammar_cache_size
+        self.grammar_cache_path = grammar_cache_path
+        self.grammar_profile = grammar_profile
+        self.profile_hooks = list(profile_hooks)
+        self.profile = profile or bool(self.profile_hooks)
+        self._executor = None
+        self._fingerprint = None
+        
+        self._nlp = None
+        self._grammar_analyzer = None
+        self._spelling_analyzer = None
+        self._style_analyzer = None
+        self._readability_analyzer = None
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first access."""
+        if self._nlp is None:
+            print("Loading language models...")
+            with stage("model_load"):
+                try:
+                    self._nlp = load_pipeline(self.pipeline)
+                except OSError:
+                    print("Downloading required language model...")
+                    import subprocess
+                    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
+                    self._nlp = load_pipeline(self.pipeline)
+        return self._nlp
+    
+    @property
+    def grammar_analyzer(self) -> GrammarAnalyzer:
+        """Grammar analyzer; its LanguageTool server starts on first check."""
+        if self._grammar_analyzer is None:
+            paragraph_cache = None
+            if self.grammar_cache_size:
+                paragraph_cache = ParagraphCache(
+                    self.grammar_cache_size, self.grammar_cache_path,
+                    fingerprint=";".join(
+                        [f"profile={self.grammar_profile}"]
+                        + _package_versions(["language_tool_python"])
+                    )
+                )
+            self._grammar_analyzer = GrammarAnalyzer(
+                workers=self.grammar_workers,
+                pool_mode=self.grammar_pool_mode,
+                remote_server=self.grammar_server,
+                paragraph_cache=paragraph_cache,
+                profile=self.grammar_profile,
+                local_analyzers=self.analyzers - {"grammar"}
+            )
+        return self._grammar_analyzer
+    
+    @property
+    def paragraph_cache(self) -> Optional[ParagraphCache]:
+        """The grammar analyzer's paragraph cache, if it was created."""
+        if self._grammar_analyzer is None:
+            return None
+        return self._grammar_analyzer.paragraph_cache
+    
+    @property
+    def spelling_analyzer(self) -> SpellingAnalyzer:
+        """Spelling analyzer; its dictionary is built on first check."""
+        if self._spelling_analyzer is None:
+            self._spelling_analyzer = SpellingAnalyzer(
+                suggestion_cache_path=self.suggestion_cache_path,
+                symspell_index_path=self.symspell_index_path
+            )
+        return self._spelling_analyzer
+    
+    @property
+    def style_analyzer(self) -> StyleAnalyzer:
+        """Style analyzer, sharing the checker's spaCy pipeline."""
+        if self._style_analyzer is None:
+            self._style_analyzer = StyleAnalyzer(
+                self.nlp, wordy_phrases_path=self.wordy_phrases_path
+            )
+        return self._style_analyzer
+    
+    @property
+    def readability_analyzer(self) -> ReadabilityAnalyzer:
+        """Readability analyzer."""
+        if self._readability_analyzer is None:
+            self._readability_analyzer = ReadabilityAnalyzer(self.extra_indices)
+        return self._readability_analyzer
+    
+    def analyze(
+        self,
+        text: str,
+        analyzers: Optional[Iterable[str]] = None,
+        as_table: bool = False,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Analyze text and return all detected issues.
         
         Args:
             text: The text to analyze
+            analyzers: Analyzers to run for this call only (default: the
+                checker's own selection)
+            as_table: Return the issues as an ``IssueTable`` instead of a
+                list of ``Issue`` objects
+            deadline: Seconds the call may take. Analyzers run cheapest
+                first (see ``_run_within``); when the time is up the rest
+                are skipped or stopped early, the issues found so far are
+                returned, and the summary lists the ``skipped_analyzers``
+                and ``truncated_analyzers``. Partial results are not
+                cached.
+            
+        Returns:
+            Dictionary containing all issues and statistics; its
+            ``index`` is an ``IssueIndex`` of the issues for finding those
+            in a range of the text. With profiling on, ``timings`` maps
+            each stage to its ``seconds`` and ``calls``.
+        """
+        budget = Deadline(deadline) if deadline is not None else None
+        profiler = self._new_profiler()
+        with self._profiling(profiler):
+            if not text or not text.strip():
+                results = self._empty_result()
+            else:
+                enabled = select_analyzers(analyzers) if analyzers else self.analyzers
+                
+                key, results = self._cache_lookup(text, enabled)
+                if results is None and budget is None:
+                    results = self._run_analyzers(text, enabled)
+                    self._cache_store(key, results)
+                elif results is None:
+                    results = self._run_within(text, enabled, budget)
+                    summary = results["summary"]
+                    if not summary["skipped_analyzers"] and not summary["truncated_analyzers"]:
+                        self._cache_store(key, results)
+            
+            if budget is not None:
+                results["summary"].setdefault("skipped_analyzers", [])
+                results["summary"].setdefault("truncated_analyzers", [])
+        
+        if profiler is not None:
+            results["timings"] = profiler.finish()
+        return self._as_table(results) if as_table else results
+    
+    def analyze_many(
+        self,
+        texts: Iterable[str],
+        analyzers: Optional[Iterable[str]] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+        as_table: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Analyze several texts, parsing them together with ``nlp.pipe``.
+        
+        Results are the same as calling ``analyze`` on each text, but the
+        spaCy model processes the texts in batches, which raises
+        throughput for many short documents.
+        
+        Args:
+            texts: The texts to analyze
+            analyzers: Analyzers to run for this call only (default: the
+                checker's own selection)
+            batch_size: Texts per spaCy batch (default: the checker's)
+            n_process: Parsing processes (default: the checker's)
+            as_table: Return each text's issues as an ``IssueTable``; join
+                them with ``IssueTable.concat`` for corpus-wide analysis
             
         Returns:
-            Dictionary containing all issues and statistics
+            One result dictionary per text, in order
         """
-        if not text or not text.strip():
-            return {
-                "issues": [],
-                "statistics": {},
-                "summary": {"total_issues": 0}
-            }
+        texts = list(texts)
+        enabled = select_analyzers(analyzers) if analyzers else self.analyzers
+        results = [None] * len(texts)
+        profilers = [self._new_profiler() for _ in texts]
+        pending = []
+        
+        for i, text in enumerate(texts):
+            with self._profiling(profilers[i]):
+                if not text or not text.strip():
+                    results[i] = self._empty_result()
+                    continue
+                key, cached = self._cache_lookup(text, enabled)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending.append((i, key))
         
-        # Process text with spaCy
-        doc = self.nlp(text)
+        parse = "style" in enabled and bool(pending)
+        if parse:
+            # Loading the model is counted for the first text parsed
+            with self._profiling(profilers[pending[0][0]]):
+                nlp = self.nlp
+            docs = nlp.pipe(
+                (texts[i] for i, _ in pending),
+                batch_size=batch_size or self.batch_size,
+                n_process=n_process or self.n_process
+            )
+        
+        for i, key in pending:
+            with self._profiling(profilers[i]):
+                doc = None
+                if parse:
+                    # A batch is parsed when its first text is reached, and
+                    # counted for that text
+                    with stage("parse"):
+                        doc = next(docs)
+                results[i] = self._run_analyzers(texts[i], enabled, doc)
+                self._cache_store(key, results[i])
+        
+        for result, profiler in zip(results, profilers):
+            if profiler is not None:
+                result["timings"] = profiler.finish()
+        
+        if as_table:
+            results = [self._as_table(result) for result in results]
+        return results
+    
+    def _new_profiler(self) -> Optional[Profiler]:
+        """A profiler for one analysis, or None when profiling is off."""
+        return Profiler(self.profile_hooks) if self.profile else None
+    
+    @staticmethod
+    def _profiling(profiler: Optional[Profiler]):
+        """Context in which a profiler from ``_new_profiler`` records stages."""
+        return profiler.activate() if profiler is not None else nullcontext()
+    
+    def _empty_result(self) -> Dict[str, Any]:
+        """Result for empty or whitespace-only text."""
+        return {
+            "issues": [],
+            "statistics": {},
+            "summary": {"total_issues": 0},
+            "index": IssueIndex()
+        }
+    
+    def _as_table(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a result with its issues stored in an ``IssueTable``."""
+        table = IssueTable(results["issues"], source=results.get("text"))
+        return dict(results, issues=table)
+    
+    def _cache_lookup(
+        self,
+        text: str,
+        enabled: Set[str]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return the cache key and stored result (None on a miss)."""
+        if self.cache is None:
+            return None, None
+        
+        with stage("cache"):
+            key = make_cache_key(text, enabled, self.fingerprint)
+            cached = self.cache.get(key)
+            if cached is None:
+                return key, None
+            
+            issues = [Issue.from_dict(issue) for issue in cached["issues"]]
+        return key, {
+            "issues": issues,
+            "statistics": cached["statistics"],
+            "summary": cached["summary"],
+            "text": text,
+            "index": IssueIndex(issues)
+        }
+    
+    def _cache_store(self, key: Optional[str], results: Dict[str, Any]):
+        """Store a result under a key from ``_cache_lookup``."""
+        if self.cache is None or key is None:
+            return
+        
+        with stage("cache"):
+            self.cache.put(key, {
+                "issues": [issue.to_dict() for issue in results["issues"]],
+                "statistics": results["statistics"],
+                "summary": results["summary"]
+            })
+    
+    @property
+    def fingerprint(self) -> str:
+        """Versions of the analyzers and models that shape the results."""
+        if self._fingerprint is None:
+            versions = [
+                f"results={RESULTS_VERSION}",
+                f"pipeline={self.pipeline}",
+                f"grammar_profile={self.grammar_profile}",
+                f"spelling={self.spelling_analyzer.engine}",
+                f"extra_indices={self.extra_indices}",
+                "wordy_phrases="
+                + _dictionary_digest(load_phrase_dictionary(self.wordy_phrases_path))
+            ]
+            if self.grammar_cache_size:
+                # Paragraph-by-paragraph grammar checks can differ from whole-text ones
+                versions.append("grammar=paragraphs")
+            elif self.grammar_workers > 1:
+                # So can checks of separate chunks, in rules across paragraphs
+                versions.append("grammar=chunks")
+            versions.extend(_package_versions(_VERSIONED_PACKAGES))
+            self._fingerprint = ";".join(versions)
+        return self._fingerprint
+    
+    def _run_analyzers(self, text: str, enabled: Set[str], doc=None) -> Dict[str, Any]:
+        """Run the enabled analyzers on non-empty text.
+        
+        ``doc`` is an already parsed spaCy doc of ``text``, if any.
+        """
+        grammar_issues = []
+        spelling_issues = []
+        style_issues = []
+        readability_stats = {}
+        
+        # LanguageTool does not need the spaCy doc, so in concurrent mode it
+        # starts before parsing and runs alongside it
+        grammar_future = None
+        if self.concurrent and "grammar" in enabled:
+            # Run in a copy of this context so the grammar stages are profiled
+            grammar_future = self._get_executor().submit(
+                contextvars.copy_context().run, self._check_grammar, text, enabled
+            )
+        
+        # Only the style analyzer uses spaCy
+        if doc is None and "style" in enabled:
+            nlp = self.nlp
+            with stage("parse"):
+                doc = nlp(text)
+        tokens = TokenArrays(doc) if doc is not None else None
         
         # Run all analyzers
-        grammar_issues = self.grammar_analyzer.analyze(text)
-        spelling_issues = self.spelling_analyzer.analyze(text, doc)
-        style_issues = self.style_analyzer.analyze(text, doc)
-        readability_stats = self.readability_analyzer.analyze(text)
+        if "spelling" in enabled:
+            with stage("spelling"):
+                spelling_issues = self.spelling_analyzer.analyze(text)
+        if "style" in enabled:
+            style_analyzer = self.style_analyzer
+            with stage("style"):
+                style_issues = style_analyzer.analyze(text, doc, tokens)
+        if "readability" in enabled:
+            with stage("readability"):
+                readability_stats = self.readability_analyzer.analyze(text)
         
-        # Combine all issues
-        all_issues = grammar_issues + spelling_issues + style_issues
+        if grammar_future is not None:
+            grammar_issues = grammar_future.result()
+        elif "grammar" in enabled:
+            grammar_issues = self._check_grammar(text, enabled)
         
-        # Sort issues by position
-        all_issues.sort(key=lambda x: x.position)
+        # Combine all issues, dropping those another analyzer already
+        # reported for the same span, and sort them by position
+        with stage("merge"):
+            all_issues = merge_issues(grammar_issues + spelling_issues + style_issues)
         
         # Create summary
-        summary = self._create_summary(all_issues)
+        with stage("summary"):
+            summary = self.summarize(all_issues)
+        
+        return {
+            "issues": all_issues,
+            "statistics": readability_stats,
+            "summary": summary,
+            "text": text,
+            "index": IssueIndex(all_issues)
+        }
+    
+    def close(self):
+        """Shut down worker threads and servers, and close or save the caches."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.cache is not None:
+            self.cache.close()
+        if self._grammar_analyzer is not None:
+            self._grammar_analyzer.pool.close()
+        if self.paragraph_cache is not None:
+            self.paragraph_cache.save()
+        if self._spelling_analyzer is not None:
+            self._spelling_analyzer.save_suggestions()
+    
+    def _run_within(self, text: str, enabled: Set[str], deadline: Deadline) -> Dict[str, Any]:
+        """Run the enabled analyzers on non-empty text within a time budget.
+        
+        Grammar is checked in the background from the start, since it
+        mostly waits for LanguageTool. Meanwhile readability, spelling and
+        style run in that order on this thread. Only style needs the spaCy
+        model and parse, so they are put off until the other two are done
+        and skipped with style if the time is up by then. No analyzer
+        depends on whether a doc was parsed, so complete results equal
+        those of a run without a deadline.
+        
+        An analyzer that would start after the deadline is skipped;
+        spelling and style stop part-way when it passes. A grammar check
+        that is not done in time is skipped: a LanguageTool request already
+        in flight cannot be interrupted, so it finishes in the background
+        and its result is dropped.
+        """
+        grammar_future = None
+        if "grammar" in enabled and not deadline.expired():
+            grammar_future = self._get_executor().submit(
+                contextvars.copy_context().run, self._check_grammar, text, enabled
+            )
+        
+        spelling_issues = []
+        style_issues = []
+        readability_stats = {}
+        skipped = []
+        
+        for name in COST_ORDER:
+            if name == "grammar" or name not in enabled:
+                continue
+            if deadline.expired():
+                skipped.append(name)
+            elif name == "readability":
+                with stage("readability"):
+                    readability_stats = self.readability_analyzer.analyze(text)
+            elif name == "spelling":
+                with stage("spelling"):
+                    spelling_issues = self.spelling_analyzer.analyze(text, deadline=deadline)
+            elif name == "style":
+                nlp = self.nlp
+                with stage("parse"):
+                    doc = nlp(text)
+                if deadline.expired():
+                    # Out of time while loading the model or parsing
+                    skipped.append(name)
+                    continue
+                style_analyzer = self.style_analyzer
+                with stage("style"):
+                    style_issues = style_analyzer.analyze(text, doc, deadline=deadline)
+        
+        grammar_issues = []
+        if grammar_future is not None:
+            try:
+                grammar_issues = grammar_future.result(timeout=deadline.remaining())
+            except concurrent.futures.TimeoutError:
+                grammar_future.cancel()
+                skipped.append("grammar")
+        elif "grammar" in enabled:
+            skipped.append("grammar")
+        
+        with stage("merge"):
+            all_issues = merge_issues(grammar_issues + spelling_issues + style_issues)
+        with stage("summary"):
+            summary = self.summarize(all_issues)
+        summary["skipped_analyzers"] = skipped
+        summary["truncated_analyzers"] = [name for name in COST_ORDER if name in deadline.truncated]
         
         return {
             "issues": all_issues,
             "statistics": readability_stats,
             "summary": summary,
-            "text": text
+            "text": text,
+            "index": IssueIndex(all_issues)
         }
     
-    def _create_summary(self, issues: List[Issue]) -> Dict[str, Any]:
-        """Create a summary of all issues."""
+    def _check_grammar(self, text: str, enabled: Set[str]) -> List[Issue]:
+        """Run the grammar analyzer as the "grammar" stage.
+        
+        LanguageTool skips the rules that the other ``enabled`` analyzers
+        already cover.
+        """
+        with stage("grammar"):
+            return self.grammar_analyzer.analyze(text, enabled - {"grammar"})
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool for concurrent mode on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="paragraph-checker"
+            )
+        return self._executor
+    
+    def repeated_words(self, text: str) -> List[Issue]:
+        """Find the repeated words of a text, as the style analyzer does.
+        
+        Args:
+            text: The text to check
+            
+        Returns:
+            The repeated-word issues of ``text``, or an empty list if the
+            style analyzer is not enabled
+        """
+        if "style" not in self.analyzers or not text.strip():
+            return []
+        nlp = self.nlp
+        with stage("parse"):
+            doc = nlp(text)
+        with stage("style.repeated_words"):
+            return self.style_analyzer._check_repeated_words(text, doc)
+    
+    def summarize(self, issues: List[Issue]) -> Dict[str, Any]:
+        """Count issues by type and severity.
+        
+        Args:
+            issues: Issues of one text, e.g. combined from several analyses
+            
+        Returns:
+            A summary in the form of a result's ``summary`` entry
+        """
         summary = {
             "total_issues": len(issues),
             "by_type": {},
@@ -80,11 +704,11 @@ class ParagraphChecker:
         
         for issue in issues:
             # Count by type
-            issue_type = issue.issue_type
+            issue_type = issue.issue_type.value
             summary["by_type"][issue_type] = summary["by_type"].get(issue_type, 0) + 1
             
             # Count by severity
-            severity = issue.severity
+            severity = issue.severity.value
             summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + 1
         
         return summary
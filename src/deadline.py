@@ -0,0 +1,46 @@
+# WARNING: template code, may need edits
+"""Time budgets for analyses that must return on time."""
+
+import time
+from typing import Set
+
+# Analyzers in the order they run under a deadline, cheapest first. Grammar
+# runs in the background from the start and is collected last.
+COST_ORDER = ("readability", "spelling", "style", "grammar")
+
+
+class Deadline:
+    """A time budget shared by the analyzers of one analysis.
+
+    Analyzers that can stop part-way check ``expired`` between units of
+    work and call ``truncate`` with their name when they return partial
+    results.
+    """
+
+    def __init__(self, seconds: float):
+        """Start the budget.
+
+        Args:
+            seconds: Time allowed from now
+        """
+        if seconds < 0:
+            raise ValueError(f"Deadline must not be negative, got {seconds}")
+        self.seconds = seconds
+        self.expires = time.perf_counter() + seconds
+        self.truncated: Set[str] = set()
+
+    def remaining(self) -> float:
+        """Seconds left, 0 once the budget is used up."""
+        return max(0.0, self.expires - time.perf_counter())
+
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return time.perf_counter() >= self.expires
+
+    def truncate(self, analyzer: str):
+        """Record that an analyzer stopped early and returned partial results.
+
+        Args:
+            analyzer: Name of the analyzer, one of ``COST_ORDER``
+        """
+        self.truncated.add(analyzer)
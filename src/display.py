@@ -4,6 +4,7 @@
 from typing import Dict, Any, List
 from colorama import Fore, Style, init
 from src.models.issue import Issue, Severity
+from src.profiling import format_timings
 import json
 
 # Initialize colorama
@@ -53,6 +54,17 @@ class ResultDisplay:
         else:
             print(f"\n{Fore.GREEN}✓ No issues found! Great job!{Style.RESET_ALL}\n")
     
+    def show_timings(self, timings: Dict[str, Dict[str, float]]):
+        """Display the time spent in each analysis stage.
+        
+        Args:
+            timings: The ``timings`` of a profiled result
+        """
+        print(f"{Fore.CYAN}PROFILE:{Style.RESET_ALL}")
+        for line in format_timings(timings):
+            print(f"  {line}")
+        print()
+    
     def _show_statistics(self, stats: Dict[str, Any]):
         """Display text statistics."""
         if not stats:
@@ -64,6 +76,10 @@ class ResultDisplay:
         print(f"  Average sentence length: {stats.get('avg_sentence_length', 0)} words")
         print(f"  Reading level: {stats.get('reading_level', 'N/A')}")
         print(f"  Readability: {stats.get('readability_interpretation', 'N/A')}")
+        if 'smog_index' in stats:
+            print(f"  SMOG index: {stats['smog_index']}")
+            print(f"  Coleman-Liau index: {stats['coleman_liau_index']}")
+            print(f"  Automated readability index: {stats['automated_readability_index']}")
         print()
     
     def _show_summary(self, summary: Dict[str, Any]):
@@ -86,31 +102,59 @@ class ResultDisplay:
                 for severity, count in by_severity.items():
                     color = self._get_severity_color_by_name(severity)
                     print(f"    {color}- {severity}: {count}{Style.RESET_ALL}")
+        
+        # Analyses cut short by a deadline
+        skipped = summary.get('skipped_analyzers')
+        truncated = summary.get('truncated_analyzers')
+        if skipped:
+            print(f"\n  {Fore.YELLOW}Skipped (out of time): {', '.join(skipped)}{Style.RESET_ALL}")
+        if truncated:
+            print(f"  {Fore.YELLOW}Incomplete (out of time): {', '.join(truncated)}{Style.RESET_ALL}")
     
     def _show_issues(self, issues: List[Issue]):
         """Display individual issues."""
         for i, issue in enumerate(issues, 1):
-            color = self.severity_colors.get(issue.severity, Fore.WHITE)
-            
-            print(f"{color}{'─'*80}{Style.RESET_ALL}")
-            print(f"{color}Issue #{i} - {issue.severity.value} - {issue.issue_type.value}{Style.RESET_ALL}")
-            print(f"{color}{'─'*80}{Style.RESET_ALL}\n")
-            
-            print(f"  {Fore.WHITE}Problem:{Style.RESET_ALL} {issue.message}")
-            print(f"  {Fore.WHITE}Context:{Style.RESET_ALL} {issue.context}")
-            
-            if self.verbose:
-                print(f"\n  {Fore.WHITE}Explanation:{Style.RESET_ALL}")
-                print(f"    {issue.explanation}")
-                
-                print(f"\n  {Fore.GREEN}💡 Learning Tip:{Style.RESET_ALL}")
-                for line in issue.learning_tip.split('\n'):
-                    print(f"    {line}")
-            
-            if issue.suggested_fix:
-                print(f"\n  {Fore.WHITE}Suggestion:{Style.RESET_ALL} {issue.suggested_fix}")
+            self.show_issue(issue, i)
+    
+    def show_issue(self, issue: Issue, number: int):
+        """Display a single issue.
+        
+        Args:
+            issue: The issue to display
+            number: Issue number shown in its header
+        """
+        color = self.severity_colors.get(issue.severity, Fore.WHITE)
+        
+        print(f"{color}{'─'*80}{Style.RESET_ALL}")
+        print(f"{color}Issue #{number} - {issue.severity.value} - {issue.issue_type.value}{Style.RESET_ALL}")
+        print(f"{color}{'─'*80}{Style.RESET_ALL}\n")
+        
+        print(f"  {Fore.WHITE}Problem:{Style.RESET_ALL} {issue.message}")
+        print(f"  {Fore.WHITE}Context:{Style.RESET_ALL} {issue.context}")
+        
+        if self.verbose:
+            print(f"\n  {Fore.WHITE}Explanation:{Style.RESET_ALL}")
+            print(f"    {issue.explanation}")
             
-            print()
+            print(f"\n  {Fore.GREEN}💡 Learning Tip:{Style.RESET_ALL}")
+            for line in issue.learning_tip.split('\n'):
+                print(f"    {line}")
+        
+        if issue.suggested_fix:
+            print(f"\n  {Fore.WHITE}Suggestion:{Style.RESET_ALL} {issue.suggested_fix}")
+        
+        print()
+    
+    def show_totals(self, statistics: Dict[str, Any], summary: Dict[str, Any]):
+        """Display statistics and summary after issues were streamed.
+        
+        Args:
+            statistics: Readability statistics
+            summary: Issue summary
+        """
+        print("\n" + "="*80)
+        self._show_statistics(statistics)
+        self._show_summary(summary)
     
     def _get_severity_color_by_name(self, severity_name: str) -> str:
         """Get color by severity name."""
@@ -121,13 +165,16 @@ class ResultDisplay:
         else:
             return Fore.CYAN
     
-    def save_to_file(self, results: Dict[str, Any], text: str, filepath: str):
-        """Save results to a file.
+    def build_output_data(self, results: Dict[str, Any], text: str) -> Dict[str, Any]:
+        """Convert results into the JSON-serializable output schema.
         
         Args:
             results: Analysis results
             text: Original text
-            filepath: Output file path
+            
+        Returns:
+            Dictionary with the original text, statistics, summary and
+            issues, and the stage timings of profiled results
         """
         output_data = {
             'original_text': text,
@@ -135,6 +182,19 @@ class ResultDisplay:
             'summary': results.get('summary', {}),
             'issues': [issue.to_dict() for issue in results.get('issues', [])]
         }
+        if 'timings' in results:
+            output_data['timings'] = results['timings']
+        return output_data
+    
+    def save_to_file(self, results: Dict[str, Any], text: str, filepath: str):
+        """Save results to a file.
+        
+        Args:
+            results: Analysis results
+            text: Original text
+            filepath: Output file path
+        """
+        output_data = self.build_output_data(results, text)
         
         # Determine format by extension
         if filepath.endswith('.json'):
@@ -3,10 +3,19 @@
 """Main CLI entry point for Paragraph Checker."""
 
 import click
+import json
 import sys
 from pathlib import Path
-from src.checker import ParagraphChecker
+from src.analyzers.language_tool_pool import POOL_MODES, RULE_PROFILES
+from src.batch import BatchRunner, collect_files
+from src.cache import ResultCache
+from src.checker import ANALYZER_NAMES, PIPELINE_PROFILES, ParagraphChecker, select_analyzers
 from src.display import ResultDisplay
+from src.segmentation import read_lines
+from src.server import (
+    DEFAULT_ADDRESS, SettingsMismatchError, request_analysis, results_from_output
+)
+from src.streaming import StreamAnalysis
 
 
 @click.command()
@@ -36,9 +45,222 @@ from src.display import ResultDisplay
     is_flag=True,
     help="Show detailed explanations",
 )
-def main(text_input, file_path, output, verbose):
+@click.option(
+    "--batch",
+    "-b",
+    "batch_paths",
+    multiple=True,
+    help="Directory, glob or file to analyze in batch mode (repeatable)",
+    type=str,
+)
+@click.option(
+    "--manifest",
+    "-m",
+    help="File listing one path per line to analyze in batch mode",
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--output-dir",
+    default="results",
+    show_default=True,
+    help="Directory for per-file results in batch mode",
+    type=click.Path(),
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=None,
+    help="Number of worker processes in batch mode (default: CPU count)",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--concurrent",
+    is_flag=True,
+    help="Run the grammar check alongside spaCy parsing",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    help="Run only this analyzer (repeatable)",
+    type=click.Choice(ANALYZER_NAMES),
+)
+@click.option(
+    "--skip",
+    multiple=True,
+    help="Skip this analyzer (repeatable)",
+    type=click.Choice(ANALYZER_NAMES),
+)
+@click.option(
+    "--pipeline",
+    default="lean",
+    show_default=True,
+    help="spaCy pipeline profile: 'full', 'lean' (no entity recognizer, same "
+         "results) or 'senter' (sentence recognizer instead of the parser)",
+    type=click.Choice(list(PIPELINE_PROFILES)),
+)
+@click.option(
+    "--extra-indices",
+    is_flag=True,
+    help="Also report the SMOG, Coleman-Liau and automated readability indices",
+)
+@click.option(
+    "--grammar-profile",
+    default="default",
+    show_default=True,
+    help="LanguageTool rules: 'full' (LanguageTool's defaults), 'default' (without "
+         "the speller and style rules of the enabled local analyzers), 'fast' (grammar and "
+         "punctuation only) or 'picky' (adds picky rules)",
+    type=click.Choice(list(RULE_PROFILES)),
+)
+@click.option(
+    "--grammar-workers",
+    default=1,
+    show_default=True,
+    help="LanguageTool clients checking chunks of the text in parallel",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--grammar-pool",
+    "grammar_pool_mode",
+    default="shared",
+    show_default=True,
+    help="'shared': one local LanguageTool server for all grammar workers; "
+         "'servers': one server per worker",
+    type=click.Choice(list(POOL_MODES)),
+)
+@click.option(
+    "--grammar-server",
+    help="URL of a running LanguageTool server to use for the grammar check",
+    type=str,
+)
+@click.option(
+    "--grammar-cache",
+    "grammar_cache_path",
+    help="JSON file used to keep LanguageTool results of single paragraphs "
+         "between runs (implies --grammar-cache-size 10000 if not given)",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--grammar-cache-size",
+    default=0,
+    show_default=True,
+    help="Cache LanguageTool results of this many distinct paragraphs and check "
+         "grammar paragraph by paragraph (0: check the whole text, no cache)",
+    type=click.IntRange(min=0),
+)
+@click.option(
+    "--server",
+    "use_server",
+    is_flag=True,
+    help="Send the text to a running paragraph-checker-server daemon "
+         "(falls back to in-process analysis if none is running)",
+)
+@click.option(
+    "--server-address",
+    default=DEFAULT_ADDRESS,
+    show_default=True,
+    help="host:port of the daemon used with --server",
+)
+@click.option(
+    "--cache",
+    "cache_path",
+    help="SQLite file used to cache results of previously analyzed text",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--cache-size",
+    default=256,
+    show_default=True,
+    help="Maximum cache size in megabytes before old results are evicted",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Analyze --file in bounded chunks and print issues as they are found "
+         "(--output is written as JSON Lines, one issue per line)",
+)
+@click.option(
+    "--chunk-size",
+    default=20000,
+    show_default=True,
+    help="Target chunk size in characters for --stream",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--suggestion-cache",
+    "suggestion_cache_path",
+    help="JSON file used to keep spelling suggestions between runs",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--symspell-index",
+    "symspell_index_path",
+    help="Use a precomputed symmetric-delete index for spelling suggestions, "
+         "stored in this file (built on first use)",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--wordy-phrases",
+    "wordy_phrases_path",
+    help="JSON file mapping wordy phrases to replacements for the style check",
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--deadline",
+    help="Return within this many seconds, skipping or cutting short the "
+         "slowest analyzers if needed (partial results are marked in the summary)",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the time spent in each analysis stage (model loading, parsing, "
+         "each analyzer and style check, spelling candidates)",
+)
+def main(text_input, file_path, output, verbose, batch_paths, manifest,
+         output_dir, workers, concurrent, only, skip, pipeline, extra_indices,
+         grammar_profile, grammar_workers, grammar_pool_mode, grammar_server, grammar_cache_path,
+         grammar_cache_size, use_server,
+         server_address, cache_path, cache_size, stream, chunk_size,
+         suggestion_cache_path, symspell_index_path, wordy_phrases_path, deadline,
+         profile):
     """Analyze text for grammar, spelling, and style issues."""
     
+    analyzers = select_analyzers(only, skip)
+    if not analyzers:
+        click.echo("Error: --only/--skip leave no analyzers to run")
+        sys.exit(1)
+    
+    checker_kwargs = {
+        "concurrent": concurrent,
+        "analyzers": analyzers,
+        "suggestion_cache_path": suggestion_cache_path,
+        "symspell_index_path": symspell_index_path,
+        "wordy_phrases_path": wordy_phrases_path,
+        "pipeline": pipeline,
+        "extra_indices": extra_indices,
+        "grammar_profile": grammar_profile,
+        "grammar_workers": grammar_workers,
+        "grammar_pool_mode": grammar_pool_mode,
+        "grammar_server": grammar_server,
+        "grammar_cache_size": grammar_cache_size or (10000 if grammar_cache_path else 0),
+        "grammar_cache_path": grammar_cache_path
+    }
+    if cache_path:
+        checker_kwargs["cache"] = ResultCache(cache_path, cache_size * 1024 * 1024)
+    
+    if batch_paths or manifest:
+        run_batch(batch_paths, manifest, output_dir, workers, checker_kwargs)
+        return
+    
+    if stream:
+        if not file_path:
+            click.echo("Error: --stream requires --file")
+            sys.exit(1)
+        run_stream(file_path, output, verbose, chunk_size, checker_kwargs)
+        return
+    
     # Validate input
     if not text_input and not file_path:
         click.echo("Error: Please provide either --input or --file")
@@ -57,18 +279,57 @@ def main(text_input, file_path, output, verbose):
     else:
         text = text_input
     
-    # Initialize checker
     try:
-        click.echo("Initializing Paragraph Checker...")
-        checker = ParagraphChecker()
-        click.echo("Analysis in progress...\n")
+        results = None
         
-        # Analyze text
-        results = checker.analyze(text)
+        # Try the resident daemon first; it already has warm models
+        if use_server:
+            # The daemon refuses the request if its models or settings
+            # differ from what these options would analyze with
+            fingerprint = ParagraphChecker(**checker_kwargs).fingerprint
+            try:
+                output_data = request_analysis(
+                    text, server_address, analyzers if (only or skip) else None,
+                    deadline=deadline, fingerprint=fingerprint
+                )
+            except SettingsMismatchError as e:
+                click.echo(f"{e}; analyzing in-process.")
+                output_data = None
+            else:
+                if output_data is None:
+                    click.echo(f"No server answered at {server_address}, "
+                               "analyzing in-process.")
+            if output_data is not None:
+                results = results_from_output(output_data)
+        
+        if results is None:
+            # Initialize checker
+            click.echo("Initializing Paragraph Checker...")
+            checker = ParagraphChecker(profile=profile, **checker_kwargs)
+            click.echo("Analysis in progress...\n")
+            
+            # Analyze text
+            results = checker.analyze(text, deadline=deadline)
+            if checker.cache is not None:
+                stats = checker.cache.stats()
+                click.echo(f"Cache: {stats['hits']} hit(s), {stats['misses']} "
+                           f"miss(es), {stats['entries']} entries\n")
+            paragraph_cache = checker.paragraph_cache
+            if paragraph_cache is not None:
+                stats = paragraph_cache.stats()
+                click.echo(f"Grammar cache: {stats['hits']} paragraph hit(s), "
+                           f"{stats['misses']} miss(es), hit rate {stats['hit_rate']:.0%}, "
+                           f"~{stats['time_saved_seconds']:.1f}s saved\n")
+            checker.close()
         
         # Display results
         display = ResultDisplay(verbose=verbose)
         display.show_results(results, text)
+        if profile:
+            if "timings" in results:
+                display.show_timings(results["timings"])
+            else:
+                click.echo("No timings: the text was analyzed by the daemon\n")
         
         # Save to file if requested
         if output:
@@ -80,5 +341,70 @@ def main(text_input, file_path, output, verbose):
         sys.exit(1)
 
 
+def run_batch(batch_paths, manifest, output_dir, workers, checker_kwargs):
+    """Analyze many files with a pool of workers and report throughput."""
+    files = collect_files(batch_paths, manifest)
+    if not files:
+        click.echo("Error: No files matched the given --batch/--manifest paths")
+        sys.exit(1)
+    
+    runner = BatchRunner(workers=workers, checker_kwargs=checker_kwargs)
+    
+    click.echo(f"Analyzing {len(files)} files with {runner.workers} workers...\n")
+    
+    def report(result):
+        if result["error"]:
+            click.echo(f"  FAILED {result['file']}: {result['error']}")
+        else:
+            click.echo(f"  {result['file']}: {result['issues']} issues")
+    
+    batch = runner.run(files, output_dir, progress=report)
+    summary = batch["summary"]
+    
+    click.echo("\nBatch complete:")
+    click.echo(f"  Documents: {summary['documents']} ({summary['failed']} failed)")
+    click.echo(f"  Words: {summary['words']}")
+    click.echo(f"  Elapsed: {summary['elapsed_seconds']}s")
+    click.echo(f"  Throughput: {summary['docs_per_second']} docs/sec, "
+               f"{summary['words_per_second']} words/sec")
+    click.echo(f"  Results written to: {output_dir}")
+    
+    if summary["failed"]:
+        sys.exit(1)
+
+
+def run_stream(file_path, output, verbose, chunk_size, checker_kwargs):
+    """Analyze a large file chunk by chunk, printing issues as they arrive."""
+    display = ResultDisplay(verbose=verbose)
+    output_file = None
+    
+    try:
+        checker = ParagraphChecker(**checker_kwargs)
+        analysis = StreamAnalysis(checker, max_chunk_chars=chunk_size)
+        click.echo(f"Streaming file: {file_path}\n")
+        
+        if output:
+            output_file = open(output, "w", encoding="utf-8")
+        
+        with open(file_path, "r", encoding="utf-8") as f:
+            # Lines are read in pieces, so a file without line breaks
+            # does not have to fit in memory
+            lines = read_lines(f, chunk_size)
+            for number, issue in enumerate(analysis.analyze(lines), 1):
+                display.show_issue(issue, number)
+                if output_file:
+                    output_file.write(json.dumps(issue.to_dict(), ensure_ascii=False) + "\n")
+        
+        display.show_totals(analysis.statistics, analysis.summary)
+        checker.close()
+    except Exception as e:
+        click.echo(f"Error during analysis: {e}")
+        sys.exit(1)
+    finally:
+        if output_file:
+            output_file.close()
+            click.echo(f"\nIssues saved to: {output}")
+
+
 if __name__ == "__main__":
     main()
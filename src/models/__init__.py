@@ -2,5 +2,8 @@
 """Data models for the paragraph checker."""
 
 from src.models.issue import Issue, IssueType, Severity
+from src.models.issue_index import IssueIndex, merge_issues
+from src.models.issue_table import IssueTable
+from src.models.templates import MessageTemplate, TEMPLATES
 
-__all__ = ["Issue", "IssueType", "Severity"]
+__all__ = ["Issue", "IssueType", "Severity", "IssueTable", "IssueIndex", "merge_issues", "MessageTemplate", "TEMPLATES"]
@@ -1,9 +1,14 @@
 # WARNING: template code, may need edits
 """Data models for representing issues found in text."""
 
-from dataclasses import dataclass
+import copy
+import sys
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
+from src.models.templates import TEMPLATES
+
+# Characters shown on each side of an issue in its context
+CONTEXT_WINDOW = 30
 
 
 class IssueType(Enum):
@@ -23,19 +28,156 @@ class Severity(Enum):
     SUGGESTION = "Suggestion"
 
 
-@dataclass
 class Issue:
-    """Represents a single issue found in the text."""
-    
-    issue_type: IssueType
-    severity: Severity
-    position: int
-    length: int
-    message: str
-    explanation: str
-    learning_tip: str
-    context: str
-    suggested_fix: Optional[str] = None
+    """Represents a single issue found in the text.
+    
+    Issues are slotted and keep as little per-issue data as possible. An
+    issue created with a ``rule_id`` takes its message, explanation and
+    learning tip from the shared template in ``TEMPLATES`` and only stores
+    the template parameters; the texts are formatted when read. Issues
+    created with explicit texts (such as those read back by ``from_dict``)
+    store them, interned so that repeated texts are shared.
+    
+    The context is built the first time it is read. Analyzers pass the
+    analyzed ``source`` text, which all issues of a text share, instead of
+    a context string; issues that are only counted or serialized to
+    positions never build one.
+    """
+    
+    __slots__ = (
+        "issue_type", "severity", "position", "length", "suggested_fix",
+        "rule_id", "params", "_texts", "_context", "_source",
+        "_source_offset", "_window"
+    )
+    
+    def __init__(
+        self,
+        issue_type: IssueType,
+        severity: Severity,
+        position: int,
+        length: int,
+        message: Optional[str] = None,
+        explanation: Optional[str] = None,
+        learning_tip: Optional[str] = None,
+        context: Optional[str] = None,
+        suggested_fix: Optional[str] = None,
+        rule_id: Optional[str] = None,
+        params: Tuple = (),
+        source: Optional[str] = None,
+        window: int = CONTEXT_WINDOW
+    ):
+        """Initialize an issue.
+        
+        Args:
+            issue_type: Kind of issue
+            severity: How serious the issue is
+            position: Character offset of the issue in the text
+            length: Length of the flagged text
+            message: Short description (omit when using ``rule_id``)
+            explanation: Longer explanation (omit when using ``rule_id``)
+            learning_tip: Educational tip (omit when using ``rule_id``)
+            context: Text around the issue with the issue highlighted
+                (omit when using ``source``)
+            suggested_fix: Optional replacement
+            rule_id: Key of the issue's template in ``TEMPLATES``
+            params: Template parameters, in the order of its ``fields``
+            source: Analyzed text ``position`` refers to, from which the
+                context is built when first read
+            window: Characters of ``source`` shown on each side of the issue
+        """
+        self.issue_type = issue_type
+        self.severity = severity
+        self.position = position
+        self.length = length
+        self.suggested_fix = suggested_fix
+        self.rule_id = rule_id
+        self.params = tuple(params)
+        
+        if message is None and explanation is None and learning_tip is None:
+            if rule_id not in TEMPLATES:
+                raise ValueError(
+                    f"Issue needs a message or a known rule_id, got {rule_id!r}"
+                )
+            self._texts = None
+        else:
+            self._texts = (
+                _intern(message), _intern(explanation), _intern(learning_tip)
+            )
+        
+        if context is None and source is None:
+            context = ""
+        self._context = context
+        self._source = source if context is None else None
+        self._source_offset = 0
+        self._window = window
+    
+    @property
+    def message(self) -> str:
+        """Short description of the issue."""
+        return self.texts()[0]
+    
+    @property
+    def explanation(self) -> str:
+        """Explanation of why this is an issue."""
+        return self.texts()[1]
+    
+    @property
+    def learning_tip(self) -> str:
+        """Tip that helps the writer avoid the issue."""
+        return self.texts()[2]
+    
+    @property
+    def context(self) -> str:
+        """Text around the issue with the issue highlighted."""
+        if self._context is None:
+            self._context = get_context(
+                self._source, self.position - self._source_offset,
+                self.length, self._window
+            )
+            self._source = None
+        return self._context
+    
+    @context.setter
+    def context(self, value: str):
+        self._context = value
+        self._source = None
+    
+    def texts(self) -> Tuple[str, str, str]:
+        """Return the message, explanation and learning tip together."""
+        if self._texts is not None:
+            return self._texts
+        
+        template = TEMPLATES[self.rule_id]
+        if not template.fields:
+            return template[:3]
+        values = dict(zip(template.fields, self.params))
+        return (
+            template.message.format_map(values),
+            template.explanation.format_map(values),
+            template.learning_tip.format_map(values)
+        )
+    
+    def _fields(self) -> tuple:
+        """Field values in constructor order, used for equality and repr."""
+        return (
+            self.issue_type, self.severity, self.position, self.length,
+            *self.texts(), self.context, self.suggested_fix
+        )
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        names = (
+            "issue_type", "severity", "position", "length", "message",
+            "explanation", "learning_tip", "context", "suggested_fix"
+        )
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(names, self._fields()))
+        return f"Issue({fields})"
     
     def __str__(self) -> str:
         """String representation of the issue."""
@@ -43,14 +185,67 @@ class Issue:
     
     def to_dict(self) -> dict:
         """Convert issue to dictionary."""
+        message, explanation, learning_tip = self.texts()
         return {
             "type": self.issue_type.value,
             "severity": self.severity.value,
             "position": self.position,
             "length": self.length,
-            "message": self.message,
-            "explanation": self.explanation,
-            "learning_tip": self.learning_tip,
+            "message": message,
+            "explanation": explanation,
+            "learning_tip": learning_tip,
             "context": self.context,
             "suggested_fix": self.suggested_fix
         }
+    
+    def shifted(self, offset: int) -> "Issue":
+        """Return a copy of the issue moved ``offset`` characters."""
+        issue = copy.copy(self)
+        issue.position = self.position + offset
+        # The source text still starts where it did
+        issue._source_offset = self._source_offset + offset
+        return issue
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Issue":
+        """Create an issue from the output of ``to_dict``."""
+        return cls(
+            issue_type=IssueType(data["type"]),
+            severity=Severity(data["severity"]),
+            position=data["position"],
+            length=data["length"],
+            message=data["message"],
+            explanation=data["explanation"],
+            learning_tip=data["learning_tip"],
+            context=data["context"],
+            suggested_fix=data.get("suggested_fix")
+        )
+
+
+def get_context(text: str, offset: int, length: int, window: int = CONTEXT_WINDOW) -> str:
+    """Extract the text around a span, with the span highlighted.
+    
+    Args:
+        text: The analyzed text
+        offset: Start of the span in ``text``
+        length: Length of the span
+        window: Characters shown on each side of the span
+        
+    Returns:
+        The surrounding text with the span marked as ``>>>span<<<``
+    """
+    start = max(0, offset - window)
+    end = min(len(text), offset + length + window)
+    
+    highlighted = (
+        text[start:offset] +
+        ">>>" + text[offset:offset + length] + "<<<" +
+        text[offset + length:end]
+    )
+    
+    return highlighted.strip()
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    """Share one copy of repeated texts."""
+    return sys.intern(text) if text is not None else None
@@ -0,0 +1,169 @@
+# WARNING: template code, may need edits
+"""Merging of overlapping issues and range queries over their spans."""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.models.issue import Issue, IssueType, Severity
+
+# Which issue to keep when several analyzers flag the same span. The
+# spelling analyzer's issues carry suggestions for the word, so they win
+# over LanguageTool's; LanguageTool's grammar and punctuation findings
+# win over the local style heuristics.
+TYPE_PRECEDENCE: Tuple[IssueType, ...] = (
+    IssueType.SPELLING,
+    IssueType.GRAMMAR,
+    IssueType.PUNCTUATION,
+    IssueType.WORD_CHOICE,
+    IssueType.CLARITY,
+    IssueType.STYLE,
+)
+
+_SEVERITY_RANKS = {severity: rank for rank, severity in enumerate(Severity)}
+
+
+def merge_issues(
+    issues: Iterable[Issue],
+    precedence: Sequence[IssueType] = TYPE_PRECEDENCE
+) -> List[Issue]:
+    """Collapse issues that cover the same span and sort them by position.
+    
+    Of the issues with the same position and length, the one whose type
+    comes first in ``precedence`` is kept; between issues of the same
+    type, the more severe one, then the first one. Issues that merely
+    overlap are all kept; use ``IssueIndex`` to find them.
+    
+    Args:
+        issues: Issues of one text, from any number of analyzers
+        precedence: Issue types from most to least preferred; types not
+            listed lose to all listed types
+    
+    Returns:
+        The remaining issues, sorted by position (ties keep their order)
+    """
+    type_ranks = {issue_type: rank for rank, issue_type in enumerate(precedence)}
+    last = len(type_ranks)
+    
+    def rank(issue: Issue) -> Tuple[int, int]:
+        return type_ranks.get(issue.issue_type, last), _SEVERITY_RANKS[issue.severity]
+    
+    kept: Dict[Tuple[int, int], Issue] = {}
+    for issue in issues:
+        span = (issue.position, issue.length)
+        current = kept.get(span)
+        if current is None or rank(issue) < rank(current):
+            kept[span] = issue
+    
+    merged = list(kept.values())
+    merged.sort(key=lambda x: x.position)
+    return merged
+
+
+class IssueIndex:
+    """Issues of a text indexed by the span they cover.
+    
+    Issues are sorted by start and arranged as an implicit balanced search
+    tree over that order: the middle issue of each range is the root of
+    the range, and each root stores the largest end in its range. A query
+    for the issues overlapping ``[start, end)`` skips every subtree that
+    ends before ``start`` or begins after ``end``, so it takes
+    O(log n + k) steps for k results instead of a scan of all issues.
+    
+    An issue covers ``[position, position + length)``; an issue of length
+    0 covers its position only. The tree is built on the first query.
+    """
+    
+    def __init__(self, issues: Iterable[Issue] = ()):
+        """Index issues.
+        
+        Args:
+            issues: Issues of one text, in any order
+        """
+        self._issues = sorted(issues, key=lambda x: x.position)
+        self._starts: Optional[List[int]] = None
+        self._ends: List[int] = []
+        self._max_ends: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._issues)
+    
+    def __iter__(self) -> Iterator[Issue]:
+        """The issues, sorted by position."""
+        return iter(self._issues)
+    
+    def _build(self):
+        """Compute the span arrays and the largest end below each tree node."""
+        self._starts = [issue.position for issue in self._issues]
+        self._ends = [issue.position + max(issue.length, 1) for issue in self._issues]
+        self._max_ends = [0] * len(self._issues)
+        
+        def fill(lo: int, hi: int) -> int:
+            if lo >= hi:
+                return -1
+            mid = (lo + hi) // 2
+            largest = max(self._ends[mid], fill(lo, mid), fill(mid + 1, hi))
+            self._max_ends[mid] = largest
+            return largest
+        
+        # Recursion depth is the tree height, about log2(n)
+        fill(0, len(self._issues))
+    
+    def in_range(self, start: int, end: int) -> List[Issue]:
+        """Issues that overlap the characters ``[start, end)``.
+        
+        Args:
+            start: First character of the range
+            end: Character after the range
+            
+        Returns:
+            The overlapping issues, sorted by position
+        """
+        if end <= start:
+            return []
+        if self._starts is None:
+            self._build()
+        
+        starts, ends, max_ends = self._starts, self._ends, self._max_ends
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_ends[mid] <= start:
+                # Everything in this subtree ends before the range
+                continue
+            stack.append((lo, mid))
+            if starts[mid] < end:
+                if ends[mid] > start:
+                    found.append(mid)
+                # Issues after ``mid`` start no earlier, so only look
+                # further right while ``mid`` itself starts in time
+                stack.append((mid + 1, hi))
+        
+        found.sort()
+        return [self._issues[i] for i in found]
+    
+    def at(self, position: int) -> List[Issue]:
+        """Issues that cover one character.
+        
+        Args:
+            position: Character offset in the text
+            
+        Returns:
+            The issues covering it, sorted by position
+        """
+        return self.in_range(position, position + 1)
+    
+    def overlapping(self, issue: Issue) -> List[Issue]:
+        """Other issues that overlap an issue's span.
+        
+        Args:
+            issue: An issue of the indexed text, indexed or not
+            
+        Returns:
+            The overlapping issues other than ``issue`` itself, sorted by
+            position
+        """
+        found = self.in_range(issue.position, issue.position + max(issue.length, 1))
+        return [other for other in found if other is not issue]
@@ -0,0 +1,317 @@
+# WARNING: template code, may need edits
+"""Columnar storage of issues for corpus-level analysis."""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.models.issue import Issue, IssueType, Severity
+
+# Members in the order of their codes in the type and severity columns
+ISSUE_TYPES = tuple(IssueType)
+SEVERITIES = tuple(Severity)
+
+_TYPE_CODES = {member: code for code, member in enumerate(ISSUE_TYPES)}
+_SEVERITY_CODES = {member: code for code, member in enumerate(SEVERITIES)}
+
+
+class IssueTable:
+    """Issues of one or more texts stored column by column.
+    
+    Positions, lengths, type and severity codes, rule codes and document
+    numbers are NumPy arrays with one entry per issue, so counts and
+    histograms are computed without touching Python objects. Rule codes
+    index ``rule_ids`` (-1 for issues without a rule ID) and document
+    numbers index ``sources``.
+    
+    The rest of each issue (texts or template parameters, suggested fix,
+    context) is kept alongside, and ``Issue`` objects are created again
+    only when the table is indexed or iterated. Contexts that were not
+    built yet stay lazy: they are built from ``sources`` when read.
+    """
+    
+    def __init__(self, issues: Sequence[Issue] = (), source: Optional[str] = None):
+        """Store issues of one text.
+        
+        Args:
+            issues: Issues to store
+            source: The analyzed text the issues' positions refer to
+        """
+        count = len(issues)
+        rule_codes = {}
+        
+        self.position = np.fromiter((i.position for i in issues), np.int64, count)
+        self.length = np.fromiter((i.length for i in issues), np.int64, count)
+        self.type_code = np.fromiter(
+            (_TYPE_CODES[i.issue_type] for i in issues), np.int8, count
+        )
+        self.severity_code = np.fromiter(
+            (_SEVERITY_CODES[i.severity] for i in issues), np.int8, count
+        )
+        self.rule_code = np.fromiter(
+            (-1 if i.rule_id is None else rule_codes.setdefault(i.rule_id, len(rule_codes))
+             for i in issues),
+            np.int16, count
+        )
+        self.document = np.zeros(count, dtype=np.int32)
+        self.rule_ids: List[str] = list(rule_codes)
+        self.sources: List[Optional[str]] = [source]
+        
+        self._texts = [issue._texts for issue in issues]
+        self._params = [issue.params for issue in issues]
+        self._suggested_fix = [issue.suggested_fix for issue in issues]
+        self._contexts = [self._stored_context(issue, source) for issue in issues]
+        self._window = np.fromiter((i._window for i in issues), np.int32, count)
+    
+    @staticmethod
+    def _stored_context(issue: Issue, source: Optional[str]) -> Optional[str]:
+        """The issue's context, or None if it can still be built from ``source``."""
+        if (issue._context is None and source is not None
+                and issue._source is source and issue._source_offset == 0):
+            return None
+        return issue.context
+    
+    @classmethod
+    def concat(cls, tables: Iterable["IssueTable"]) -> "IssueTable":
+        """Join the tables of several texts into one.
+        
+        Document numbers are renumbered so that each table's documents
+        follow the previous table's.
+        
+        Args:
+            tables: Tables to join, such as the ``issues`` of the results
+                of ``ParagraphChecker.analyze_many(texts, as_table=True)``
+                
+        Returns:
+            A table with the issues of all tables, in order
+        """
+        tables = list(tables)
+        result = cls()
+        if not tables:
+            return result
+        
+        rule_codes = {}
+        rule_columns = []
+        document_columns = []
+        sources = []
+        for table in tables:
+            # Map the table's rule codes to the joined rule list, keeping -1
+            mapping = np.array(
+                [rule_codes.setdefault(rule, len(rule_codes)) for rule in table.rule_ids] + [-1],
+                dtype=np.int16
+            )
+            rule_columns.append(mapping[table.rule_code])
+            document_columns.append(table.document + len(sources))
+            sources.extend(table.sources)
+        
+        result.position = np.concatenate([t.position for t in tables])
+        result.length = np.concatenate([t.length for t in tables])
+        result.type_code = np.concatenate([t.type_code for t in tables])
+        result.severity_code = np.concatenate([t.severity_code for t in tables])
+        result.rule_code = np.concatenate(rule_columns)
+        result.document = np.concatenate(document_columns)
+        result.rule_ids = list(rule_codes)
+        result.sources = sources
+        
+        result._texts = [text for t in tables for text in t._texts]
+        result._params = [params for t in tables for params in t._params]
+        result._suggested_fix = [fix for t in tables for fix in t._suggested_fix]
+        result._contexts = [context for t in tables for context in t._contexts]
+        result._window = np.concatenate([t._window for t in tables])
+        return result
+    
+    def __len__(self) -> int:
+        return len(self.position)
+    
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Issue, "IssueTable"]:
+        """Rebuild one issue, or select rows (a slice, mask or index array)."""
+        if isinstance(index, (int, np.integer)):
+            return self._issue(range(len(self))[index])
+        return self._take(np.arange(len(self))[index])
+    
+    def __iter__(self) -> Iterator[Issue]:
+        for i in range(len(self)):
+            yield self._issue(i)
+    
+    def to_issues(self) -> List[Issue]:
+        """Rebuild all issues as ``Issue`` objects."""
+        return list(self)
+    
+    def _issue(self, i: int) -> Issue:
+        """Rebuild the issue in row ``i``."""
+        message, explanation, learning_tip = self._texts[i] or (None, None, None)
+        rule_code = int(self.rule_code[i])
+        context = self._contexts[i]
+        
+        return Issue(
+            issue_type=ISSUE_TYPES[self.type_code[i]],
+            severity=SEVERITIES[self.severity_code[i]],
+            position=int(self.position[i]),
+            length=int(self.length[i]),
+            message=message,
+            explanation=explanation,
+            learning_tip=learning_tip,
+            context=context,
+            suggested_fix=self._suggested_fix[i],
+            rule_id=self.rule_ids[rule_code] if rule_code >= 0 else None,
+            params=self._params[i],
+            source=self.sources[self.document[i]] if context is None else None,
+            window=int(self._window[i])
+        )
+    
+    def _take(self, rows: np.ndarray) -> "IssueTable":
+        """A table with the given rows, in the given order."""
+        result = IssueTable()
+        result.position = self.position[rows]
+        result.length = self.length[rows]
+        result.type_code = self.type_code[rows]
+        result.severity_code = self.severity_code[rows]
+        result.rule_code = self.rule_code[rows]
+        result.document = self.document[rows]
+        result.rule_ids = list(self.rule_ids)
+        result.sources = list(self.sources)
+        
+        indices = rows.tolist()
+        result._texts = [self._texts[i] for i in indices]
+        result._params = [self._params[i] for i in indices]
+        result._suggested_fix = [self._suggested_fix[i] for i in indices]
+        result._contexts = [self._contexts[i] for i in indices]
+        result._window = self._window[rows]
+        return result
+    
+    def filter(
+        self,
+        issue_type: Optional[IssueType] = None,
+        severity: Optional[Severity] = None
+    ) -> "IssueTable":
+        """Select the issues of a type and/or severity.
+        
+        Args:
+            issue_type: Keep only issues of this type
+            severity: Keep only issues of this severity
+            
+        Returns:
+            A table with the matching issues
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if issue_type is not None:
+            mask &= self.type_code == _TYPE_CODES[issue_type]
+        if severity is not None:
+            mask &= self.severity_code == _SEVERITY_CODES[severity]
+        return self._take(np.flatnonzero(mask))
+    
+    def by_type(self) -> Dict[str, int]:
+        """Number of issues of each type, in order of first appearance."""
+        return self._counts(self.type_code, ISSUE_TYPES)
+    
+    def by_severity(self) -> Dict[str, int]:
+        """Number of issues of each severity, in order of first appearance."""
+        return self._counts(self.severity_code, SEVERITIES)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Issue counts in the form of an analysis result's ``summary``."""
+        return {
+            "total_issues": len(self),
+            "by_type": self.by_type(),
+            "by_severity": self.by_severity()
+        }
+    
+    @staticmethod
+    def _counts(codes: np.ndarray, members: tuple) -> Dict[str, int]:
+        """Count codes, keyed by the members' values."""
+        if not len(codes):
+            return {}
+        counts = np.bincount(codes, minlength=len(members))
+        present, first = np.unique(codes, return_index=True)
+        order = present[np.argsort(first)]
+        return {members[code].value: int(counts[code]) for code in order.tolist()}
+    
+    def histogram(self, bin_size: int = 1000, by: Optional[str] = None) -> np.ndarray:
+        """Count issues per stretch of ``bin_size`` characters.
+        
+        Args:
+            bin_size: Characters covered by each bin
+            by: "type" or "severity" to count each code separately
+            
+        Returns:
+            Counts per bin, or with ``by`` an array of shape (codes, bins)
+            whose rows follow ``ISSUE_TYPES`` or ``SEVERITIES``
+        """
+        bins = self.position // bin_size
+        n_bins = int(bins.max()) + 1 if len(bins) else 0
+        if by is None:
+            return np.bincount(bins, minlength=n_bins)
+        
+        if by == "type":
+            codes, n_codes = self.type_code, len(ISSUE_TYPES)
+        elif by == "severity":
+            codes, n_codes = self.severity_code, len(SEVERITIES)
+        else:
+            raise ValueError(f"by must be 'type' or 'severity', got {by!r}")
+        
+        flat = codes.astype(np.int64) * n_bins + bins
+        return np.bincount(flat, minlength=n_codes * n_bins).reshape(n_codes, n_bins)
+    
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """The numeric columns, without copying.
+        
+        Returns:
+            Dictionary of ``position``, ``length``, ``type_code``,
+            ``severity_code``, ``rule_code`` and ``document`` arrays
+        """
+        return {
+            "position": self.position,
+            "length": self.length,
+            "type_code": self.type_code,
+            "severity_code": self.severity_code,
+            "rule_code": self.rule_code,
+            "document": self.document
+        }
+    
+    def to_arrow(self):
+        """The numeric columns as a ``pyarrow.Table``.
+        
+        Numeric columns are shared with the table's arrays. Type, severity
+        and rule ID are dictionary-encoded columns; issues without a rule
+        ID are null. Requires pyarrow.
+        
+        Returns:
+            A ``pyarrow.Table`` with one row per issue
+        """
+        pa = _import_pyarrow()
+        
+        def dictionary(codes, values):
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(values, type=pa.string())
+            )
+        
+        return pa.table({
+            "position": pa.array(self.position),
+            "length": pa.array(self.length),
+            "type": dictionary(self.type_code, [t.value for t in ISSUE_TYPES]),
+            "severity": dictionary(self.severity_code, [s.value for s in SEVERITIES]),
+            "rule_id": dictionary(self.rule_code, self.rule_ids),
+            "document": pa.array(self.document)
+        })
+    
+    def write_parquet(self, path: str):
+        """Write the columns of ``to_arrow`` to a Parquet file.
+        
+        Args:
+            path: Output file
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+        
+        pq.write_table(self.to_arrow(), path)
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for Arrow and Parquet export."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet export need pyarrow: pip install paragraph_checker[arrow]"
+        ) from e
+    return pyarrow
@@ -0,0 +1,95 @@
+# WARNING: template code, may need edits
+"""Shared message templates for issues, keyed by rule ID."""
+
+from typing import Dict, NamedTuple, Tuple
+
+
+class MessageTemplate(NamedTuple):
+    """Static texts of one kind of issue.
+
+    The texts are ``str.format`` templates filled with the issue's
+    parameters, given in the order of ``fields``.
+    """
+    message: str
+    explanation: str
+    learning_tip: str
+    fields: Tuple[str, ...] = ()
+
+
+_GRAMMAR_MESSAGE = "{message}"
+_GRAMMAR_EXPLANATION = "{message}{description}"
+_GRAMMAR_FIELDS = ("message", "description")
+
+TEMPLATES: Dict[str, MessageTemplate] = {
+    # Spelling
+    "SPELLING": MessageTemplate(
+        message="Possible spelling error: '{word}'",
+        explanation="The word '{word}' may be misspelled. Did you mean one of these?",
+        learning_tip=(
+            "When unsure about spelling, try these strategies:\n"
+            "1. Break the word into syllables and sound it out\n"
+            "2. Look for common prefixes and suffixes\n"
+            "3. Remember similar words you know how to spell\n"
+            "\nFor '{word}', consider: {suggestions}"
+        ),
+        fields=("word", "suggestions"),
+    ),
+
+    # Style
+    "WEAK_WORD": MessageTemplate(
+        message="Weak word: '{word}'",
+        explanation="The word '{word}' is a weak intensifier that often adds little meaning.",
+        learning_tip="Try removing this word or replacing it with a more specific, stronger word. Ask yourself: Does this word add meaningful information?",
+        fields=("word",),
+    ),
+    "PASSIVE_VOICE": MessageTemplate(
+        message="Possible passive voice",
+        explanation="This sentence may be in passive voice, which can make writing less direct and engaging.",
+        learning_tip="Active voice tip: Identify who/what is performing the action and make them the subject. Example: 'The ball was thrown by John' \x0217 'John threw the ball'",
+    ),
+    "WORDY_PHRASE": MessageTemplate(
+        message="Wordy phrase: '{phrase}'",
+        explanation="The phrase '{phrase}' can be simplified to make your writing more concise.",
+        learning_tip="Conciseness tip: Replace '{key}' with '{replacement}'. Simpler phrases make your writing clearer and more direct.",
+        fields=("phrase", "key", "replacement"),
+    ),
+    "LONG_SENTENCE": MessageTemplate(
+        message="Long sentence ({word_count} words)",
+        explanation="This sentence is quite long and may be hard to follow.",
+        learning_tip="Long sentence tip: Try breaking this into 2-3 shorter sentences. Look for natural break points like 'and', 'but', or semicolons. Each sentence should express one main idea.",
+        fields=("word_count",),
+    ),
+    "REPEATED_WORD": MessageTemplate(
+        message="Repeated word: '{word}'",
+        explanation="The word '{word}' appears multiple times in close proximity.",
+        learning_tip="Repetition tip: Use synonyms or rephrase to avoid repetition. This makes your writing more engaging and professional.",
+        fields=("word",),
+    ),
+
+    # Grammar (LanguageTool); the message and rule description come from the match
+    "GRAMMAR_COMMA": MessageTemplate(
+        _GRAMMAR_MESSAGE, _GRAMMAR_EXPLANATION,
+        "Remember: Use commas to separate clauses and items in a list. Consider the sentence structure and natural pauses.",
+        _GRAMMAR_FIELDS,
+    ),
+    "GRAMMAR_AGREEMENT": MessageTemplate(
+        _GRAMMAR_MESSAGE, _GRAMMAR_EXPLANATION,
+        "Subject-verb agreement: Make sure your subject and verb match in number (singular/plural).",
+        _GRAMMAR_FIELDS,
+    ),
+    "GRAMMAR_TENSE": MessageTemplate(
+        _GRAMMAR_MESSAGE, _GRAMMAR_EXPLANATION,
+        "Verb tense consistency: Keep your tenses consistent unless you're deliberately shifting time frames.",
+        _GRAMMAR_FIELDS,
+    ),
+    "GRAMMAR_ARTICLE": MessageTemplate(
+        _GRAMMAR_MESSAGE, _GRAMMAR_EXPLANATION,
+        "Articles (a, an, the): Use 'a' before consonant sounds, 'an' before vowel sounds, 'the' for specific items.",
+        _GRAMMAR_FIELDS,
+    ),
+    "GRAMMAR": MessageTemplate(
+        _GRAMMAR_MESSAGE, _GRAMMAR_EXPLANATION,
+        "Review the grammar rule mentioned and practice identifying similar patterns in your writing.",
+        _GRAMMAR_FIELDS,
+    ),
+}
@@ -0,0 +1,150 @@
+# WARNING: template code, may need edits
+"""Optional timing of the stages of an analysis."""
+
+import contextlib
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Called with a stage name and the stage's wall time in seconds each time a
+# stage ends, e.g. to forward timings to a metrics system
+ProfileHook = Callable[[str, float], None]
+
+# The profiler of the analysis running in the current thread or task
+_active: ContextVar[Optional["Profiler"]] = ContextVar("profiler", default=None)
+
+_NOT_PROFILED = contextlib.nullcontext()
+
+
+class Profiler:
+    """Wall time and number of calls of each stage of one analysis.
+    
+    Code running while the profiler is active (see ``activate``) records
+    stages with the module-level ``stage`` function, so analyzers do not
+    need a reference to the profiler. Stages may nest; a stage named
+    "style.passive_voice" is part of the "style" stage. Stages can be
+    recorded from several threads at once.
+    """
+    
+    def __init__(self, hooks: Iterable[ProfileHook] = ()):
+        """Initialize an empty profile.
+        
+        Args:
+            hooks: Functions called with (stage, seconds) whenever a stage
+                ends
+        """
+        self.hooks: List[ProfileHook] = list(hooks)
+        self.elapsed = 0.0
+        self._stages: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, name: str, seconds: float):
+        """Add one call of a stage.
+        
+        Args:
+            name: Stage name
+            seconds: Wall time of the call
+        """
+        with self._lock:
+            entry = self._stages.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+        for hook in self.hooks:
+            hook(name, seconds)
+    
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time the code in a ``with`` block as one call of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    @contextlib.contextmanager
+    def activate(self):
+        """Make this the profiler that ``stage`` records to.
+        
+        The time spent in the block is added to ``elapsed``. Threads
+        started in the block only see the profiler if they run in a copy
+        of the current context (``contextvars.copy_context().run``).
+        """
+        token = _active.set(self)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.elapsed += time.perf_counter() - start
+            _active.reset(token)
+    
+    def finish(self) -> Dict[str, Dict[str, float]]:
+        """Record the active time as the "total" stage and return the timings."""
+        self.record("total", self.elapsed)
+        return self.timings()
+    
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """Seconds and calls per stage, "total" first, then in the order stages first ended.
+        
+        Returns:
+            Dictionary mapping stage names to ``{"seconds": ..., "calls": ...}``
+        """
+        with self._lock:
+            names = sorted(self._stages, key=lambda name: name != "total")
+            return {
+                name: {
+                    "seconds": round(self._stages[name][0], 6),
+                    "calls": self._stages[name][1]
+                }
+                for name in names
+            }
+
+
+def stage(name: str):
+    """Time a ``with`` block as a stage of the active profiler.
+    
+    Does nothing when no profiler is active, so analyzers can mark their
+    stages unconditionally.
+    
+    Args:
+        name: Stage name; use "parent.child" for parts of a stage
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _NOT_PROFILED
+    return profiler.stage(name)
+
+
+def format_timings(timings: Dict[str, Dict[str, float]]) -> List[str]:
+    """Lines of a table of stage timings, parts indented under their stage.
+    
+    Args:
+        timings: The ``timings`` of an analysis result
+        
+    Returns:
+        Lines with each stage's seconds, calls and share of the total
+    """
+    total = timings.get("total", {}).get("seconds") or sum(
+        entry["seconds"] for name, entry in timings.items() if "." not in name
+    )
+    
+    # Stages end after their parts, so place each stage where its first
+    # part (or the stage itself) ended, with the parts following it
+    def prefixes(name):
+        parts = name.split(".")
+        return [".".join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+    
+    first = {}
+    for i, name in enumerate(timings):
+        for prefix in prefixes(name):
+            first.setdefault(prefix, i)
+    names = sorted(timings, key=lambda name: [first[prefix] for prefix in prefixes(name)])
+    
+    lines = [f"{'stage':<32}{'seconds':>10}{'calls':>8}{'share':>8}"]
+    for name in names:
+        entry = timings[name]
+        depth = name.count(".")
+        label = "  " * depth + name.rsplit(".", 1)[-1]
+        share = entry["seconds"] / total if total else 0.0
+        lines.append(f"{label:<32}{entry['seconds']:>10.4f}{entry['calls']:>8}{share:>8.1%}")
+    return lines
@@ -0,0 +1,180 @@
+# WARNING: template code, may need edits
+"""Splitting text into paragraphs with their character offsets."""
+
+import re
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, TextIO, Tuple
+
+# One or more blank lines separate paragraphs
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+
+# The last whitespace character of a text
+_LAST_WHITESPACE = re.compile(r"\s\S*\Z")
+
+
+def split_paragraphs(text: str) -> List[Tuple[int, str]]:
+    """Split text into paragraphs.
+    
+    Args:
+        text: The text to split
+        
+    Returns:
+        List of (offset, paragraph) pairs, where each paragraph is stripped
+        of surrounding whitespace and ``offset`` is where it starts in text
+    """
+    paragraphs = []
+    start = 0
+    
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        _append_stripped(text, start, match.start(), paragraphs)
+        start = match.end()
+    _append_stripped(text, start, len(text), paragraphs)
+    
+    return paragraphs
+
+
+def _append_stripped(text: str, start: int, end: int, pieces: list):
+    """Append the stripped text between start and end, if any."""
+    chunk = text[start:end]
+    stripped = chunk.strip()
+    if stripped:
+        offset = start + len(chunk) - len(chunk.lstrip())
+        pieces.append((offset, stripped))
+
+
+def iter_chunks(
+    lines: Iterable[str],
+    max_chars: int = 20000
+) -> Iterator[Tuple[int, str]]:
+    """Group lines into chunks that end at paragraph breaks.
+    
+    A chunk is closed at the first blank line once it holds ``max_chars``
+    characters. A single paragraph longer than twice that is split at its
+    last line break within the limit instead, and a line longer than the
+    limit at its last whitespace (or at the limit itself if it has none),
+    so chunks never exceed ``2 * max_chars`` characters.
+    
+    Args:
+        lines: Lines of text including their newline characters, such as
+            an open file or ``read_lines`` of one; a line may also arrive
+            in several pieces
+        max_chars: Target chunk size in characters
+        
+    Returns:
+        Iterator of (offset, chunk) pairs, where ``offset`` is where the
+        chunk starts in the concatenated input
+    """
+    limit = 2 * max_chars
+    buffer = []
+    size = 0
+    offset = 0
+    
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        
+        at_paragraph_break = not line.strip()
+        if at_paragraph_break and size >= max_chars:
+            chunk = "".join(buffer)
+            if chunk.strip():
+                yield offset, chunk
+            offset += size
+            buffer = []
+            size = 0
+        elif size >= limit:
+            text = "".join(buffer)
+            while len(text) >= limit:
+                end = _cut_position(text, limit)
+                if text[:end].strip():
+                    yield offset, text[:end]
+                offset += end
+                text = text[end:]
+            buffer = [text]
+            size = len(text)
+    
+    chunk = "".join(buffer)
+    if chunk.strip():
+        yield offset, chunk
+
+
+def _cut_position(text: str, limit: int) -> int:
+    """Where to cut text so the first part holds at most ``limit`` characters.
+    
+    After the last line break within the limit, else after the last
+    whitespace, else at the limit itself.
+    """
+    end = text.rfind("\n", 0, limit) + 1
+    if end:
+        return end
+    match = _LAST_WHITESPACE.search(text, 0, limit)
+    return match.start() + 1 if match else limit
+
+
+def read_lines(file: TextIO, max_chars: int = 20000) -> Iterator[str]:
+    """Read the lines of a file, in pieces of at most ``max_chars``.
+    
+    Unlike iterating over the file, a line without line breaks is never
+    held in memory as a whole.
+    
+    Args:
+        file: Text file open for reading
+        max_chars: Longest piece returned
+        
+    Returns:
+        Iterator of lines, where longer lines arrive in several pieces
+    """
+    return iter(lambda: file.readline(max_chars), "")
+
+
+def split_chunks(text: str, max_chars: int) -> List[Tuple[int, str]]:
+    """Split text into chunks of whole paragraphs.
+    
+    Each chunk holds as many whole paragraphs as fit in ``max_chars``; a
+    paragraph longer than that becomes a chunk of its own. Paragraphs are
+    never cut, since sentence boundaries found with a regular expression
+    are not reliable ("Dr. Smith", "e.g."). The chunks cover the text
+    without gaps, so joining them gives it back.
+    
+    Args:
+        text: The text to split
+        max_chars: Target chunk size in characters
+        
+    Returns:
+        List of (offset, chunk) pairs, where ``offset`` is where the chunk
+        starts in text
+    """
+    if len(text) <= max_chars:
+        return [(0, text)]
+    
+    # Positions where a new paragraph starts
+    paragraph_starts = [m.end() for m in _PARAGRAPH_BREAK.finditer(text)]
+    
+    chunks = []
+    start = 0
+    while len(text) - start > max_chars:
+        limit = start + max_chars
+        end = (_last_between(paragraph_starts, start, limit)
+               or _first_between(paragraph_starts, limit, len(text)))
+        if end is None:
+            break
+        chunks.append((start, text[start:end]))
+        start = end
+    chunks.append((start, text[start:]))
+    
+    return chunks
+
+
+def _last_between(positions: List[int], low: int, high: int):
+    """Last of the sorted positions in (low, high], or None."""
+    i = bisect_right(positions, high)
+    if i and positions[i - 1] > low:
+        return positions[i - 1]
+    return None
+
+
+def _first_between(positions: List[int], low: int, high: int):
+    """First of the sorted positions in (low, high), or None."""
+    i = bisect_right(positions, low)
+    if i < len(positions) and positions[i] < high:
+        return positions[i]
+    return None
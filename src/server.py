@@ -0,0 +1,298 @@
+# WARNING: template code, may need edits
+"""Resident analysis daemon and a thin client for the CLI."""
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional
+
+import click
+
+from src.analyzers.language_tool_pool import RULE_PROFILES
+from src.checker import ANALYZER_NAMES, PIPELINE_PROFILES, ParagraphChecker, select_analyzers
+from src.display import ResultDisplay
+from src.models.issue import Issue
+from src.models.issue_index import IssueIndex
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+
+class SettingsMismatchError(RuntimeError):
+    """The daemon's checker settings differ from those of the request."""
+
+
+def parse_address(address: str) -> tuple:
+    """Split a ``host:port`` string into its parts."""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """Localhost HTTP server that keeps one warm ParagraphChecker."""
+
+    daemon_threads = True
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, checker=None):
+        """Initialize the server.
+
+        Args:
+            address: ``host:port`` to listen on
+            checker: Checker to serve (a full ParagraphChecker by default)
+        """
+        super().__init__(parse_address(address), _AnalysisRequestHandler)
+        self.checker = checker or ParagraphChecker()
+        self.display = ResultDisplay()
+        # The checker and its models are not safe for concurrent calls
+        self.lock = threading.Lock()
+
+    def analyze(
+        self,
+        text: str,
+        analyzers: Optional[Iterable[str]] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Analyze text and return it in the ``save_to_file`` JSON schema.
+
+        ``deadline`` is the time budget in seconds of the analysis itself,
+        not counting the wait for requests that arrived earlier.
+        """
+        with self.lock:
+            results = self.checker.analyze(text, analyzers=analyzers, deadline=deadline)
+        return self.display.build_output_data(results, text)
+
+    def warm_up(self):
+        """Load every model the checker needs before taking requests."""
+        self.analyze("This sentence warms up the models.")
+
+
+class _AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """Handles ``GET /health`` and ``POST /analyze`` requests."""
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/analyze":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length).decode("utf-8"))
+            text = request["text"]
+            analyzers = request.get("analyzers")
+            if analyzers is not None:
+                analyzers = select_analyzers(analyzers)
+            deadline = request.get("deadline")
+            if deadline is not None:
+                deadline = float(deadline)
+                if deadline < 0:
+                    raise ValueError("deadline must not be negative")
+            fingerprint = request.get("fingerprint")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"Bad request: {e}"})
+            return
+
+        if fingerprint is not None:
+            differences = settings_differences(fingerprint, self.server.checker.fingerprint)
+            if differences:
+                self._send_json(409, {
+                    "error": "The server's settings differ from the request's",
+                    "differences": differences
+                })
+                return
+
+        try:
+            self._send_json(200, self.server.analyze(text, analyzers, deadline))
+        except Exception as e:
+            self._send_json(500, {"error": f"Analysis failed: {e}"})
+
+    def _send_json(self, status: int, data: Dict[str, Any]):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep request logging out of the console."""
+
+
+def settings_differences(requested: str, served: str) -> List[str]:
+    """Entries of a requested checker fingerprint that the served one lacks.
+
+    Args:
+        requested: ``ParagraphChecker.fingerprint`` of the client's settings
+        served: Fingerprint of the daemon's checker
+
+    Returns:
+        The client's "name=value" entries that differ, e.g. "pipeline=senter"
+    """
+    served_entries = set(served.split(";"))
+    return [entry for entry in requested.split(";") if entry not in served_entries]
+
+
+def request_analysis(
+    text: str,
+    address: str = DEFAULT_ADDRESS,
+    analyzers: Optional[Iterable[str]] = None,
+    timeout: float = 120.0,
+    deadline: Optional[float] = None,
+    fingerprint: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Send text to a running daemon.
+
+    Args:
+        text: The text to analyze
+        address: ``host:port`` of the daemon
+        analyzers: Optional analyzer selection for this request
+        timeout: Seconds to wait for the analysis
+        deadline: Optional time budget in seconds for the analysis
+        fingerprint: ``ParagraphChecker.fingerprint`` of the settings the
+            caller would analyze with (pipeline, rule profile, indices,
+            phrase list, spelling engine, ...); the daemon refuses the
+            request if its checker was set up differently
+
+    Returns:
+        Output data in the ``save_to_file`` schema, or None when no daemon
+        answers at ``address`` in time
+
+    Raises:
+        SettingsMismatchError: If the daemon's settings differ from
+            ``fingerprint``
+        RuntimeError: If the daemon reports another error
+    """
+    host, port = parse_address(address)
+    payload = {"text": text}
+    if analyzers is not None:
+        payload["analyzers"] = sorted(analyzers)
+    if deadline is not None:
+        payload["deadline"] = deadline
+    if fingerprint is not None:
+        payload["fingerprint"] = fingerprint
+
+    request = urllib.request.Request(
+        f"http://{host}:{port}/analyze",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST"
+    )
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as e:
+        body = e.read().decode("utf-8")
+        if e.code == 409:
+            differences = json.loads(body).get("differences", [])
+            raise SettingsMismatchError(
+                f"The server at {address} is set up differently: {', '.join(differences)}"
+            )
+        raise RuntimeError(f"Server error {e.code}: {body}")
+    except OSError:
+        # Refused connections, unknown hosts and a daemon that does not
+        # answer in time
+        return None
+
+
+def results_from_output(output_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn ``save_to_file`` output data back into an analysis result."""
+    issues = [Issue.from_dict(issue) for issue in output_data.get("issues", [])]
+    return {
+        "issues": issues,
+        "statistics": output_data.get("statistics", {}),
+        "summary": output_data.get("summary", {}),
+        "text": output_data.get("original_text", ""),
+        "index": IssueIndex(issues)
+    }
+
+
+@click.command()
+@click.option(
+    "--address",
+    "-a",
+    default=DEFAULT_ADDRESS,
+    show_default=True,
+    help="host:port to listen on (localhost only by default)",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    help="Load and run only this analyzer (repeatable)",
+    type=click.Choice(ANALYZER_NAMES),
+)
+@click.option(
+    "--pipeline",
+    default="lean",
+    show_default=True,
+    help="spaCy pipeline profile",
+    type=click.Choice(list(PIPELINE_PROFILES)),
+)
+@click.option(
+    "--extra-indices",
+    is_flag=True,
+    help="Also report the SMOG, Coleman-Liau and automated readability indices",
+)
+@click.option(
+    "--grammar-profile",
+    default="default",
+    show_default=True,
+    help="LanguageTool rule profile",
+    type=click.Choice(list(RULE_PROFILES)),
+)
+@click.option(
+    "--symspell-index",
+    "symspell_index_path",
+    help="Precomputed symmetric-delete index for spelling suggestions",
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--wordy-phrases",
+    "wordy_phrases_path",
+    help="JSON file mapping wordy phrases to replacements for the style check",
+    type=click.Path(exists=True, dir_okay=False),
+)
+def main(address, only, pipeline, extra_indices, grammar_profile, symspell_index_path,
+         wordy_phrases_path):
+    """Run the Paragraph Checker daemon.
+
+    Clients sending their settings fingerprint are refused unless they use
+    the same pipeline, indices, rule profile, spelling engine and phrase list.
+    """
+    checker = ParagraphChecker(
+        analyzers=only or None,
+        pipeline=pipeline,
+        extra_indices=extra_indices,
+        grammar_profile=grammar_profile,
+        symspell_index_path=symspell_index_path,
+        wordy_phrases_path=wordy_phrases_path
+    )
+
+    try:
+        server = AnalysisServer(address, checker)
+    except OSError as e:
+        click.echo(f"Error: cannot listen on {address}: {e}")
+        sys.exit(1)
+
+    click.echo("Loading models...")
+    server.warm_up()
+    click.echo(f"Paragraph Checker server listening on {address}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\nShutting down")
+    finally:
+        server.server_close()
+        checker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# WARNING: template code, may need edits
+"""Incremental re-analysis of a document as it is edited."""
+
+from typing import Any, Dict, List, Set
+from src.models.issue import Issue
+from src.models.issue_index import IssueIndex, merge_issues
+from src.segmentation import split_paragraphs
+
+
+class DocumentSession:
+    """Keeps per-paragraph results and re-checks only edited paragraphs.
+
+    Paragraphs are separated by blank lines and analyzed independently, so
+    the cost of an update grows with the size of the edit rather than the
+    size of the document. Results of unchanged paragraphs are reused with
+    their issue positions shifted to the paragraph's new offset.
+
+    Repeated words are also looked for across each paragraph boundary, by
+    checking the two paragraphs around it together; only boundaries next
+    to a changed paragraph are checked again. A repeat whose first
+    occurrence is two or more paragraphs back (across a paragraph shorter
+    than the style analyzer's window) is not reported, although
+    ``ParagraphChecker.analyze`` of the whole text would report it.
+    """
+
+    def __init__(self, checker, text: str = ""):
+        """Initialize the session.
+
+        Args:
+            checker: ParagraphChecker used to analyze changed paragraphs
+            text: Initial document text
+        """
+        self.checker = checker
+        self.text = ""
+        # Paragraph text -> analysis result with paragraph-relative positions
+        self._paragraph_results: Dict[str, Dict[str, Any]] = {}
+        self._paragraphs: List[tuple] = []
+        # (paragraph, separator, next paragraph) -> repeats in the next
+        # paragraph of words in the first, positioned from the first
+        self._boundary_issues: Dict[tuple, List[Issue]] = {}
+        self._boundaries: List[tuple] = []
+        # Paragraph text -> its distinct difficult words
+        self._difficult_words: Dict[str, Set[str]] = {}
+        self.last_update = {"paragraphs": 0, "reanalyzed": 0}
+
+        if text:
+            self.update(text)
+
+    def update(self, text: str) -> Dict[str, Any]:
+        """Replace the document text and re-analyze changed paragraphs.
+
+        Args:
+            text: The full, edited document text
+
+        Returns:
+            Analysis results for the whole document, in the same form as
+            ``ParagraphChecker.analyze``
+        """
+        paragraphs = split_paragraphs(text)
+        previous = self._paragraph_results
+        current = {}
+        changed = []
+
+        for _, paragraph in paragraphs:
+            if paragraph in current:
+                continue
+            if paragraph in previous:
+                current[paragraph] = previous[paragraph]
+            else:
+                current[paragraph] = None
+                changed.append(paragraph)
+
+        # Changed paragraphs are parsed together in one nlp.pipe call
+        for paragraph, result in zip(changed, self.checker.analyze_many(changed)):
+            current[paragraph] = result
+
+        boundaries = []
+        boundary_issues = {}
+        for (offset, paragraph), (next_offset, next_paragraph) in zip(paragraphs, paragraphs[1:]):
+            separator = text[offset + len(paragraph):next_offset]
+            key = (paragraph, separator, next_paragraph)
+            boundaries.append((offset, key))
+            if key in boundary_issues:
+                continue
+            if key in self._boundary_issues:
+                boundary_issues[key] = self._boundary_issues[key]
+            else:
+                boundary_issues[key] = self._check_boundary(key, current[next_paragraph])
+
+        self.text = text
+        self._paragraphs = paragraphs
+        self._paragraph_results = current
+        self._boundaries = boundaries
+        self._boundary_issues = boundary_issues
+        self._difficult_words = {
+            paragraph: words for paragraph, words in self._difficult_words.items()
+            if paragraph in current
+        }
+        self.last_update = {"paragraphs": len(paragraphs), "reanalyzed": len(changed)}
+
+        return self.results()
+
+    def results(self) -> Dict[str, Any]:
+        """Assemble whole-document results from the paragraph results."""
+        issues = []
+        statistics = []
+
+        for offset, paragraph in self._paragraphs:
+            result = self._paragraph_results[paragraph]
+            issues.extend(issue.shifted(offset) for issue in result["issues"])
+            statistics.append(result["statistics"])
+
+        for offset, key in self._boundaries:
+            issues.extend(issue.shifted(offset) for issue in self._boundary_issues[key])
+
+        issues = merge_issues(issues)
+
+        return {
+            "issues": issues,
+            "statistics": self._combine_statistics(statistics),
+            "summary": self.checker.summarize(issues),
+            "text": self.text,
+            "index": IssueIndex(issues)
+        }
+
+    def _check_boundary(self, key: tuple, next_result: Dict[str, Any]) -> List[Issue]:
+        """Find repeats in a paragraph of words from the paragraph before it.
+
+        Args:
+            key: (paragraph, separator, next paragraph)
+            next_result: Analysis result of the next paragraph on its own
+
+        Returns:
+            Repeated-word issues in the next paragraph that its own result
+            lacks, positioned from the start of the first paragraph
+        """
+        paragraph, separator, next_paragraph = key
+        start = len(paragraph) + len(separator)
+        # The pair has the next paragraph's own repeats too; a word whose
+        # nearest earlier occurrence is in the first paragraph is new
+        own = {
+            issue.position + start
+            for issue in next_result["issues"] if issue.rule_id == "REPEATED_WORD"
+        }
+        return [
+            issue for issue in self.checker.repeated_words(paragraph + separator + next_paragraph)
+            if issue.position >= start and issue.position not in own
+        ]
+
+    def _combine_statistics(self, statistics: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge per-paragraph readability statistics."""
+        if not any(statistics):
+            return {}
+
+        # A word that is difficult in several paragraphs counts once
+        analyzer = self.checker.readability_analyzer
+        difficult_words = set()
+        for _, paragraph in self._paragraphs:
+            if paragraph not in self._difficult_words:
+                self._difficult_words[paragraph] = analyzer.difficult_words(paragraph)
+            difficult_words |= self._difficult_words[paragraph]
+
+        combined = analyzer.combine(statistics, difficult_words)
+        combined['character_count'] = len(self.text)
+        return combined
@@ -0,0 +1,82 @@
+# WARNING: template code, may need edits
+"""Streaming analysis of large inputs with bounded memory."""
+
+from typing import Any, Dict, Iterable, Iterator
+from src.analyzers.readability_analyzer import COUNT_KEYS
+from src.models.issue import Issue
+from src.segmentation import iter_chunks
+
+
+class StreamAnalysis:
+    """Analyzes a stream of lines chunk by chunk.
+
+    Issues are yielded with offsets relative to the whole input as soon as
+    their chunk is analyzed. Only running counts and the distinct difficult
+    words are kept between chunks, so memory grows with the vocabulary
+    rather than the input size.
+    """
+
+    def __init__(self, checker, max_chunk_chars: int = 20000):
+        """Initialize the stream analysis.
+
+        Args:
+            checker: ParagraphChecker used to analyze each chunk
+            max_chunk_chars: Target chunk size in characters
+        """
+        self.checker = checker
+        self.max_chunk_chars = max_chunk_chars
+        self.character_count = 0
+        self.chunk_count = 0
+        self._counts = {key: 0 for key in COUNT_KEYS}
+        self._difficult_words = set()
+        self._summary = {"total_issues": 0, "by_type": {}, "by_severity": {}}
+
+    def analyze(self, lines: Iterable[str]) -> Iterator[Issue]:
+        """Analyze lines of text and yield issues as chunks complete.
+
+        Args:
+            lines: Lines of text including newlines, such as an open file
+
+        Returns:
+            Iterator of issues in position order
+        """
+        for offset, chunk in iter_chunks(lines, self.max_chunk_chars):
+            results = self.checker.analyze(chunk)
+            self.chunk_count += 1
+            self.character_count = offset + len(chunk)
+
+            stats = results["statistics"]
+            if stats:
+                for key in COUNT_KEYS:
+                    self._counts[key] += stats[key]
+                self._difficult_words |= self.checker.readability_analyzer.difficult_words(chunk)
+
+            for issue in results["issues"]:
+                self._count_issue(issue)
+                yield issue.shifted(offset)
+
+    @property
+    def statistics(self) -> Dict[str, Any]:
+        """Readability statistics for everything analyzed so far."""
+        if not self._counts["word_count"]:
+            return {}
+
+        stats = self.checker.readability_analyzer.combine([self._counts], self._difficult_words)
+        stats["character_count"] = self.character_count
+        return stats
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Issue counts for everything analyzed so far."""
+        return self._summary
+
+    def _count_issue(self, issue: Issue):
+        """Add an issue to the running summary."""
+        summary = self._summary
+        summary["total_issues"] += 1
+
+        issue_type = issue.issue_type.value
+        summary["by_type"][issue_type] = summary["by_type"].get(issue_type, 0) + 1
+
+        severity = issue.severity.value
+        summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + 1
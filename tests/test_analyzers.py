@@ -3,10 +3,18 @@
 
 import pytest
 import spacy
+from types import SimpleNamespace
+from src.analyzers.grammar_analyzer import GrammarAnalyzer
+from src.cache import ParagraphCache
+from src.deadline import Deadline
 from src.analyzers.spelling_analyzer import SpellingAnalyzer
+from src.analyzers.symspell import SymSpellIndex, edit_distance
+from src.analyzers.phrase_matcher import PhraseMatcher, load_phrase_dictionary
 from src.analyzers.style_analyzer import StyleAnalyzer
+from src.analyzers.token_arrays import TokenArrays
 from src.analyzers.readability_analyzer import ReadabilityAnalyzer
 from src.models.issue import IssueType
+from src.segmentation import split_chunks
 
 
 class TestSpellingAnalyzer:
@@ -28,6 +36,179 @@ class TestSpellingAnalyzer:
         issues = analyzer.analyze(text)
         assert len(issues) > 0
         assert any('quik' in issue.message.lower() for issue in issues)
+    
+    def test_repeated_misspelling_reports_every_occurrence(self, analyzer):
+        """Test that each occurrence of a misspelled type is reported."""
+        text = "Teh cat saw teh dog and TEH bird."
+        issues = analyzer.analyze(text)
+        
+        assert [issue.position for issue in issues] == [0, 12, 24]
+        assert issues[2].message == "Possible spelling error: 'TEH'"
+        assert analyzer.suggestion_cache.stats()['misses'] == 1
+    
+    def test_suggestions_are_memoized(self, analyzer):
+        """Test that a repeated misspelling reuses its suggestions."""
+        analyzer.analyze("The quik fox and the quik dog.")
+        analyzer.analyze("Another quik one.")
+        
+        stats = analyzer.suggestion_cache.stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+    
+    def test_suggestion_cache_persists(self, tmp_path):
+        """Test saving and reloading remembered suggestions."""
+        path = str(tmp_path / "suggestions.json")
+        first = SpellingAnalyzer(suggestion_cache_path=path)
+        issues = first.analyze("The quik fox.")
+        first.save_suggestions()
+        
+        second = SpellingAnalyzer(suggestion_cache_path=path)
+        assert second.analyze("The quik fox.") == issues
+        assert second.suggestion_cache.stats()['hits'] == 1
+    
+    def test_suggestions_are_remembered_per_engine(self, analyzer):
+        """Test that a shared cache keeps each engine's suggestions apart."""
+        symspell = SpellingAnalyzer(suggestion_cache=analyzer.suggestion_cache, use_symspell=True)
+        symspell._symspell = SimpleNamespace(lookup=lambda word, max_suggestions: ["symspell"])
+        
+        assert symspell.suggest("quik") == ["symspell"]
+        assert analyzer.suggest("quik") != ["symspell"]
+        assert analyzer.suggestion_cache.stats()['misses'] == 2
+    
+    def test_expired_deadline_uses_remembered_suggestions(self, analyzer):
+        """Test that only cached suggestions are used once out of time."""
+        analyzer.suggest("quik")
+        deadline = Deadline(0)
+        
+        issues = analyzer.analyze("The quik brwn fox.", deadline=deadline)
+        
+        assert [issue.position for issue in issues] == [4]
+        assert deadline.truncated == {"spelling"}
+        assert analyzer.suggestion_cache.get("candidates:brwn") is None
+    
+    def test_deadline_candidates_match(self, analyzer):
+        """Test that the interruptible search finds the same suggestions."""
+        timed = SpellingAnalyzer()
+        timed._spell = analyzer.spell
+        
+        for word in ["recieve", "acommodate", "maintainance", "calender"]:
+            assert timed.suggest(word, Deadline(60)) == analyzer.suggest(word)
+
+
+class TestRepeatedWords:
+    """Test cases for repeated word detection in StyleAnalyzer."""
+    
+    @pytest.fixture
+    def nlp(self):
+        return spacy.load("en_core_web_sm")
+    
+    def test_repeat_within_window(self, nlp):
+        """Test that a nearby repeat is reported at its second occurrence."""
+        analyzer = StyleAnalyzer(nlp)
+        text = "Gardens need water. Healthy gardens need sunlight too."
+        issues = analyzer._check_repeated_words(text, nlp(text))
+        
+        assert [issue.position for issue in issues] == [
+            text.index("gardens"), text.index("need", 10)
+        ]
+        assert issues[0].message == "Repeated word: 'Gardens'"
+    
+    def test_large_window(self, nlp):
+        """Test that a larger window finds more distant repeats."""
+        text = "Rivers flow north. " + "Birds sing loudly today. " * 3 + "Rivers freeze."
+        doc = nlp(text)
+        
+        near = StyleAnalyzer(nlp, repeat_window=10)._check_repeated_words(text, doc)
+        far = StyleAnalyzer(nlp, repeat_window=50)._check_repeated_words(text, doc)
+        
+        assert text.rindex("Rivers") not in [issue.position for issue in near]
+        assert text.rindex("Rivers") in [issue.position for issue in far]
+    
+    def test_sentence_scope(self, nlp):
+        """Test that sentence scope ignores repeats in other sentences."""
+        text = "Cats sleep all day. Dogs sleep at night."
+        analyzer = StyleAnalyzer(nlp, repeat_scope="sentence")
+        assert analyzer._check_repeated_words(text, nlp(text)) == []
+    
+    def test_invalid_scope(self, nlp):
+        """Test that unknown scopes are rejected."""
+        with pytest.raises(ValueError):
+            StyleAnalyzer(nlp, repeat_scope="chapter")
+
+
+class TestTokenArrays:
+    """Test cases for TokenArrays."""
+    
+    @pytest.fixture
+    def nlp(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+    
+    def test_columns(self, nlp):
+        """Test that token attributes are exported per token."""
+        doc = nlp("Very good. It is done!")
+        tokens = TokenArrays(doc)
+        
+        assert len(tokens) == len(doc)
+        assert tokens.idx.tolist() == [token.idx for token in doc]
+        assert tokens.is_punct.tolist() == [token.is_punct for token in doc]
+        assert tokens.lower[0] == doc.vocab.strings["very"]
+    
+    def test_sentences(self, nlp):
+        """Test sentence numbering and character offsets."""
+        doc = nlp("Very good. It is done!")
+        tokens = TokenArrays(doc)
+        
+        assert tokens.sent_id.tolist() == [0, 0, 0, 1, 1, 1, 1]
+        assert [tokens.sentence_chars(i) for i in range(2)] == [
+            (sent.start_char, sent.end_char) for sent in doc.sents
+        ]
+    
+    def test_style_checks_without_model(self, nlp):
+        """Test the array-based checks on a doc without tags."""
+        text = "This is very very long. " + " ".join(["word"] * 31) + "."
+        issues = StyleAnalyzer(nlp).analyze(text, nlp(text))
+        messages = [issue.message for issue in issues]
+        
+        assert messages.count("Weak word: 'very'") == 2
+        assert "Long sentence (31 words)" in messages
+
+
+class TestSymSpellIndex:
+    """Test cases for SymSpellIndex."""
+    
+    @pytest.fixture
+    def index(self):
+        return SymSpellIndex.build({
+            "the": 1000, "ten": 50, "tea": 80, "spelling": 20,
+            "definitely": 10, "accommodation": 5,
+        })
+    
+    def test_suggestions_ranked_by_frequency(self, index):
+        """Test that the closest words are returned most frequent first."""
+        assert index.lookup("teh") == ["the", "tea", "ten"]
+    
+    def test_distance_two_and_long_words(self, index):
+        """Test suggestions two edits away."""
+        assert index.lookup("accomodatin") == ["accommodation"]
+        assert index.lookup("xyzzyq") == []
+    
+    def test_only_closest_distance(self, index):
+        """Test that farther words are dropped once a close one is found."""
+        assert index.lookup("speling") == ["spelling"]
+    
+    def test_save_and_load(self, index, tmp_path):
+        """Test that a saved index gives the same suggestions."""
+        path = str(tmp_path / "index.npz")
+        index.save(path)
+        assert SymSpellIndex.load(path).lookup("teh") == index.lookup("teh")
+    
+    def test_edit_distance(self):
+        """Test the optimal string alignment distance."""
+        assert edit_distance("teh", "the", 2) == 1
+        assert edit_distance("speling", "spelling", 2) == 1
+        assert edit_distance("abcdef", "badcfe", 2) == 3
 
 
 class TestStyleAnalyzer:
@@ -79,6 +260,34 @@ class TestStyleAnalyzer:
         assert len(long_sentence_issues) > 0
 
 
+class TestPhraseMatcher:
+    """Test cases for PhraseMatcher."""
+    
+    def test_case_insensitive_word_boundaries(self):
+        """Test matching ignores case and respects word boundaries."""
+        matcher = PhraseMatcher(["in order to", "with regard to"])
+        text = "IN ORDER TO win, in order tomorrow, With regard to it."
+        matches = [(m.start(), m.group()) for m in matcher.finditer(text)]
+        assert matches == [(0, "IN ORDER TO"), (36, "With regard to")]
+    
+    def test_longest_phrase_wins(self):
+        """Test that the longest phrase at a position is preferred."""
+        matcher = PhraseMatcher(["in order", "in order to"])
+        matches = [m.group() for m in matcher.finditer("in order to go, in order now")]
+        assert matches == ["in order to", "in order"]
+    
+    def test_bundled_phrase_dictionary(self):
+        """Test loading the bundled wordy phrase list."""
+        phrases = load_phrase_dictionary()
+        assert phrases["due to the fact that"] == "because"
+    
+    def test_custom_phrase_dictionary(self, tmp_path):
+        """Test loading phrases from a custom file."""
+        path = tmp_path / "phrases.json"
+        path.write_text('{"Each And Every": "every"}')
+        assert load_phrase_dictionary(str(path)) == {"each and every": "every"}
+
+
 class TestReadabilityAnalyzer:
     """Test cases for ReadabilityAnalyzer."""
     
@@ -107,3 +316,187 @@ class TestReadabilityAnalyzer:
         
         assert 'reading_level' in stats
         assert 'readability_interpretation' in stats
+    
+    def test_words_split_like_spacy_tokens(self, analyzer):
+        """Test that contractions and compounds count as their parts."""
+        text = "I don't think the well-known author wrote it. Did she? Maybe."
+        stats = analyzer.analyze(text)
+        
+        assert stats['word_count'] == 13
+        assert stats['sentence_count'] == 3
+    
+    def test_combine_matches_whole_text(self, analyzer):
+        """Test that combined paragraph counts equal whole-text counts."""
+        first = "The committee reviewed every result carefully."
+        second = "Nobody disagreed. The report was published."
+        
+        combined = analyzer.combine([analyzer.analyze(first), analyzer.analyze(second)])
+        combined['character_count'] = len(first + "\n\n" + second)
+        
+        assert combined == analyzer.analyze(first + "\n\n" + second)
+    
+    def test_combine_counts_difficult_words_once(self, analyzer):
+        """Test that a word difficult in several parts counts once."""
+        first = "The committee met."
+        second = "The committee agreed."
+        parts = [analyzer.analyze(first), analyzer.analyze(second)]
+        whole = analyzer.analyze(first + "\n\n" + second)
+        difficult = analyzer.difficult_words(first) | analyzer.difficult_words(second)
+        
+        assert analyzer.combine(parts)['difficult_words'] == 2 * whole['difficult_words']
+        assert analyzer.combine(parts, difficult)['difficult_words'] == whole['difficult_words']
+    
+    def test_extra_indices(self):
+        """Test the optional SMOG, Coleman-Liau and ARI scores."""
+        analyzer = ReadabilityAnalyzer(extra_indices=True)
+        stats = analyzer.analyze("The cat sat. The dog ran. The bird flew away.")
+        
+        assert stats['smog_index'] == 3.1
+        assert stats['coleman_liau_index'] == -5.28
+        assert stats['automated_readability_index'] == -4.2
+        assert 'smog_index' not in ReadabilityAnalyzer().analyze("The cat sat.")
+
+
+class TestSplitChunks:
+    """Test cases for split_chunks."""
+    
+    def test_chunks_cover_text_exactly(self):
+        """Test that chunks join back into the text at their offsets."""
+        text = "One. Two three.\n\nFour five six. Seven.\n\n" + "x" * 40 + " end."
+        chunks = split_chunks(text, max_chars=12)
+        
+        assert "".join(chunk for _, chunk in chunks) == text
+        for offset, chunk in chunks:
+            assert text[offset:offset + len(chunk)] == chunk
+    
+    def test_paragraphs_are_never_split(self):
+        """Test that chunks hold whole paragraphs, however long."""
+        text = "One. Two.\n\nThree.\n\nDr. Smith visited the U.S. in 2020, e.g. in May."
+        
+        assert [chunk for _, chunk in split_chunks(text, max_chars=20)] == [
+            "One. Two.\n\nThree.\n\n", "Dr. Smith visited the U.S. in 2020, e.g. in May."
+        ]
+        assert split_chunks(text, max_chars=len(text)) == [(0, text)]
+
+
+class FakeLanguageTool:
+    """Stands in for a LanguageTool client; flags every 'teh'."""
+    
+    def __init__(self):
+        self.checked = []
+        self.disabled_seen = []
+    
+    def check(self, text):
+        self.checked.append(text)
+        self.disabled_seen.append(set(getattr(self, "disabled_rules", ())))
+        matches = []
+        start = text.find("teh")
+        while start != -1:
+            matches.append(SimpleNamespace(
+                offset=start, errorLength=3, message="Possible typo",
+                ruleId="MORFOLOGIK_RULE_EN_US", category="TYPOS",
+                ruleIssueType="misspelling", replacements=["the"],
+                rule=SimpleNamespace(description="Possible spelling mistake")
+            ))
+            start = text.find("teh", start + 1)
+        return matches
+    
+    def close(self):
+        pass
+
+
+class TestGrammarAnalyzerPool:
+    """Test cases for chunked grammar checking on a pool of clients."""
+    
+    def make_analyzer(self, workers, paragraph_cache=None):
+        analyzer = GrammarAnalyzer(workers=workers, chunk_chars=30, paragraph_cache=paragraph_cache)
+        analyzer.pool._start_tools = lambda: [FakeLanguageTool() for _ in range(workers)]
+        return analyzer
+    
+    def test_chunked_matches_single_call(self):
+        """Test that chunked checking reports the same issues."""
+        text = "I saw teh cat. It sat on teh mat.\n\nThen teh dog came. " * 3
+        
+        single = self.make_analyzer(1).analyze(text)
+        pooled = self.make_analyzer(3).analyze(text)
+        
+        assert pooled == single
+        assert [issue.position for issue in pooled] == [
+            i for i in range(len(text)) if text.startswith("teh", i)
+        ]
+        assert pooled[-1].context.count(">>>teh<<<") == 1
+    
+    def test_paragraph_cache(self):
+        """Test that only uncached paragraphs are sent to LanguageTool."""
+        text = "I saw teh cat. It sat on teh mat.\n\nI saw teh cat."
+        analyzer = self.make_analyzer(1, ParagraphCache())
+        
+        issues = analyzer.analyze(text)
+        again = analyzer.analyze("New one.\n\n" + text)
+        
+        assert [issue.position for issue in issues] == [6, 25, 41]
+        assert [issue.position for issue in again] == [16, 35, 51]
+        assert analyzer.tool.checked == [
+            "I saw teh cat. It sat on teh mat.\n\nI saw teh cat.", "New one."
+        ]
+        assert analyzer.paragraph_cache.stats()['hits'] == 2
+    
+    def test_paragraph_cache_keeps_abbreviations_whole(self):
+        """Test that abbreviations do not split what LanguageTool checks."""
+        text = "Dr. Smith visited the U.S. in 2020, e.g. in May. He saw teh sea."
+        analyzer = self.make_analyzer(1, ParagraphCache())
+        
+        issues = analyzer.analyze(text)
+        
+        assert analyzer.tool.checked == [text]
+        assert [issue.position for issue in issues] == [text.index("teh")]
+    
+    def test_rule_profile(self):
+        """Test that clients are configured with the rule profile."""
+        analyzer = GrammarAnalyzer(
+            profile="fast", disabled_rules=["EN_QUOTES"], local_analyzers=["spelling"]
+        )
+        analyzer.pool._start_tools = lambda: [FakeLanguageTool()]
+        tool = analyzer.tool
+        
+        assert {"MORFOLOGIK_RULE_EN_US", "EN_QUOTES"} <= tool.disabled_rules
+        assert "STYLE" in tool.disabled_categories
+        assert "PASSIVE_VOICE" not in tool.disabled_rules
+        assert tool.picky is False
+    
+    def test_profile_keeps_rules_without_local_analyzers(self):
+        """Test that only rules of running local analyzers are skipped."""
+        def disabled(profile, local_analyzers):
+            return GrammarAnalyzer(profile=profile, local_analyzers=local_analyzers).pool.rules
+        
+        assert disabled("default", ()).disabled_rules == ()
+        assert disabled("default", {"style"}).disabled_categories == (
+            "PLAIN_ENGLISH", "REPETITIONS_STYLE"
+        )
+        assert disabled("default", {"spelling", "style"}).disabled_rules == (
+            "MORFOLOGIK_RULE_EN_US", "PASSIVE_VOICE", "TOO_LONG_SENTENCE", "EN_WEAK_ADJECTIVE"
+        )
+        assert disabled("full", {"spelling", "style"}).disabled_rules == ()
+    
+    def test_rules_for_one_call(self):
+        """Test that a call with other local analyzers uses their rules."""
+        analyzer = GrammarAnalyzer(local_analyzers=["spelling"], paragraph_cache=ParagraphCache())
+        analyzer.pool._start_tools = lambda: [FakeLanguageTool()]
+        
+        assert len(analyzer.analyze("I saw teh cat.")) == 1
+        assert len(analyzer.analyze("I saw teh cat.", local_analyzers=[])) == 1
+        analyzer.analyze("I saw teh cat.")
+        
+        tool = analyzer.tool
+        assert tool.checked == ["I saw teh cat.", "I saw teh cat."]
+        assert [("MORFOLOGIK_RULE_EN_US" in rules) for rules in tool.disabled_seen] == [True, False]
+        assert "MORFOLOGIK_RULE_EN_US" in tool.disabled_rules
+    
+    def test_invalid_pool(self):
+        """Test that pools need a size, a known mode and a known profile."""
+        with pytest.raises(ValueError):
+            GrammarAnalyzer(workers=0)
+        with pytest.raises(ValueError):
+            GrammarAnalyzer(pool_mode="cluster")
+        with pytest.raises(ValueError):
+            GrammarAnalyzer(profile="relaxed")
@@ -0,0 +1,111 @@
+# WARNING: template code, may need edits
+"""Tests for batch mode helpers."""
+
+import json
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from src import batch
+from src.batch import BatchRunner, collect_files, assign_output_paths, _load_models
+from src.checker import ParagraphChecker
+
+
+class TestCollectFiles:
+    """Test cases for collect_files."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        (tmp_path / "essays" / "nested").mkdir(parents=True)
+        (tmp_path / "essays" / "one.txt").write_text("One.")
+        (tmp_path / "essays" / "nested" / "two.txt").write_text("Two.")
+        (tmp_path / "essays" / "notes.md").write_text("Skip me.")
+        (tmp_path / "three.txt").write_text("Three.")
+        return tmp_path
+
+    def test_directory_is_walked_recursively(self, corpus):
+        """Test that directories are expanded to their text files."""
+        files = collect_files([str(corpus / "essays")])
+        assert [f.name for f in files] == ["two.txt", "one.txt"]
+
+    def test_glob_pattern(self, corpus):
+        """Test that glob patterns are expanded."""
+        files = collect_files([str(corpus / "*.txt")])
+        assert [f.name for f in files] == ["three.txt"]
+
+    def test_manifest_paths_are_relative_to_manifest(self, corpus):
+        """Test reading paths from a manifest file."""
+        manifest = corpus / "manifest.txt"
+        manifest.write_text("# nightly run\nthree.txt\n\nessays/one.txt\n")
+        files = collect_files([], str(manifest))
+        assert [f.name for f in files] == ["one.txt", "three.txt"]
+
+    def test_duplicates_are_removed(self, corpus):
+        """Test that a file matched twice is analyzed once."""
+        path = str(corpus / "three.txt")
+        assert len(collect_files([path, path])) == 1
+
+
+class TestAssignOutputPaths:
+    """Test cases for assign_output_paths."""
+
+    def test_name_collisions_get_suffixes(self, tmp_path):
+        """Test that files with the same stem get distinct outputs."""
+        outputs = assign_output_paths(
+            [Path("a/essay.txt"), Path("b/essay.txt")], str(tmp_path)
+        )
+        assert [o.name for o in outputs] == ["essay.json", "essay_1.json"]
+
+
+class TestBatchRunner:
+    """Test cases for preparing the worker pool."""
+
+    def test_workers_share_one_grammar_server(self, monkeypatch):
+        """Test that one LanguageTool server is started for all workers."""
+        started = []
+
+        def fake_server():
+            server = SimpleNamespace(host="127.0.0.1", port=8081, close=lambda: None)
+            started.append(server)
+            return server
+
+        monkeypatch.setattr(batch, "start_server", fake_server)
+        runner = BatchRunner(workers=4, checker_kwargs={"pipeline": "senter"})
+        kwargs, server = runner._share_grammar_server()
+
+        assert started == [server]
+        assert kwargs == {"pipeline": "senter", "grammar_server": "http://127.0.0.1:8081"}
+        assert runner.checker_kwargs == {"pipeline": "senter"}
+
+    def test_no_grammar_server_without_grammar(self, monkeypatch):
+        """Test that no server is started when grammar is off or one is given."""
+        monkeypatch.setattr(batch, "start_server", pytest.fail)
+        for kwargs in ({"analyzers": {"spelling"}}, {"grammar_server": "http://lt:8081"}):
+            assert BatchRunner(checker_kwargs=kwargs)._share_grammar_server() == (kwargs, None)
+
+    def test_models_are_loaded_before_forking(self):
+        """Test that the enabled analyzers' models are loaded in the parent."""
+        checker = ParagraphChecker(analyzers=["spelling", "readability"])
+        _load_models(checker)
+        assert checker._spelling_analyzer._spell is not None
+        assert checker._nlp is None
+        assert checker._grammar_analyzer is None
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_workers_save_their_suggestions(self, tmp_path, workers):
+        """Test that every worker's spelling suggestions reach the cache file."""
+        misspellings = ["recieve", "teh", "wierd", "definately", "seperate", "untill"]
+        files = []
+        for i, word in enumerate(misspellings):
+            path = tmp_path / f"essay{i}.txt"
+            path.write_text(f"We {word} this sentence.")
+            files.append(path)
+        cache_path = str(tmp_path / "suggestions.json")
+
+        runner = BatchRunner(workers=workers, chunksize=2, checker_kwargs={
+            "analyzers": {"spelling"}, "suggestion_cache_path": cache_path
+        })
+        results = runner.run(files, str(tmp_path / "results"))
+
+        assert results["summary"]["failed"] == 0
+        with open(cache_path, encoding="utf-8") as f:
+            assert sorted(json.load(f)) == sorted(f"candidates:{word}" for word in misspellings)
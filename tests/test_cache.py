@@ -0,0 +1,147 @@
+# WARNING: template code, may need edits
+"""Tests for the persistent result cache."""
+
+import json
+import pytest
+from src.analyzers.phrase_matcher import load_phrase_dictionary
+from src.cache import LRUCache, ResultCache, ParagraphCache, make_cache_key
+from src.checker import ParagraphChecker
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+    
+    def test_miss_then_hit(self, cache):
+        """Test storing and reading back a payload."""
+        assert cache.get("key") is None
+        cache.put("key", {"issues": [], "statistics": {"word_count": 3}})
+        
+        assert cache.get("key") == {"issues": [], "statistics": {"word_count": 3}}
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(str(tmp_path / "small.db"), max_bytes=100)
+        payload = {"data": "x" * 30}
+        
+        cache.put("a", payload)
+        cache.put("b", payload)
+        cache.get("a")
+        cache.put("c", payload)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == payload
+        assert cache.get("c") == payload
+        assert cache.stats()['evictions'] == 1
+        cache.close()
+    
+    def test_key_depends_on_configuration(self):
+        """Test that analyzers and versions are part of the key."""
+        key = make_cache_key("Text.", ["spelling"], "v1")
+        assert key == make_cache_key("Text.", ["spelling"], "v1")
+        assert key != make_cache_key("Text.", ["spelling", "style"], "v1")
+        assert key != make_cache_key("Text.", ["spelling"], "v2")
+        assert key != make_cache_key("Text!", ["spelling"], "v1")
+    
+    @pytest.mark.parametrize("settings", [
+        {"symspell_index_path": "index.npz"},
+        {"extra_indices": True},
+        {"grammar_workers": 4},
+    ])
+    def test_fingerprint_depends_on_settings(self, settings):
+        """Test that settings that change the results are part of the key."""
+        assert ParagraphChecker(**settings).fingerprint != ParagraphChecker().fingerprint
+    
+    def test_fingerprint_depends_on_wordy_phrases(self, tmp_path):
+        """Test that a house phrase list gets its own cache entries."""
+        bundled = tmp_path / "bundled.json"
+        bundled.write_text(json.dumps(load_phrase_dictionary()))
+        house = tmp_path / "house.json"
+        house.write_text(json.dumps({"utilize": "use"}))
+        
+        default = ParagraphChecker().fingerprint
+        assert ParagraphChecker(wordy_phrases_path=str(bundled)).fingerprint == default
+        assert ParagraphChecker(wordy_phrases_path=str(house)).fingerprint != default
+    
+    def test_checker_hit_matches_fresh_run(self, cache):
+        """Test that cached checker results equal a fresh analysis."""
+        checker = ParagraphChecker(analyzers=["spelling", "readability"], cache=cache)
+        text = "This sentance has a speling error. It is still readable."
+        
+        fresh = checker.analyze(text)
+        cached = checker.analyze(text)
+        
+        assert cache.stats()['hits'] == 1
+        assert cached['issues'] == fresh['issues']
+        assert cached['statistics'] == fresh['statistics']
+        assert cached['summary'] == fresh['summary']
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.stats()['hits'] == 2
+        assert cache.stats()['misses'] == 1
+    
+    def test_save_keeps_entries_saved_by_others(self, tmp_path):
+        """Test that two caches sharing a file both keep their entries."""
+        path = str(tmp_path / "shared.json")
+        first = LRUCache(maxsize=3, path=path)
+        second = LRUCache(maxsize=3, path=path)
+        first.put("a", 1)
+        second.put("b", 2)
+        second.put("c", 3)
+        first.save()
+        second.save()
+        
+        assert LRUCache(path=path)._data == {"a": 1, "b": 2, "c": 3}
+        
+        first.put("d", 4)
+        first.put("e", 5)
+        first.save()
+        assert list(LRUCache(path=path)._data) == ["a", "d", "e"]
+
+
+class TestParagraphCache:
+    """Test cases for ParagraphCache."""
+    
+    def test_keys_ignore_surrounding_whitespace(self):
+        """Test that paragraphs are looked up by their stripped text."""
+        cache = ParagraphCache(fingerprint="v1")
+        cache.put("It are here.", [[3, 3, "AGREEMENT", "GRAMMAR", "grammar", "m", "", "is"]])
+        
+        assert cache.get("  It are here.\n") is not None
+        assert cache.get("It is here.") is None
+        assert ParagraphCache(fingerprint="v2").key("It are here.") != cache.key("It are here.")
+    
+    def test_time_saved_and_persistence(self, tmp_path):
+        """Test the time-saved estimate and saving to a file."""
+        path = str(tmp_path / "paragraphs.json")
+        cache = ParagraphCache(path=path)
+        cache.record_check(100, 2.0)
+        cache.put("Hello there.", [])
+        cache.get("Hello there.")
+        cache.save()
+        
+        assert cache.stats()['time_saved_seconds'] == 0.24
+        assert ParagraphCache(path=path).get("Hello there.") == []
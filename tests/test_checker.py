@@ -1,9 +1,13 @@
 # WARNING: template code, may need edits
 """Tests for the ParagraphChecker class."""
 
+import time
 import pytest
-from src.checker import ParagraphChecker
+import spacy
+from src.checker import ParagraphChecker, select_analyzers
 from src.models.issue import IssueType, Severity
+from src.models.issue_index import IssueIndex
+from src.models.issue_table import IssueTable
 
 
 class TestParagraphChecker:
@@ -75,3 +79,229 @@ class TestParagraphChecker:
             if issue.issue_type == IssueType.WORD_CHOICE
         ]
         assert len(word_choice_issues) > 0
+    
+    def test_concurrent_matches_sequential(self, checker):
+        """Test that concurrent mode returns the same results."""
+        text = "She dont like apples. The ball was thrown by John in order to win."
+        sequential = checker.analyze(text)
+        
+        concurrent_checker = ParagraphChecker(concurrent=True)
+        try:
+            concurrent = concurrent_checker.analyze(text)
+        finally:
+            concurrent_checker.close()
+        
+        assert concurrent['issues'] == sequential['issues']
+        assert concurrent['statistics'] == sequential['statistics']
+        assert concurrent['summary'] == sequential['summary']
+    
+    def test_readability_only_skips_models(self):
+        """Test that a readability-only run loads no heavy models."""
+        checker = ParagraphChecker(analyzers=["readability"])
+        results = checker.analyze("The first sentence is here. The second one follows it.")
+        
+        assert results['statistics']['sentence_count'] == 2
+        assert results['issues'] == []
+        assert checker._nlp is None
+        assert checker._grammar_analyzer is None
+        assert checker._spelling_analyzer is None
+    
+    def test_spelling_only_without_spacy(self):
+        """Test that spelling runs without loading spaCy."""
+        checker = ParagraphChecker(analyzers=["spelling"])
+        results = checker.analyze("This sentance has a speling error.")
+        
+        assert len(results['issues']) == 2
+        assert all(i.issue_type == IssueType.SPELLING for i in results['issues'])
+        assert checker._nlp is None
+    
+    def test_grammar_profile_follows_analyzers(self):
+        """Test that LanguageTool checks spelling when the spelling analyzer is off."""
+        grammar_only = ParagraphChecker(analyzers=["grammar"]).grammar_analyzer
+        assert "MORFOLOGIK_RULE_EN_US" not in grammar_only.pool.rules.disabled_rules
+        
+        default = ParagraphChecker().grammar_analyzer
+        assert "MORFOLOGIK_RULE_EN_US" in default.pool.rules.disabled_rules
+
+    
+    def test_analyze_many_matches_analyze(self):
+        """Test that batched analysis returns the per-text results."""
+        checker = ParagraphChecker(analyzers=["spelling", "readability"])
+        texts = ["The frist text is here.", "", "Another secnd text follows it."]
+        
+        batched = checker.analyze_many(texts)
+        
+        assert [r['issues'] for r in batched] == [checker.analyze(t)['issues'] for t in texts]
+        assert batched[1]['summary']['total_issues'] == 0
+    
+    def test_analyze_many_parses_with_pipe(self):
+        """Test that style analysis of many texts uses one nlp.pipe pass."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        checker = ParagraphChecker(analyzers=["style"], batch_size=2)
+        checker._nlp = nlp
+        texts = ["This is very good.", "It is really quite nice.", "Plain text here."]
+        
+        batched = checker.analyze_many(texts)
+        
+        assert [r['issues'] for r in batched] == [checker.analyze(t)['issues'] for t in texts]
+        assert batched[1]['summary']['total_issues'] == 2
+    
+    def test_analyze_many_as_table(self):
+        """Test that table results hold the same issues and summaries."""
+        checker = ParagraphChecker(analyzers=["spelling"])
+        texts = ["The frist text is here.", "", "Another secnd text follows it."]
+        
+        tables = checker.analyze_many(texts, as_table=True)
+        
+        for table, result in zip(tables, checker.analyze_many(texts)):
+            assert table['issues'].to_issues() == result['issues']
+            assert table['issues'].by_type() == result['summary'].get('by_type', {})
+        assert IssueTable.concat(t['issues'] for t in tables).document.tolist() == [0, 2]
+    
+    def test_result_index(self):
+        """Test that results carry an index of their issues."""
+        checker = ParagraphChecker(analyzers=["spelling"])
+        text = "The frist text has a secnd typo."
+        
+        results = checker.analyze(text)
+        
+        assert isinstance(results['index'], IssueIndex)
+        assert list(results['index']) == results['issues']
+        assert [i.position for i in results['index'].in_range(0, 10)] == [4]
+        assert checker.analyze("")['index'].in_range(0, 10) == []
+    
+    def test_profile_timings(self):
+        """Test that profiled results report their stages."""
+        stages = []
+        checker = ParagraphChecker(
+            analyzers=["spelling", "readability"],
+            profile_hooks=[lambda name, seconds: stages.append(name)]
+        )
+        
+        results = checker.analyze("The frist text has a secnd typo.")
+        
+        timings = results['timings']
+        assert list(timings)[0] == "total"
+        assert {"spelling", "spelling.candidates", "readability", "summary"} <= set(timings)
+        assert timings["spelling.candidates"]["calls"] == 2
+        assert stages[-1] == "total"
+        assert 'timings' not in ParagraphChecker(analyzers=["spelling"]).analyze("Text.")
+    
+    def test_deadline_with_enough_time(self):
+        """Test that a generous deadline gives the full results."""
+        checker = ParagraphChecker(analyzers=["spelling", "readability"])
+        text = "The frist text has a secnd typo."
+        
+        results = checker.analyze(text, deadline=60)
+        
+        assert results['issues'] == checker.analyze(text)['issues']
+        assert results['statistics'] == checker.analyze(text)['statistics']
+        assert results['summary']['skipped_analyzers'] == []
+        assert results['summary']['truncated_analyzers'] == []
+    
+    def test_statistics_do_not_depend_on_style(self):
+        """Test that parsing for style leaves the readability statistics alone."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        with_style = ParagraphChecker(analyzers=["style", "readability"])
+        with_style._nlp = nlp
+        text = "Dr. Smith visited the U.S. in May. He liked it."
+        
+        stats = with_style.analyze(text)['statistics']
+        
+        assert stats == ParagraphChecker(analyzers=["readability"]).analyze(text)['statistics']
+    
+    def test_deadline_with_style_matches_unlimited_run(self, tmp_path):
+        """Test that deadline results with style match and share cached results."""
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        checker = ParagraphChecker(
+            analyzers=["spelling", "style", "readability"], cache=str(tmp_path / "cache.db")
+        )
+        checker._nlp = nlp
+        text = "Dr. Smith visited the U.S. in 2020, e.g. in May. He liked the naïve quik fox."
+        
+        timed = checker.analyze(text, deadline=60)
+        
+        assert timed['summary']['skipped_analyzers'] == []
+        assert checker.cache.stats()['entries'] == 1
+        checker.cache.clear()
+        untimed = checker.analyze(text)
+        assert timed['statistics'] == untimed['statistics']
+        assert timed['issues'] == untimed['issues']
+    
+    def test_deadline_skips_style_before_parsing(self):
+        """Test that style is skipped without a parse once the time is up."""
+        class SlowSpelling:
+            def analyze(self, text, deadline=None):
+                time.sleep(0.2)
+                return []
+        
+        parsed = []
+        checker = ParagraphChecker(analyzers=["spelling", "style", "readability"])
+        checker._nlp = parsed.append
+        checker._spelling_analyzer = SlowSpelling()
+        
+        results = checker.analyze("The first text.", deadline=0.1)
+        
+        assert parsed == []
+        assert results['statistics']['word_count'] == 3
+        assert results['summary']['skipped_analyzers'] == ["style"]
+    
+    def test_deadline_skips_analyzers(self, tmp_path):
+        """Test that out-of-time analyzers are skipped and not cached."""
+        checker = ParagraphChecker(
+            analyzers=["spelling", "readability"], cache=str(tmp_path / "cache.db")
+        )
+        text = "The frist text has a secnd typo."
+        
+        results = checker.analyze(text, deadline=0)
+        
+        assert results['issues'] == []
+        assert results['statistics'] == {}
+        assert results['summary']['skipped_analyzers'] == ["readability", "spelling"]
+        assert len(checker.analyze(text)['issues']) == 2
+    
+    def test_deadline_drops_slow_grammar(self):
+        """Test that a grammar check past the deadline does not hold up the result."""
+        class SlowLanguageTool:
+            def check(self, text):
+                time.sleep(1)
+                return []
+            
+            def close(self):
+                pass
+        
+        checker = ParagraphChecker(analyzers=["grammar", "spelling"])
+        checker.grammar_analyzer.pool._start_tools = lambda: [SlowLanguageTool()]
+        checker.spelling_analyzer.spell  # load the dictionary outside the deadline
+        
+        start = time.perf_counter()
+        results = checker.analyze("The frist text.", deadline=0.3)
+        
+        assert time.perf_counter() - start < 0.9
+        assert results['summary']['skipped_analyzers'] == ["grammar"]
+        assert [issue.position for issue in results['issues']] == [4]
+        checker.close()
+    
+    def test_unknown_pipeline_profile(self):
+        """Test that unknown pipeline profiles are rejected."""
+        with pytest.raises(ValueError):
+            ParagraphChecker(pipeline="tiny")
+
+class TestSelectAnalyzers:
+    """Test cases for select_analyzers."""
+    
+    def test_defaults_to_all(self):
+        """Test that no selection enables every analyzer."""
+        assert select_analyzers() == {"grammar", "spelling", "style", "readability"}
+    
+    def test_only_and_skip(self):
+        """Test combining --only and --skip."""
+        assert select_analyzers(["spelling", "style"], ["style"]) == {"spelling"}
+    
+    def test_unknown_analyzer(self):
+        """Test that unknown names are rejected."""
+        with pytest.raises(ValueError):
+            select_analyzers(["grammer"])
@@ -2,7 +2,9 @@
 """Tests for data models."""
 
 import pytest
-from src.models.issue import Issue, IssueType, Severity
+from src.models.issue import Issue, IssueType, Severity, get_context
+from src.models.issue_index import IssueIndex, merge_issues
+from src.models.issue_table import IssueTable
 
 
 class TestIssue:
@@ -46,6 +48,22 @@ class TestIssue:
         assert issue_dict['position'] == 10
         assert issue_dict['suggested_fix'] == 'correct'
     
+    def test_issue_from_dict(self):
+        """Test rebuilding an issue from its dictionary form."""
+        issue = Issue(
+            issue_type=IssueType.PUNCTUATION,
+            severity=Severity.ERROR,
+            position=3,
+            length=1,
+            message="Missing comma",
+            explanation="Explanation",
+            learning_tip="Tip",
+            context="Context",
+            suggested_fix=","
+        )
+        
+        assert Issue.from_dict(issue.to_dict()) == issue
+    
     def test_issue_string_representation(self):
         """Test string representation of issue."""
         issue = Issue(
@@ -62,3 +80,184 @@ class TestIssue:
         issue_str = str(issue)
         assert 'Suggestion' in issue_str
         assert 'Style' in issue_str
+    
+    def test_templated_issue_texts(self):
+        """Test that texts are filled in from the rule's template."""
+        issue = Issue(
+            issue_type=IssueType.SPELLING,
+            severity=Severity.ERROR,
+            position=0,
+            length=7,
+            context="recieve the letter",
+            suggested_fix="receive",
+            rule_id="SPELLING",
+            params=("recieve", "receive")
+        )
+        
+        assert issue.message == "Possible spelling error: 'recieve'"
+        assert issue.learning_tip.endswith("For 'recieve', consider: receive")
+        assert not hasattr(issue, "__dict__")
+    
+    def test_templated_issue_round_trip(self):
+        """Test that a templated issue equals its rebuilt copy."""
+        issue = Issue(
+            issue_type=IssueType.STYLE,
+            severity=Severity.SUGGESTION,
+            position=12,
+            length=4,
+            context="word and word",
+            rule_id="REPEATED_WORD",
+            params=("word",)
+        )
+        
+        rebuilt = Issue.from_dict(issue.to_dict())
+        assert rebuilt == issue
+        assert rebuilt.rule_id is None
+        
+        shifted = issue.shifted(100)
+        assert shifted.position == 112
+        assert shifted.message == issue.message
+        assert issue.position == 12
+    
+    def test_unknown_rule_id(self):
+        """Test that an issue without texts needs a known rule ID."""
+        with pytest.raises(ValueError):
+            Issue(IssueType.STYLE, Severity.SUGGESTION, 0, 1, rule_id="NO_SUCH_RULE")
+    
+    def test_lazy_context(self):
+        """Test that the context is built from the source when read."""
+        text = "The quick brown fox jumpd over the lazy dog."
+        issue = Issue(
+            issue_type=IssueType.SPELLING,
+            severity=Severity.ERROR,
+            position=20,
+            length=5,
+            message="Spelling error",
+            explanation="Word misspelled",
+            learning_tip="Check spelling",
+            source=text,
+            window=10
+        )
+        
+        assert issue.context == "brown fox >>>jumpd<<< over the"
+        assert issue.context == get_context(text, 20, 5, 10)
+        assert issue.to_dict()["context"] == issue.context
+    
+    def test_shifted_lazy_context(self):
+        """Test that moving an issue keeps the context of its own text."""
+        issue = Issue(
+            IssueType.STYLE, Severity.SUGGESTION, 4, 4,
+            rule_id="REPEATED_WORD", params=("word",), source="One word here."
+        )
+        
+        shifted = issue.shifted(1000)
+        assert shifted.position == 1004
+        assert shifted.context == "One >>>word<<< here."
+        assert shifted.context == issue.context
+
+
+class TestIssueTable:
+    """Test cases for IssueTable."""
+    
+    TEXT = "Ths is very very bad."
+    
+    @pytest.fixture
+    def issues(self):
+        return [
+            Issue(IssueType.SPELLING, Severity.ERROR, 0, 3, source=self.TEXT,
+                  suggested_fix="This", rule_id="SPELLING", params=("Ths", "This")),
+            Issue(IssueType.WORD_CHOICE, Severity.SUGGESTION, 7, 4, source=self.TEXT,
+                  rule_id="WEAK_WORD", params=("very",)),
+            Issue(IssueType.WORD_CHOICE, Severity.SUGGESTION, 12, 4, source=self.TEXT,
+                  rule_id="WEAK_WORD", params=("very",)),
+            Issue(IssueType.GRAMMAR, Severity.WARNING, 17, 3, "Message",
+                  "Explanation", "Tip", context="Context"),
+        ]
+    
+    def test_round_trip(self, issues):
+        """Test that rows convert back to equal issues."""
+        table = IssueTable(issues, source=self.TEXT)
+        
+        assert len(table) == 4
+        assert table.to_issues() == issues
+        assert table[-1] == issues[-1]
+        assert table.rule_code.tolist() == [0, 1, 1, -1]
+    
+    def test_summaries(self, issues):
+        """Test the vectorized counts and histograms."""
+        table = IssueTable(issues, source=self.TEXT)
+        
+        assert table.summary() == {
+            "total_issues": 4,
+            "by_type": {"Spelling": 1, "Word Choice": 2, "Grammar": 1},
+            "by_severity": {"Error": 1, "Suggestion": 2, "Warning": 1}
+        }
+        assert table.histogram(10).tolist() == [2, 2]
+        assert table.histogram(10, by="severity").tolist() == [[1, 0], [0, 1], [1, 1]]
+        assert len(table.filter(severity=Severity.SUGGESTION)) == 2
+    
+    def test_concat(self, issues):
+        """Test joining the tables of several texts."""
+        first = IssueTable(issues[:2], source=self.TEXT)
+        second = IssueTable(issues[2:], source=self.TEXT)
+        
+        table = IssueTable.concat([first, IssueTable(), second])
+        
+        assert table.document.tolist() == [0, 0, 2, 2]
+        assert table.rule_ids == ["SPELLING", "WEAK_WORD"]
+        assert table.to_issues() == issues
+        assert table.to_numpy()["position"] is table.position
+
+
+class TestIssueIndex:
+    """Test cases for merge_issues and IssueIndex."""
+    
+    def make(self, issue_type, position, length, severity=Severity.WARNING):
+        return Issue(issue_type, severity, position, length, "Message", "Explanation", "Tip")
+    
+    def test_merge_keeps_preferred_type(self):
+        """Test that issues with the same span collapse by type precedence."""
+        grammar = self.make(IssueType.GRAMMAR, 4, 5, Severity.ERROR)
+        spelling = self.make(IssueType.SPELLING, 4, 5, Severity.ERROR)
+        style = self.make(IssueType.STYLE, 0, 30)
+        weak = self.make(IssueType.WORD_CHOICE, 4, 5, Severity.SUGGESTION)
+        
+        merged = merge_issues([grammar, spelling, style, weak])
+        
+        assert merged == [style, spelling]
+        assert merged[1] is spelling
+    
+    def test_merge_prefers_severity_within_type(self):
+        """Test that the more severe of two same-type issues is kept."""
+        warning = self.make(IssueType.GRAMMAR, 2, 3, Severity.WARNING)
+        error = self.make(IssueType.GRAMMAR, 2, 3, Severity.ERROR)
+        
+        assert merge_issues([warning, error])[0] is error
+    
+    def test_in_range_matches_scan(self):
+        """Test range queries against a linear scan."""
+        issues = [
+            self.make(IssueType.STYLE, (i * 37) % 200, (i * 13) % 25)
+            for i in range(150)
+        ]
+        index = IssueIndex(issues)
+        
+        for start, end in [(0, 1), (10, 40), (95, 96), (150, 400), (199, 250)]:
+            expected = [
+                issue for issue in sorted(issues, key=lambda x: x.position)
+                if issue.position < end and issue.position + max(issue.length, 1) > start
+            ]
+            assert [id(i) for i in index.in_range(start, end)] == [id(i) for i in expected]
+        assert index.in_range(30, 30) == []
+    
+    def test_overlapping_and_at(self):
+        """Test finding nested spans and issues covering a character."""
+        sentence = self.make(IssueType.CLARITY, 0, 60)
+        passive = self.make(IssueType.STYLE, 10, 12)
+        point = self.make(IssueType.PUNCTUATION, 40, 0)
+        index = IssueIndex([passive, sentence, point])
+        
+        assert index.overlapping(passive) == [sentence]
+        assert index.at(40) == [sentence, point]
+        assert index.in_range(60, 100) == []
+        assert list(index) == [sentence, passive, point]
@@ -0,0 +1,69 @@
+# WARNING: template code, may need edits
+"""Tests for stage profiling."""
+
+import threading
+from src.profiling import Profiler, format_timings, stage
+
+
+class TestProfiler:
+    """Test cases for Profiler and stage."""
+    
+    def test_stage_without_profiler(self):
+        """Test that stages are no-ops outside an active profiler."""
+        with stage("parse"):
+            pass
+        
+        profiler = Profiler()
+        with stage("parse"):
+            pass
+        assert profiler.timings() == {}
+    
+    def test_records_stages_and_calls(self):
+        """Test that nested and repeated stages are counted."""
+        events = []
+        profiler = Profiler(hooks=[lambda name, seconds: events.append(name)])
+        
+        with profiler.activate():
+            with stage("style"):
+                with stage("style.weak_words"):
+                    pass
+                with stage("style.weak_words"):
+                    pass
+        timings = profiler.finish()
+        
+        assert list(timings) == ["total", "style.weak_words", "style"]
+        assert timings["style.weak_words"]["calls"] == 2
+        assert timings["total"]["seconds"] >= timings["style"]["seconds"]
+        assert events == ["style.weak_words", "style.weak_words", "style", "total"]
+    
+    def test_other_threads_need_a_context_copy(self):
+        """Test that plain threads do not record to the caller's profiler."""
+        profiler = Profiler()
+        
+        def work():
+            with stage("grammar"):
+                pass
+        
+        with profiler.activate():
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        
+        assert profiler.timings() == {}
+    
+    def test_format_timings(self):
+        """Test that parts are listed under their stage."""
+        timings = {
+            "total": {"seconds": 2.0, "calls": 1},
+            "spelling.candidates": {"seconds": 0.5, "calls": 4},
+            "parse": {"seconds": 0.5, "calls": 1},
+            "spelling": {"seconds": 1.0, "calls": 1},
+        }
+        
+        lines = format_timings(timings)
+        
+        assert [line.split()[0] for line in lines[1:]] == [
+            "total", "spelling", "candidates", "parse"
+        ]
+        assert lines[3].startswith("  candidates")
+        assert lines[2].endswith("50.0%")
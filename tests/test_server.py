@@ -0,0 +1,80 @@
+# WARNING: template code, may need edits
+"""Tests for the analysis daemon and its client."""
+
+import socket
+import threading
+import pytest
+from src.checker import ParagraphChecker
+from src.server import (
+    AnalysisServer, SettingsMismatchError, request_analysis, results_from_output
+)
+from src.models.issue import IssueType
+
+
+def _free_address():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{s.getsockname()[1]}"
+
+
+class TestAnalysisServer:
+    """Test cases for the daemon and client."""
+    
+    @pytest.fixture
+    def address(self):
+        address = _free_address()
+        checker = ParagraphChecker(analyzers=["spelling", "readability"])
+        server = AnalysisServer(address, checker)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield address
+        server.shutdown()
+        server.server_close()
+    
+    def test_no_daemon_returns_none(self):
+        """Test that the client reports a missing daemon with None."""
+        assert request_analysis("Some text.", _free_address()) is None
+    
+    def test_round_trip(self, address):
+        """Test that daemon output uses the save_to_file schema."""
+        text = "This sentance has a speling error."
+        output = request_analysis(text, address)
+        
+        assert output['original_text'] == text
+        assert output['summary']['total_issues'] == 2
+        assert set(output) == {'original_text', 'statistics', 'summary', 'issues'}
+        
+        results = results_from_output(output)
+        assert all(i.issue_type == IssueType.SPELLING for i in results['issues'])
+    
+    def test_analyzer_selection(self, address):
+        """Test that a request can narrow the analyzers."""
+        output = request_analysis("A speling error.", address, ["readability"])
+        assert output['issues'] == []
+        assert output['statistics']['word_count'] == 3
+    
+    def test_deadline(self, address):
+        """Test that a request's deadline reaches the checker."""
+        output = request_analysis("A speling error.", address, deadline=0)
+        assert output['issues'] == []
+        assert output['summary']['skipped_analyzers'] == ["readability", "spelling"]
+    
+    def test_matching_settings(self, address):
+        """Test that a request with the daemon's settings is analyzed."""
+        fingerprint = ParagraphChecker().fingerprint
+        output = request_analysis("A speling error.", address, fingerprint=fingerprint)
+        assert output['summary']['total_issues'] == 1
+    
+    def test_other_settings_are_refused(self, address):
+        """Test that settings the daemon was not started with are refused."""
+        fingerprint = ParagraphChecker(pipeline="senter", extra_indices=True).fingerprint
+        with pytest.raises(SettingsMismatchError, match="pipeline=senter"):
+            request_analysis("A speling error.", address, fingerprint=fingerprint)
+    
+    def test_unresponsive_daemon_returns_none(self):
+        """Test that a daemon that does not answer in time counts as missing."""
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            address = f"127.0.0.1:{listener.getsockname()[1]}"
+            assert request_analysis("Some text.", address, timeout=0.2) is None
@@ -0,0 +1,104 @@
+# WARNING: template code, may need edits
+"""Tests for incremental document sessions."""
+
+import pytest
+import spacy
+from src.checker import ParagraphChecker
+from src.session import DocumentSession
+from src.segmentation import split_paragraphs
+
+
+class TestSplitParagraphs:
+    """Test cases for split_paragraphs."""
+    
+    def test_offsets_point_into_text(self):
+        """Test that each paragraph starts at its reported offset."""
+        text = "  First line.\nSame paragraph.\n\n \n  Second.  \n\nThird"
+        paragraphs = split_paragraphs(text)
+        
+        assert [p for _, p in paragraphs] == [
+            "First line.\nSame paragraph.", "Second.", "Third"
+        ]
+        for offset, paragraph in paragraphs:
+            assert text[offset:offset + len(paragraph)] == paragraph
+
+
+class TestDocumentSession:
+    """Test cases for DocumentSession."""
+    
+    @pytest.fixture
+    def checker(self):
+        return ParagraphChecker(analyzers=["spelling", "readability"])
+    
+    def test_only_edited_paragraph_is_reanalyzed(self, checker):
+        """Test that unchanged paragraphs reuse their results."""
+        session = DocumentSession(
+            checker, "The frist paragraph.\n\nThe secnd paragraph.\n\nThe third one."
+        )
+        assert session.last_update == {"paragraphs": 3, "reanalyzed": 3}
+        
+        session.update(
+            "The frist paragraph, now longer.\n\nThe secnd paragraph.\n\nThe third one."
+        )
+        assert session.last_update == {"paragraphs": 3, "reanalyzed": 1}
+    
+    def test_positions_are_shifted(self, checker):
+        """Test that issue positions follow their paragraph after an edit."""
+        session = DocumentSession(checker, "Intro.\n\nA secnd paragraph.")
+        text = "A much longer introduction.\n\nA secnd paragraph."
+        results = session.update(text)
+        
+        positions = [issue.position for issue in results['issues']]
+        assert positions == [text.index("secnd")]
+        assert results['issues'][0].message == "Possible spelling error: 'secnd'"
+    
+    def test_statistics_cover_whole_document(self, checker):
+        """Test that readability counts are summed over paragraphs."""
+        text = "The first paragraph is here.\n\nThe second paragraph is here too."
+        results = DocumentSession(checker, text).results()
+        
+        assert results['statistics']['word_count'] == 11
+        assert results['statistics']['sentence_count'] == 2
+        assert results['statistics']['character_count'] == len(text)
+    
+    def test_difficult_words_counted_once(self, checker):
+        """Test that a difficult word in several paragraphs counts once."""
+        text = "The committee met.\n\nThe committee agreed."
+        results = DocumentSession(checker, text).results()
+        
+        assert results['statistics']['difficult_words'] == 1
+    
+    @pytest.fixture
+    def style_checker(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        checker = ParagraphChecker(analyzers=["style"])
+        checker._nlp = nlp
+        return checker
+    
+    def test_repeats_across_paragraphs(self, style_checker):
+        """Test that repeats across a paragraph boundary match analyze()."""
+        text = "Gardens need rain.\n\nRain helps gardens grow.\n\nSunlight matters too."
+        results = DocumentSession(style_checker, text).results()
+        expected = style_checker.analyze(text)
+        
+        positions = [issue.position for issue in results['issues']]
+        assert positions == [issue.position for issue in expected['issues']]
+        assert positions == [text.index("Rain"), text.index("gardens grow")]
+        assert results['summary'] == expected['summary']
+    
+    def test_repeats_across_an_edited_boundary(self, style_checker):
+        """Test that an edit next to a boundary updates its repeats."""
+        session = DocumentSession(style_checker, "Gardens need rain.\n\nRain helps.")
+        text = "Gardens need sun.\n\nRain helps."
+        results = session.update(text)
+        
+        assert results['issues'] == []
+        assert session.last_update == {"paragraphs": 2, "reanalyzed": 1}
+    
+    def test_repeats_two_paragraphs_apart_are_not_reported(self, style_checker):
+        """Test the documented difference from analyze() for distant repeats."""
+        text = "Gardens need rain.\n\nYes.\n\nRain helps."
+        
+        assert DocumentSession(style_checker, text).results()['issues'] == []
+        assert len(style_checker.analyze(text)['issues']) == 1
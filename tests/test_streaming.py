@@ -0,0 +1,89 @@
+# WARNING: template code, may need edits
+"""Tests for streaming analysis."""
+
+import io
+import pytest
+from src.checker import ParagraphChecker
+from src.segmentation import iter_chunks, read_lines
+from src.streaming import StreamAnalysis
+
+
+class TestIterChunks:
+    """Test cases for iter_chunks."""
+    
+    def test_chunks_cover_input_exactly(self):
+        """Test that chunk offsets point into the concatenated input."""
+        text = "aaaaa\nbb\n\ncccccccc\n\n" + "d" * 30 + "\n" + "e" * 30 + "\nf\n"
+        chunks = list(iter_chunks(io.StringIO(text), max_chars=10))
+        
+        assert "".join(chunk for _, chunk in chunks) == text
+        for offset, chunk in chunks:
+            assert text[offset:offset + len(chunk)] == chunk
+    
+    def test_chunks_end_at_paragraph_breaks(self):
+        """Test that paragraphs are kept together when they fit."""
+        text = "One line.\nStill one.\n\nTwo.\n"
+        chunks = list(iter_chunks(io.StringIO(text), max_chars=12))
+        assert [chunk for _, chunk in chunks] == ["One line.\nStill one.\n\n", "Two.\n"]
+    
+    def test_line_without_breaks_is_cut_at_whitespace(self):
+        """Test that a newline-free input is split between words."""
+        text = " ".join(f"word{i}" for i in range(2000))
+        chunks = list(iter_chunks(io.StringIO(text), max_chars=100))
+        
+        assert len(chunks) > 1
+        assert "".join(chunk for _, chunk in chunks) == text
+        for offset, chunk in chunks:
+            assert len(chunk) <= 200
+            assert text[offset:offset + len(chunk)] == chunk
+            assert chunk.endswith(" ") or offset + len(chunk) == len(text)
+    
+    def test_read_lines_bounds_line_length(self):
+        """Test that read_lines returns long lines in pieces."""
+        text = "x" * 250 + "\nshort\n"
+        pieces = list(read_lines(io.StringIO(text), max_chars=100))
+        
+        assert "".join(pieces) == text
+        assert max(len(piece) for piece in pieces) == 100
+        
+        chunks = list(iter_chunks(read_lines(io.StringIO(text), 50), max_chars=50))
+        assert "".join(chunk for _, chunk in chunks) == text
+        assert all(len(chunk) <= 100 for _, chunk in chunks)
+
+
+class TestStreamAnalysis:
+    """Test cases for StreamAnalysis."""
+    
+    @pytest.fixture
+    def checker(self):
+        return ParagraphChecker(analyzers=["spelling", "readability"])
+    
+    def test_offsets_are_global(self, checker):
+        """Test that streamed issues point into the whole input."""
+        text = "The frist paragraph is here.\n\n" * 20 + "A secnd one ends it.\n"
+        analysis = StreamAnalysis(checker, max_chunk_chars=100)
+        issues = list(analysis.analyze(io.StringIO(text)))
+        
+        assert analysis.chunk_count > 1
+        assert len(issues) == 21
+        for issue in issues:
+            assert text[issue.position:issue.position + issue.length] in ("frist", "secnd")
+    
+    def test_running_totals(self, checker):
+        """Test that statistics and summary cover every chunk."""
+        text = "The first paragraph is here.\n\n" * 10
+        analysis = StreamAnalysis(checker, max_chunk_chars=50)
+        list(analysis.analyze(io.StringIO(text)))
+        
+        assert analysis.statistics['word_count'] == 50
+        assert analysis.statistics['character_count'] == len(text)
+        assert analysis.summary['total_issues'] == 0
+    
+    def test_difficult_words_counted_once(self, checker):
+        """Test that a difficult word in several chunks counts once."""
+        text = "The committee met today.\n\n" * 10
+        analysis = StreamAnalysis(checker, max_chunk_chars=50)
+        list(analysis.analyze(io.StringIO(text)))
+        
+        assert analysis.chunk_count > 1
+        assert analysis.statistics['difficult_words'] == 1